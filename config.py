@@ -22,6 +22,9 @@ except ImportError:
 # Setup logger for this module
 logger = logging.getLogger(__name__)
 
+# Tk geometry string: WIDTHxHEIGHT with optional +X+Y offsets
+_GEOMETRY_RE = re.compile(r"^(\d+)x(\d+)(?:([+-]\d+)([+-]\d+))?$")
+
 
 class Config:
     """Configuration management for Crew Manager
@@ -38,6 +41,7 @@ class Config:
         "min_window_size": "800x800",
         "column_widths": {},
         "column_visibility": {},
+        "csv_column_types": {},
         "last_directory": str(Path.home()),
         "last_file_path": "",
         "data_dir": "data",
@@ -57,6 +61,7 @@ class Config:
         "min_window_size": {"type": str, "pattern": r"^\d+x\d+$"},
         "column_widths": {"type": dict},
         "column_visibility": {"type": dict},
+        "csv_column_types": {"type": dict},
         "last_directory": {"type": str},
         "last_file_path": {"type": str},
         "data_dir": {"type": str},
@@ -192,6 +197,32 @@ class Config:
         """
         return self.config.get(key, default)
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the in-memory configuration for several reads at once.
+
+        The returned dict is the live configuration; treat it as read-only
+        and change values through set() or bulk_set().
+        """
+        return self.config
+
+    def _accepts(self, key: str, value: Any) -> bool:
+        """Check a value against the schema before it is stored."""
+        if key not in self.VALIDATION_SCHEMA:
+            logger.warning(
+                f"Attempting to set an unknown configuration key: '{key}'. This key is not validated."
+            )
+            return True
+        # Basic validation before setting (more thorough in _validate_config)
+        rules = self.VALIDATION_SCHEMA[key]
+        if not isinstance(value, rules["type"]):
+            logger.error(
+                f"Cannot set '{key}': Invalid type. Expected {rules['type']}, got {type(value)}."
+            )
+            # Or raise ConfigError("Invalid type...")
+            return False
+        # Add other quick checks from VALIDATION_SCHEMA if desired before full save/validate cycle
+        return True
+
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value and save the configuration.
 
@@ -199,20 +230,8 @@ class Config:
             key: The configuration key.
             value: The value to set.
         """
-        if key not in self.VALIDATION_SCHEMA:
-            logger.warning(
-                f"Attempting to set an unknown configuration key: '{key}'. This key is not validated."
-            )
-        else:
-            # Basic validation before setting (more thorough in _validate_config)
-            rules = self.VALIDATION_SCHEMA[key]
-            if not isinstance(value, rules["type"]):
-                logger.error(
-                    f"Cannot set '{key}': Invalid type. Expected {rules['type']}, got {type(value)}."
-                )
-                # Or raise ConfigError("Invalid type...")
-                return
-            # Add other quick checks from VALIDATION_SCHEMA if desired before full save/validate cycle
+        if not self._accepts(key, value):
+            return
 
         self.config[key] = value
         self.save_config()  # Save after every set operation
@@ -220,6 +239,24 @@ class Config:
         # For simplicity, we are not re-validating the entire config on each set here,
         # but it might be safer in complex scenarios.
 
+    def bulk_set(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values and save the file once.
+
+        Args:
+            values: Mapping of configuration keys to new values. Values that
+                fail validation are skipped, as with set(). If every value
+                matches what is already stored, the file is not written.
+        """
+        changed = False
+        for key, value in values.items():
+            if key in self.config and self.config[key] == value:
+                continue  # Unchanged; nothing to write for this key
+            if self._accepts(key, value):
+                self.config[key] = value
+                changed = True
+        if changed:
+            self.save_config()
+
     def reset_to_defaults(self) -> None:
         """Reset the configuration to default values and save."""
         self.config = self.DEFAULT_CONFIG.copy()
@@ -228,22 +265,19 @@ class Config:
 
     def get_window_geometry(self) -> Optional[tuple[int, int, int, int]]:
         """Parse window_size and return as (width, height, x_offset, y_offset).
-           x_offset and y_offset are not in current config, returning 0,0 for them.
+           Offsets default to 0,0 when the stored value has none.
         """
         size_str = self.get("window_size")
-        if size_str and isinstance(size_str, str) and "x" in size_str:
-            try:
-                width, height = map(int, size_str.split("x"))
-                # Assuming x_offset and y_offset are not stored, default to 0
-                # If they were stored, they'd be fetched similarly, e.g., self.get("window_position", "0,0").split(',')
-                return width, height, 0, 0
-            except ValueError:
-                logger.error(
-                    f"Invalid window_size format: '{size_str}'. Expected 'WIDTHxHEIGHT'."
-                )
-                return None
-        return None
-
+        if not isinstance(size_str, str) or not size_str:
+            return None
+        match = _GEOMETRY_RE.match(size_str)
+        if match is None:
+            logger.error(
+                f"Invalid window_size format: '{size_str}'. Expected 'WIDTHxHEIGHT'."
+            )
+            return None
+        width, height, x_offset, y_offset = match.groups(default="0")
+        return int(width), int(height), int(x_offset), int(y_offset)
 
 # Example usage (optional, for testing or direct script run)
 if __name__ == "__main__":
@@ -2,9 +2,13 @@
 # --- Standard Library Imports ---
 import csv  # CSV file handling
 import importlib.util  # For dynamic imports
+import itertools  # Worker task sequence numbers
+import hashlib  # Workspace signatures for the auto-import cache
 import json  # JSON file handling
 import logging  # Application logging
 import os  # Operating system interface
+import pickle  # Auto-import cache file
+import re  # Regular expressions
 import shutil  # File operations
 import subprocess  # Process execution
 import sys  # System parameters
@@ -15,72 +19,126 @@ from tkinter import filedialog, messagebox, ttk  # GUI dialogs and widgets
 import tkinter.font as tkfont  # Font handling
 from pathlib import Path  # File handling
 import glob  # File pattern matching
-from queue import Queue  # Thread-safe queue
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict, deque  # Skip tallies; filter LRU; task queue
+from concurrent.futures import ThreadPoolExecutor  # Parallel auto-import prescreen
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from config import Config  # Configuration management
-from database_manager import DatabaseManager  # Data persistence
 
 from message_router import CrewMessageRouter  # Message routing
+from tts_manager import (  # Speech text rules shared with TTSManager
+    _SPEECH_ABBREV_RE,
+    _SPEECH_REPLACEMENTS,
+    _WHITESPACE_RE,
+)
 
 
 # --- Tooltip Helper ---
   
 class ToolTip:
-    """Create a tooltip for a given widget."""
+    """Create a tooltip for a given widget.
+
+    The tooltip window is built on the first hover, then hidden and shown
+    again on later hovers instead of being destroyed and recreated.
+    """
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
         self.tipwindow = None
+        self.label = None
+        self.visible = False
         self.widget.bind("<Enter>", self.show_tip)
         self.widget.bind("<Leave>", self.hide_tip)
 
     def show_tip(self, event=None):
-        if self.tipwindow or not self.text:
+        if self.visible or not self.text:
             return
         x, y, cx, cy = self.widget.bbox("insert") if hasattr(self.widget, "bbox") else (0, 0, 0, 0)
         x = x + self.widget.winfo_rootx() + 25
         y = y + self.widget.winfo_rooty() + 20
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                         font=("tahoma", "9", "normal"))
-        label.pack(ipadx=4, ipady=2)
+        if self.tipwindow is None:
+            self.tipwindow = tw = tk.Toplevel(self.widget)
+            tw.wm_overrideredirect(True)
+            self.label = tk.Label(tw, justify=tk.LEFT,
+                                  background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                  font=("tahoma", "9", "normal"))
+            self.label.pack(ipadx=4, ipady=2)
+        self.label.configure(text=self.text)
+        self.tipwindow.wm_geometry(f"+{x}+{y}")
+        self.tipwindow.deiconify()
+        self.visible = True
 
     def hide_tip(self, event=None):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
+        if self.visible:
+            self.visible = False
+            self.tipwindow.withdraw()
+
 
 
 
+def _lazy_import(name: str) -> Optional[Any]:
+    """Return module name, or None if it is not installed.
+
+    The module is registered in sys.modules straight away, but its body only
+    runs when one of its attributes is first accessed, so optional heavy
+    libraries cost nothing until they are actually used.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
-# Optional: pandas for data handling
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+
+_LAZY_IMPORT_LOCK = threading.Lock()
+
+
+def _finish_lazy_imports(*modules: Optional[Any]) -> None:
+    """Run the bodies of lazily imported modules, one thread at a time.
+
+    LazyLoader before Python 3.12 is not thread-safe: a second thread touching
+    a module while its body runs sees it half-initialised. Background code
+    calls this before using numpy or pandas, which may not be loaded yet.
+    """
+    with _LAZY_IMPORT_LOCK:
+        for module in modules:
+            if module is not None:
+                module.__name__  # Any attribute access runs the module body
+
+
+# Optional: pandas for data handling, loaded on first use
+np = _lazy_import("numpy")
+pd = _lazy_import("pandas")
+PANDAS_AVAILABLE = np is not None and pd is not None
+if not PANDAS_AVAILABLE:
     print("Warning: pandas not available. Some data import/export features may be limited.")
 
-# Optional: CustomTkinter for modern styling
-try:
-    import customtkinter as ctk
-    CTK_AVAILABLE = True
-    ctk.set_appearance_mode("system")
-    ctk.set_default_color_theme("blue")
-except ImportError:
-    CTK_AVAILABLE = False
+# Optional: pyarrow, used by pandas as a multi-threaded CSV parser. Only
+# checked for here; pandas imports it on first use.
+ARROW_AVAILABLE = PANDAS_AVAILABLE and importlib.util.find_spec("pyarrow") is not None
+
+# Optional: CustomTkinter for modern styling, loaded on first use. No
+# CustomTkinter widgets are built here, so its global appearance settings
+# are left at their defaults rather than forcing the import at startup.
+ctk = _lazy_import("customtkinter")
+CTK_AVAILABLE = ctk is not None
+if not CTK_AVAILABLE:
     print("CustomTkinter not available. Using standard tkinter styling.")
 
 
 # TTS functionality: auto-install pyttsx3 if missing, show GUI error if it fails
-try:
-    import pyttsx3  # Text-to-speech engine
-    TTS_AVAILABLE = True
-except ImportError:
+pyttsx3 = _lazy_import("pyttsx3")  # Text-to-speech engine, loaded on first use
+TTS_AVAILABLE = pyttsx3 is not None
+if not TTS_AVAILABLE:
     # Try to auto-install pyttsx3
     try:
         print("pyttsx3 library is not installed. Installing it now...")
@@ -106,6 +164,15 @@ except ImportError:
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+def __getattr__(name: str) -> Any:
+    """Resolve heavy optional attributes of this module on first access (PEP 562)."""
+    if name == "DatabaseManager":
+        from database_manager import DatabaseManager
+        globals()[name] = DatabaseManager
+        return DatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 DEFAULT_MAIN_WINDOW_WIDTH = 800
 DEFAULT_MAIN_WINDOW_HEIGHT = 800
 DEFAULT_MAIN_WINDOW_SIZE = (
@@ -113,223 +180,486 @@ DEFAULT_MAIN_WINDOW_SIZE = (
 )
 
   
+# Auto-import exclusions, built once at import time rather than per scan
+_SKIP_FILES = frozenset({
+    "gui.py",
+    "setup.py",
+    "__init__.py",
+    "output.txt.py",
+    "globals.py",
+    "Crew.py",#
+    "test_script_demo.py",
+    "test_auto_import.py",
+    "config.py",  # Configuration files may have side effects
+    "settings.py",  # Settings files may have side effects
+    "enhanced_features.py",
+    "conftest.py",  # Pytest configuration
+})
+
+# Substrings of file names to skip
+_SKIP_PATTERNS = (
+    ".txt.py",
+    "main.py",
+    "run.py",
+    "test_",
+    "_test",
+    "demo",
+    "example",
+    "sample",
+    "prototype",
+    "backup",
+    "old",
+    "temp",
+    "tmp",
+    "_backup",
+)
+
+# The same substrings, plus test-file markers, as one regex so each file
+# name is checked with a single search
+_SKIP_NAME_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in _SKIP_PATTERNS + ("unittest",))
+)
+
+# Path separators become package dots; spaces and punctuation become underscores
+_MODULE_NAME_TABLE = str.maketrans({
+    "/": ".", "\\": ".", " ": "_", ",": "_", "-": "_", "+": "_",
+})
+
+# Enhanced directory exclusions
+_SKIP_DIRS = frozenset({
+    "__pycache__",
+    ".git",
+    "venv",
+    "env",
+    "tests",
+    "test",
+    "tts_venv",  # Legacy TTS environment (removed, kept for compatibility)
+    ".venv",  # Primary virtual environment
+    "node_modules",  # Node.js modules
+    "build",  # Build directories
+    "dist",  # Distribution directories
+    ".pytest_cache",  # Pytest cache
+    ".mypy_cache",  # MyPy cache
+    "site-packages",  # Python site packages
+    "lib",  # Library directories
+    "bin",  # Binary directories
+    "include",  # Include directories
+    "share",  # Share directories
+})
+
+# Roots of the running interpreter, any active virtual environment and the
+# user site directory, with a trailing separator for prefix checks
+_ENV_PREFIXES = tuple(
+    os.path.join(os.path.realpath(prefix), "")
+    for prefix in {
+        sys.prefix,
+        sys.base_prefix,
+        os.environ.get("VIRTUAL_ENV", ""),
+        os.path.expanduser("~/.local"),
+    }
+    if prefix
+)
+
+# Source snippets that mark a file as a script rather than an importable module
+_DANGEROUS_PATTERNS = (
+    'if __name__ == "__main__"',
+    "subprocess.call",
+    "subprocess.run",
+    "sys.argv",
+    "argparse",
+    "main()",
+    "logging.basicconfig",
+    "speak(",
+    "sys.exit",
+    "os.system",
+    "plt.show",
+    "plt.plot",
+)
+
+# The same markers as one case-insensitive bytes regex, so a file head is
+# checked with a single scan instead of one substring test per pattern
+_DANGEROUS_RE = re.compile(
+    b"|".join(re.escape(pattern.encode()) for pattern in _DANGEROUS_PATTERNS),
+    re.IGNORECASE,
+)
+# A print() alongside one of these words suggests import-time side effects
+_PRINT_RE = re.compile(rb"print\(", re.IGNORECASE)
+_SIDE_EFFECT_RE = re.compile(rb"loaded|starting|running", re.IGNORECASE)
+_HEAD_SCAN_BYTES = 4096  # Enough for the first 20 lines of nearly any file
+_PRESCREEN_POOL_MIN = 16  # Below this many files a thread pool costs more than it saves
+
+# File names that look like entry-point scripts
+_SCRIPT_FILE_NAMES = frozenset({"main.py", "run.py", "start.py", "launch.py"})
+
+# Joins a row's cells for all-columns filtering; not expected in cell text
+_ROW_BLOB_SEP = "\x1f"
+
+# Tcl lambda inserting a flat list of item id / values pairs into a Treeview
+_TREE_INSERT_BATCH = (
+    "{w pos items} {foreach {id values} $items {$w insert {} $pos -id $id -values $values}}"
+)
+
+# Same, for labelled items: a flat list of item id / text / values triples
+_TREE_INSERT_TEXT_BATCH = (
+    "{w items} {foreach {id text values} $items {$w insert {} end -id $id -text $text -values $values}}"
+)
+
+# Tcl lambda giving row 0 and column 0 of each container all spare space
+_GRID_FILL_CELL = (
+    "{args} {foreach w $args {grid rowconfigure $w 0 -weight 1; grid columnconfigure $w 0 -weight 1}}"
+)
+
+# Tcl lambda deleting every top-level item without listing them in Python
+_TREE_CLEAR = "{w} {$w delete [$w children {}]}"
+
+# Tcl lambda replacing a Text widget's contents and clearing its modified flag
+_TEXT_REPLACE = "{w text} {$w replace 1.0 end $text; $w edit modified 0}"
+
+# Tcl lambda reading the widths of several Treeview columns in one call
+_TREE_COLUMN_WIDTHS = "{w cols} {lmap c $cols {$w column $c -width}}"
+
+# Loaded columns with few distinct strings share one object per value
+_POOL_SAMPLE_ROWS = 1000  # Rows sampled to judge a column's cardinality
+_POOL_MAX_RATIO = 0.1  # Pool a column when under this share of sampled values is distinct
+
+
+def _share_repeated_values(rows: List[List[Any]]) -> None:
+    """Make equal strings in low-cardinality columns share a single object.
+
+    Readers return a new str for every cell, so categorical columns such as
+    a role or rank hold thousands of copies of the same few values. Columns
+    are judged on a sample of rows; the rows are updated in place.
+    """
+    if len(rows) < _POOL_SAMPLE_ROWS:
+        return
+    sample = rows[:_POOL_SAMPLE_ROWS]
+    width = max(len(row) for row in sample)
+    pooled = []
+    for i in range(width):
+        values = [row[i] for row in sample if i < len(row)]
+        if all(type(value) is str for value in values) and len(set(values)) < (
+            _POOL_MAX_RATIO * len(values)
+        ):
+            pooled.append(i)
+    if not pooled:
+        return
+    pools: List[Dict[str, str]] = [{} for _ in pooled]
+    for row in rows:
+        size = len(row)
+        for pool, i in zip(pools, pooled):
+            if i < size:
+                value = row[i]
+                if type(value) is str:
+                    row[i] = pool.setdefault(value, value)
+
+
+# Last auto-import scan per workspace root, reused in-process while the
+# workspace signature it recorded still matches
+_IMPORT_SCAN_MEMO: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_import_cache(cache_file: Path, workspace_root: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached auto-import data for this workspace, if any.
+
+    The cache is a pickle written by auto_import_py_files. It lives in the
+    workspace, whose .py files are executed by the same scan, so loading
+    it trusts nothing the scan does not already trust.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cache_data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, OSError, AttributeError, ValueError) as e:
+        logging.warning(f"Error reading auto-import cache: {e}. Proceeding with fresh scan.")
+        return None
+    if not isinstance(cache_data, dict) or cache_data.get("workspace_root") != str(workspace_root):
+        return None
+    return cache_data
+
+
+def _scan_py_files(root: str) -> List[str]:
+    """Walk root for .py files without descending into excluded directories.
+
+    Excluded and hidden directories are pruned before they are opened, as
+    are Python installations and virtual environments whatever their name.
+    """
+    py_files: List[str] = []
+    # An environment that contains the workspace itself cannot be pruned
+    env_prefixes = tuple(
+        prefix for prefix in _ENV_PREFIXES if not os.path.join(root, "").startswith(prefix)
+    )
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (
+                            entry.name not in _SKIP_DIRS
+                            and not entry.name.startswith(".")
+                            and not os.path.join(entry.path, "").startswith(env_prefixes)
+                        ):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        py_files.append(entry.path)
+                except OSError:
+                    continue
+    return py_files
+
+
+def _stat_py_files(py_files: List[str]) -> Dict[str, List[int]]:
+    """Map each file that still exists to [st_mtime_ns, st_size]."""
+    stats = {}
+    for path in py_files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stats[path] = [st.st_mtime_ns, st.st_size]
+    return stats
+
+
+def _workspace_signature(stats: Dict[str, List[int]]) -> str:
+    """Digest of every candidate file's path, mtime and size.
+
+    Any added, removed or modified .py file changes the signature, so the
+    cached results can be reused for as long as it matches.
+    """
+    sig = hashlib.blake2b(digest_size=16)
+    for path in sorted(stats):
+        mtime_ns, size = stats[path]
+        sig.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8", "surrogateescape"))
+    return sig.hexdigest()
+
+
+def _bytecode_is_current(path: str, file_stat: Optional[List[int]]) -> bool:
+    """True if __pycache__ holds bytecode compiled from this version of path.
+
+    Only the 16-byte .pyc header is read: a timestamp-based .pyc records the
+    source mtime and size it was compiled from. Hash-based .pyc files and
+    headers from another Python version count as stale.
+    """
+    if file_stat is None:
+        return False
+    try:
+        with open(importlib.util.cache_from_source(path), "rb") as f:
+            header = f.read(16)
+    except (OSError, ValueError, NotImplementedError):
+        return False
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+    flags, mtime, size = (
+        int.from_bytes(header[i:i + 4], "little") for i in (4, 8, 12)
+    )
+    mtime_ns, file_size = file_stat
+    return (
+        flags == 0
+        and mtime == (mtime_ns // 1_000_000_000) & 0xFFFFFFFF
+        and size == file_size & 0xFFFFFFFF
+    )
+
+
+def _register_lazy_module(spec: Any) -> None:
+    """Add spec's module to sys.modules; its body runs on first attribute access."""
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+
+def _restore_lazy_modules(module_files: Optional[Dict[str, str]]) -> None:
+    """Re-register modules imported by a cached scan, without running them.
+
+    Only called when the workspace signature matched, so none of the files
+    changed since they were checked.
+    """
+    if not isinstance(module_files, dict):
+        return
+    for module_name, path in module_files.items():
+        if module_name in sys.modules:
+            continue
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec and spec.loader:
+                _register_lazy_module(spec)
+        except Exception as e:
+            logging.debug(f"Could not restore cached module {module_name}: {e}")
+
+
+def _prescreen_file(path: str) -> Optional[str]:
+    """Return why a module should not be imported, or None if it looks safe.
+
+    Only the start of the file is read, as bytes, and each check is a single
+    regex search. This does no importing, so it is safe to run in threads.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEAD_SCAN_BYTES)
+    except OSError:
+        return "unreadable"
+    # Only the first 20 lines count, as before
+    head = b"\n".join(head.split(b"\n", 20)[:20])
+
+    if _DANGEROUS_RE.search(head):
+        return "contains script patterns"
+    if _PRINT_RE.search(head) and _SIDE_EFFECT_RE.search(head):
+        return "has immediate side effects"
+    return None
+
+
+def _prescreen_files(paths: List[str]) -> Dict[str, Optional[str]]:
+    """Prescreen paths concurrently; reading files is I/O bound."""
+    if len(paths) < _PRESCREEN_POOL_MIN:
+        return {path: _prescreen_file(path) for path in paths}
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(_prescreen_file, paths, chunksize=16)))
+
+
 def auto_import_py_files() -> Tuple[List[str], List[Tuple[str, str]]]:
     try:
         # Get the current working directory
         workspace_root = Path.cwd()
 
         # Cache for performance - avoid re-scanning if called multiple times
-        cache_file = workspace_root / ".auto_import_cache.json"
+        cache_file = workspace_root / ".auto_import_cache.pkl"
         current_time = time.time()
 
-        # Check if we have a recent cache (less than 5 minutes old)
-        if cache_file.exists():
+        # Find all .py files in the workspace, pruning excluded directories
+        py_files = sorted(_scan_py_files(str(workspace_root)))
+        file_stats = _stat_py_files(py_files)
+        signature = _workspace_signature(file_stats)
+
+        # Reuse the last results while no candidate file changed: first from
+        # this session, then from the cache file
+        memo = _IMPORT_SCAN_MEMO.get(str(workspace_root))
+        cache_data = memo if memo is not None else _load_import_cache(cache_file, workspace_root)
+        if cache_data is not None and cache_data.get("signature") == signature:
             try:
-                cache_age = current_time - cache_file.stat().st_mtime
-                if cache_age < 300:  # 5 minutes
-                    with open(cache_file, "r") as f:
-                        cache_data = json.load(f)
-                        if cache_data.get("workspace_root") == str(workspace_root):
-                            logging.info("Using cached auto-import results")
-                            return (
-                                cache_data["imported_modules"],
-                                cache_data["failed_imports"],
-                            )
-            except (json.JSONDecodeError, KeyError, OSError) as e:  # Added exception logging
+                logging.info("Using cached auto-import results")
+                result = (
+                    list(cache_data["imported_modules"]),
+                    [tuple(entry) for entry in cache_data["failed_imports"]],
+                )
+                _restore_lazy_modules(cache_data.get("module_files"))
+                _IMPORT_SCAN_MEMO[str(workspace_root)] = cache_data
+                return result
+            except (KeyError, TypeError) as e:
                 logging.warning(f"Error reading auto-import cache: {e}. Proceeding with fresh scan.")
                 # If cache is corrupted, continue with fresh scan
-                pass
-
-        # Find all .py files in the workspace
-        py_files = []
-
-        # Use more efficient file discovery
-        for py_file in workspace_root.rglob("*.py"):
-            py_files.append(str(py_file))
-
-        # Remove duplicates and sort
-        py_files = sorted(list(set(py_files)))
 
         imported_modules = []
         failed_imports = []
-
-        # Enhanced skip patterns with more comprehensive exclusions
-        skip_files = {
-            "gui.py",
-            "setup.py",
-            "__init__.py",
-            "output.txt.py",
-            "globals.py",
-            "Crew.py",#
-            "test_script_demo.py",
-            "test_auto_import.py",
-            "config.py",  # Configuration files may have side effects
-            "settings.py",  # Settings files may have side effects
-            "enhanced_features.py",
-            "conftest.py",  # Pytest configuration
-        }
-
-        # Additional patterns to skip
-        skip_patterns = {
-            ".txt.py",
-            "main.py",
-            "run.py",
-            "test_",
-            "_test",
-            "demo",
-            "example",
-            "sample",
-            "prototype",
-            "backup",
-            "old",
-            "temp",
-            "tmp",
-            "_backup",
-        }
-
-        # Enhanced directory exclusions
-        skip_dirs = {
-            "__pycache__",
-            ".git",
-            "venv",
-            "env",
-            "tests",
-            "test",
-            "tts_venv",  # Legacy TTS environment (removed, kept for compatibility)
-            ".venv",  # Primary virtual environment
-            "node_modules",  # Node.js modules
-            "build",  # Build directories
-            "dist",  # Distribution directories
-            ".pytest_cache",  # Pytest cache
-            ".mypy_cache",  # MyPy cache
-            "site-packages",  # Python site packages
-            "lib",  # Library directories
-            "bin",  # Binary directories
-            "include",  # Include directories
-            "share",  # Share directories
-        }
-
-        # Pre-compile dangerous import patterns for better performance
-        dangerous_patterns = [
-            'if __name__ == "__main__"',
-            "subprocess.call",
-            "subprocess.run",
-            "sys.argv",
-            "argparse",
-            "main()",
-            "logging.basicconfig",
-            "speak(",
-            "sys.exit",
-            "os.system",
-            "plt.show",
-            "plt.plot",
-        ]
+        module_files: Dict[str, str] = {}  # Module name -> file, for cache hits
 
         files_processed = 0
-        files_skipped = 0
-
+        # Skipped files are tallied by reason; per-file debug lines are only
+        # formatted when debug logging is actually on
+        skip_reasons = Counter()
+        unexpected_errors: List[str] = []
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        # Files whose contents a previous scan rejected, reused while unchanged
+        cached_content_skips = cache_data.get("content_skipped") if cache_data else None
+        if not isinstance(cached_content_skips, dict):
+            cached_content_skips = {}
+        content_skipped = {}
+
+        # Filter by name first so only plausible modules are read. The walk
+        # returns root-prefixed paths, so names are sliced out of the strings
+        # rather than built from Path objects for every file.
+        root_prefix = os.path.join(str(workspace_root), "")
+        candidates = []
         for py_file in py_files:
             try:
-                py_path = Path(py_file)
-                relative_path = py_path.relative_to(workspace_root)
+                if not py_file.startswith(root_prefix):
+                    raise ValueError(f"{py_file} is not in {workspace_root}")
+                relative_path = py_file[len(root_prefix):]
+                name = relative_path.rpartition(os.sep)[2]
 
-                # Skip files in excluded directories
-                if any(skip_dir in relative_path.parts for skip_dir in skip_dirs):
-                    files_skipped += 1
+                # Skip excluded files
+                if name in _SKIP_FILES:
+                    skip_reasons["excluded file"] += 1
                     continue
 
-                # Skip excluded files
-                if py_path.name in skip_files:
-                    files_skipped += 1
+                # Skip files matching problematic patterns, and test files
+                if _SKIP_NAME_RE.search(name):
+                    skip_reasons["name pattern"] += 1
                     continue
 
-                # Skip files matching problematic patterns
-                if any(pattern in py_path.name for pattern in skip_patterns):
-                    files_skipped += 1
+                # Additional safety check: skip files that look like scripts
+                if name.lower() in _SCRIPT_FILE_NAMES:
+                    skip_reasons["script name"] += 1
                     continue
 
-                # Skip test files
-                if py_path.name.startswith("test_") or "unittest" in py_path.name:
-                    files_skipped += 1
+                # Create safe module name from path, handling files with
+                # spaces or special characters
+                module_name = relative_path[:-3].translate(_MODULE_NAME_TABLE)
+
+                candidates.append((py_file, name, relative_path, module_name))
+
+            except Exception as e:
+                failed_imports.append((str(py_file), f"Path error: {str(e)[:100]}"))
+                continue
+
+        # Enhanced safety check: read the start of every file that may need
+        # importing in parallel, skipping files unchanged since a previous
+        # scan rejected their contents
+        prescreen = _prescreen_files([
+            py_file
+            for py_file, _, _, _ in candidates
+            if py_file not in file_stats
+            or cached_content_skips.get(py_file) != file_stats[py_file]
+        ])
+
+        # Import serially and in order: executing modules mutates sys.modules
+        for py_file, name, relative_path, module_name in candidates:
+            try:
+                # Already loaded in this process, possibly by an earlier import
+                if module_name in sys.modules:
+                    imported_modules.append(f"{module_name} (cached)")
+                    files_processed += 1
                     continue
 
-                # Additional safety check: skip files that look like scripts
-                if py_path.name.lower() in {
-                    "main.py",
-                    "run.py",
-                    "start.py",
-                    "launch.py",
-                }:
-                    files_skipped += 1
+                file_stat = file_stats.get(py_file)
+                if py_file not in prescreen:
+                    # Unchanged since a previous scan rejected its contents
+                    skip_reasons["previously rejected"] += 1
+                    content_skipped[py_file] = file_stat
                     continue
 
-                # Enhanced safety check: read first chunk to detect script files
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        # Read first 20 lines for better detection
-                        first_chunk = "\n".join(f.readline().strip() for _ in range(20))
-
-                    file_content_lower = first_chunk.lower()
-
-                    # Skip files with dangerous patterns
-                    if any(
-                        pattern in file_content_lower for pattern in dangerous_patterns
-                    ):
-                        files_skipped += 1
-                        logging.debug(
-                            f"Skipping {py_path.name} - contains script patterns"
-                        )
-                        continue
-
-                    # Skip files with immediate side effects
-                    if "print(" in file_content_lower and any(
-                        keyword in file_content_lower
-                        for keyword in ["loaded", "starting", "running"]
-                    ):
-                        files_skipped += 1
-                        logging.debug(
-                            f"Skipping {py_path.name} - has immediate side effects"
-                        )
-                        continue
-
-                except (IOError, UnicodeDecodeError):
+                reason = prescreen[py_file]
+                if reason == "unreadable":
                     # If we cant read the file, skip it for safety
-                    files_skipped += 1
+                    skip_reasons[reason] += 1
+                    continue
+                if reason is not None:
+                    skip_reasons[reason] += 1
+                    content_skipped[py_file] = file_stat
+                    if debug_enabled:
+                        logging.debug(f"Skipping {name} - {reason}")
                     continue
-
-                # Create safe module name from path
-                module_name = str(relative_path.with_suffix(""))
-                module_name = module_name.replace("/", ".").replace("\\", ".")
-
-                # Handle files with spaces or special characters
-                if " " in module_name or any(
-                    char in module_name for char in (",", "-", "+")
-                ):
-                    safe_name = (
-                        module_name.replace(" ", "_")
-                        .replace(",", "_")
-                        .replace("-", "_")
-                        .replace("+", "_")
-                    )
-                    module_name = safe_name
 
                 # Try to import the module with enhanced error handling
                 try:
                     spec = importlib.util.spec_from_file_location(module_name, py_file)
                     if spec and spec.loader:
-                        # Check if module is already loaded
-                        if module_name in sys.modules:
-                            imported_modules.append(f"{module_name} (cached)")
-                            files_processed += 1
-                            continue
-
-                        # Import with timeout protection (if available)
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-
-                        # Execute module with error containment
-                        spec.loader.exec_module(module)
+                        # Compile now so syntax errors are still reported
+                        # here; this also writes the bytecode cache that the
+                        # deferred execution reads. Current bytecode already
+                        # proves the source compiles.
+                        if not _bytecode_is_current(py_file, file_stat):
+                            spec.loader.get_code(module_name)
+
+                        _register_lazy_module(spec)
                         imported_modules.append(module_name)
+                        module_files[module_name] = py_file
                         files_processed += 1
 
                 except (
@@ -340,15 +670,15 @@ def auto_import_py_files() -> Tuple[List[str], List[Tuple[str, str]]]:
                 ) as e:
                     # These are expected for some files
                     error_msg = f"Import error: {str(e)[:100]}"
-                    failed_imports.append((str(relative_path), error_msg))
+                    failed_imports.append((relative_path, error_msg))
                     files_processed += 1
                     continue
 
                 except Exception as e:
-                    # Unexpected errors
+                    # Unexpected errors, reported together after the scan
                     error_msg = f"Unexpected error: {str(e)[:100]}"
-                    failed_imports.append((str(relative_path), error_msg))
-                    logging.warning(f"Failed to auto-import {py_file}: {e}")
+                    failed_imports.append((relative_path, error_msg))
+                    unexpected_errors.append(f"{py_file}: {e}")
                     files_processed += 1
                     continue
 
@@ -356,8 +686,14 @@ def auto_import_py_files() -> Tuple[List[str], List[Tuple[str, str]]]:
                 failed_imports.append((str(py_file), f"Path error: {str(e)[:100]}"))
                 continue
 
-        # Log comprehensive results
+        # Log comprehensive results, once per scan rather than per file
+        files_skipped = sum(skip_reasons.values())
         total_files = files_processed + files_skipped
+        if unexpected_errors:
+            logging.warning(
+                f"Failed to auto-import {len(unexpected_errors)} files: "
+                + "; ".join(unexpected_errors)
+            )
         if imported_modules:
             logging.info(f"Auto-imported {len(imported_modules)} modules successfully")
 
@@ -371,17 +707,27 @@ def auto_import_py_files() -> Tuple[List[str], List[Tuple[str, str]]]:
             f"{len(failed_imports)} failed, {files_skipped} skipped, "
             f"{total_files} total files processed"
         )
+        if skip_reasons:
+            logging.info(f"Auto-import skip reasons: {dict(skip_reasons)}")
 
-        # Cache the results for future use
+        # Cache the results for future use, keyed by the workspace signature.
+        # Written to a temporary file and renamed so a crash never leaves a
+        # half-written cache behind.
         try:
             cache_data = {
                 "workspace_root": str(workspace_root),
                 "imported_modules": imported_modules,
                 "failed_imports": failed_imports,
                 "timestamp": current_time,
+                "signature": signature,
+                "content_skipped": content_skipped,
+                "module_files": module_files,
             }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+            _IMPORT_SCAN_MEMO[str(workspace_root)] = cache_data
         except Exception as cache_error:
             logging.debug(f"Could not cache auto-import results: {cache_error}")
 
@@ -393,6 +739,19 @@ def auto_import_py_files() -> Tuple[List[str], List[Tuple[str, str]]]:
 
 
 class CrewGUI:
+    FILTER_CACHE_SIZE = 32  # Filter results kept by _match_indices
+    FILTER_CACHE_MAX_INDICES = 1_000_000  # Row indices held across all cached results
+    FILTER_VECTOR_MIN = 2048  # Cached matches refined in NumPy from this many on
+    VIRTUAL_TABLE_THRESHOLD = 2000  # Larger views only render a window of rows
+    TABLE_WINDOW_ROWS = 200  # Rows kept in the Treeview for a virtual view
+    TABLE_WINDOW_MARGIN = 50  # Shift the window when the view gets this close to its edge
+    TABLE_SCROLL_SETTLE_MS = 30  # Render a dragged-to window once the drag pauses this long
+    DETAILS_THROTTLE_MS = 80  # Minimum gap between details rebuilds while selection races ahead
+    CSV_CHUNK_ROWS = 4096  # Rows per pandas chunk on hinted CSV loads
+    CSV_TYPE_HINTS_MAX = 32  # Files whose column dtypes are remembered
+    STATUS_TOOLTIP_DELAY_MS = 300  # Hover time before the status tooltip appears
+    BACKGROUND_POOL_WORKERS = 4  # Threads for parallel background tasks such as file loads
+
     def change_username_dialog(self):
         if not hasattr(self, "logged_in_user"):
             self.logged_in_user = {"name": "User"}
@@ -413,7 +772,7 @@ class CrewGUI:
                 if hasattr(self, "login_status") and getattr(self, "login_status"):
                     self.login_status.config(text=f"Chatting as {new_name}", fg="#228B22")
                 if hasattr(self, "status_var") and getattr(self, "status_var"):
-                    self.status_var.set(f"Username changed to {new_name}")
+                    self.update_status(f"Username changed to {new_name}")
                 dialog.destroy()
         tk.Button(dialog, text="OK", command=set_username).pack(pady=8)
         entry.focus_set()
@@ -434,7 +793,7 @@ class CrewGUI:
             msg = entry.get().strip()
             self.user_status["msg"] = msg
             if hasattr(self, "status_var") and getattr(self, "status_var"):
-                self.status_var.set(f"Status: {msg}" if msg else "Status cleared.")
+                self.update_status(f"Status: {msg}" if msg else "Status cleared.")
             dialog.destroy()
         tk.Button(dialog, text="OK", command=set_status).pack(pady=8)
         entry.focus_set()
@@ -443,9 +802,8 @@ class CrewGUI:
     def _read_widget_text(self, widget):
         """Stub for test compliance."""
         text = getattr(widget, "get", lambda: "")()
-        if hasattr(self, "tts_engine") and self.tts_engine:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+        if self.tts_available:
+            self._speak(text)
         return text
     
     def _read_status(self):
@@ -498,22 +856,21 @@ class CrewGUI:
         try:
             self.root = root  # Assign self.root immediately
             self.root.title("Crew Manager")  # Set title early
+            # Configure logging first so TTS, script folder and auto-import
+            # messages during startup are not lost
+            self.setup_logging()
 
-            # Initialize TTS engine if available
-            # Centralized TTS initialization
+            # The shared TTS engine is created on first use by _get_tts_engine,
+            # on the speech thread: pyttsx3.init loads the platform speech
+            # driver, which the window does not need in order to open
             self.tts_engine = None
-            self.tts_available = False
-            try:
-                # pyttsx3 already imported at the top if available
-                self.tts_engine = pyttsx3.init()
-                self.tts_engine.setProperty("rate", 150)
-                self.tts_engine.setProperty("volume", 0.8)
-                self.tts_engine.setProperty("voice", "english")
-                self.tts_available = True
-            except Exception as e:
-                self.tts_engine = None
-                self.tts_available = False
-                print(f"Warning: pyttsx3 not available. TTS disabled. ({e})")
+            self.tts_available = TTS_AVAILABLE  # Cleared if the engine fails to start
+            self._tts_props: Dict[str, Any] = {}  # voice/rate/volume last set on the engine
+            self._tts_voices: Optional[List[Any]] = None  # Set once the engine has started
+            # (func, callback, droppable) tasks for the speech thread, started on first use
+            self._tts_pending: Deque[Tuple[Callable, Optional[Callable], bool]] = deque()
+            self._tts_event = threading.Event()
+            self._tts_thread: Optional[threading.Thread] = None
 
             # Centralized STT initialization
             self.stt_available = False
@@ -533,8 +890,7 @@ class CrewGUI:
             # Initialize Crew message router
             self.message_router = CrewMessageRouter()
 
-            # Initialize database manager for crew/user data
-            self.db_manager = DatabaseManager()
+            # Database manager for crew/user data is opened on first use (see db)
 
 
 
@@ -576,72 +932,100 @@ class CrewGUI:
             self.create_menu_bar()
 
             self.config = Config()
-            self.setup_logging() # os is used here, but this line is commented out
             self.setup_state()
             self.create_main_layout()
             self.create_all_widgets()
             self.bind_events()
 
-            # Auto-import all .py files in workspace after GUI is set up
-            self.update_status("Auto-importing workspace modules...")
-            self.imported_modules, self.failed_imports = auto_import_py_files()
-
-            # Initialize background worker
-            self.task_queue: Queue = Queue()
+            # Initialize background worker: a deque (atomic append/popleft) plus
+            # an Event to wake the single consumer thread. Keyed tasks record
+            # their sequence number so a newer post of the same key supersedes
+            # any copy still queued.
+            self._tasks: Deque[
+                Tuple[Callable, tuple, Optional[Callable], Optional[str], int]
+            ] = deque()
+            self._task_event = threading.Event()
+            self._task_seq = itertools.count()
+            self._latest_task: Dict[str, int] = {}
+            self._worker_stop = False  # Set on close; the worker exits when woken
             self.worker_thread = threading.Thread(
                 target=self._background_worker, daemon=True
             )
             self.worker_thread.start()
+            # Independent I/O-bound work (file loads) runs on a small pool so a
+            # slow load does not hold up filter passes queued on the worker
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.BACKGROUND_POOL_WORKERS, thread_name_prefix="crew-bg"
+            )
+
+            # Auto-import all .py files in workspace on a thread of its own so
+            # the window paints immediately and the worker stays free for data
+            # loading; results arrive via _finalize_imports
+            self.imported_modules: List[str] = []
+            self.failed_imports: List[Tuple[str, str]] = []
+            self.update_status("Auto-importing workspace modules...")
+            threading.Thread(target=self._do_auto_import, daemon=True).start()
 
-            # Load window state after widgets are created
+            # Load window state after widgets are created; save it again on close
             self.load_window_state()
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
             # Load default data file if exists
             self.load_default_data()
 
-            # Update status with import results
-            total_imported = (
-                len(self.imported_modules) if hasattr(self, "imported_modules") else 0
-            )
-            total_failed = (
-                len(self.failed_imports) if hasattr(self, "failed_imports") else 0
-            )
-            self.update_status(
-                f"Ready - Auto-imported {total_imported} modules ({total_failed} failed)"
-            )
-
         except Exception as e:
             logging.error(f"Failed to initialize GUI: {e}")
             messagebox.showerror("Error", f"Failed to initialize application: {e}")
             raise
 
+    def _do_auto_import(self) -> None:
+        """Run the auto-import off the Tk thread and hand the results back to it."""
+        try:
+            result = auto_import_py_files()
+        except Exception as e:
+            logging.error(f"Auto-import failed: {e}")
+            result = ([], [])
+        self.root.after(0, self._finalize_imports, result)
+
+    def _finalize_imports(
+        self, result: Tuple[List[str], List[Tuple[str, str]]]
+    ) -> None:
+        """Store auto-import results delivered by the auto-import thread."""
+        try:
+            self.imported_modules, self.failed_imports = result
+            self.update_status(
+                f"Ready - Auto-imported {len(self.imported_modules)} modules "
+                f"({len(self.failed_imports)} failed)"
+            )
+        except Exception as e:
+            logging.error(f"Error finalizing auto-import results: {e}")
+
 
 
     
     def create_menu_bar(self) -> None:
+        # Each submenu is filled before it is attached, and the menu bar is
+        # only set on the window once complete, so Tk lays out each menu
+        # once instead of after every added entry
         self.menu_bar = tk.Menu(self.root)
-        self.root.config(menu=self.menu_bar)
 
         # File menu
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open... (Ctrl+O)", command=self._on_open_file)
         file_menu.add_separator()
         file_menu.add_command(label="Save... (Ctrl+S)", command=self._on_save_file)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
+        self.menu_bar.add_cascade(label="File", menu=file_menu)
 
         # Edit menu
         edit_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(
-            label="Find (Ctrl+F)", command=lambda: self.filter_entry_widget.focus_set() if hasattr(self, 'filter_entry_widget') else None
-        )
+        edit_menu.add_command(label="Find (Ctrl+F)", command=self._focus_filter)
         edit_menu.add_command(label="Clear Filter (Esc)", command=self.clear_filter)
+        self.menu_bar.add_cascade(label="Edit", menu=edit_menu)
 
         # View menu
         view_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="View", menu=view_menu)
         view_menu.add_command(label="Refresh (F5)", command=self._refresh_views)
         view_menu.add_separator()
 
@@ -649,63 +1033,102 @@ class CrewGUI:
         self.column_visibility_menu = tk.Menu(view_menu, tearoff=0)
         view_menu.add_cascade(label="Columns", menu=self.column_visibility_menu)
 
-        # Add script selector submenu
-        self.script_menu = tk.Menu(view_menu, tearoff=0, postcommand=self._update_script_menu)
+        # Add script selector submenu, built when first opened and rebuilt
+        # only after the scripts folder changes
+        self._script_menu_stamp: Optional[int] = None
+        self.script_menu = tk.Menu(view_menu, tearoff=0, postcommand=self._on_script_menu_post)
         view_menu.add_cascade(
             label="Run Script",
             menu=self.script_menu
         )
+        self.menu_bar.add_cascade(label="View", menu=view_menu)
 
         # Server menu
-        server_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Server", menu=server_menu)
-        server_menu.add_command(
-            label="Launch 0101 Server",
-            command=self._launch_0101_server
-        )
+        self._add_lazy_cascade("Server", self._populate_server_menu)
 
         # Record menu
         record_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="🎤 Record", menu=record_menu)
         record_menu.add_command(label="Start Recording", command=self._start_recording)
         record_menu.add_command(label="Stop Recording", command=self._stop_recording, state="disabled")
         record_menu.add_separator()
         record_menu.add_command(label="Play Last Recording", command=self._play_recording, state="disabled")
         record_menu.add_command(label="Save Recording As...", command=self._save_recording_as, state="disabled")
+        self.menu_bar.add_cascade(label="🎤 Record", menu=record_menu)
 
         self._record_menu = record_menu  # Store for state updates
         self._recording_process = None
         self._last_recording_path = None
 
-        # Add TTS menu if available
+        # Add TTS menu if available; it and the menus below are filled in
+        # the first time they are opened
         if TTS_AVAILABLE:
-            tts_menu = tk.Menu(self.menu_bar, tearoff=0)
-            self.menu_bar.add_cascade(label="🔊 Speech", menu=tts_menu)
-            tts_menu.add_command(label="Read Selection (Ctrl+Shift+R)", command=self._read_selected_item)
-            tts_menu.add_command(label="Read All Details (Ctrl+Shift+A)", command=self._read_all_details)
-            tts_menu.add_command(label="Read Status (Ctrl+Shift+S)", command=self._read_status)
-            tts_menu.add_command(label="Read Item Type (Ctrl+Shift+T)", command=self._read_item_type)
-            tts_menu.add_separator()
-            tts_menu.add_command(label="Stop Reading", command=self._stop_reading)
-            tts_menu.add_separator()
-            tts_menu.add_command(label="Save Speech to File...", command=self._save_speech_to_file)
-            tts_menu.add_command(label="Speech Settings...", command=self.show_speech_settings_dialog)
+            self._add_lazy_cascade("🔊 Speech", self._populate_tts_menu)
 
         # Help menu
-        help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.menu_bar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Quick Start", command=self.show_quick_start)
-        help_menu.add_command(label="Troubleshooting", command=self.show_troubleshooting)
+        self._add_lazy_cascade("Help", self._populate_help_menu)
 
         # Add Chatbot as a top-level menu
-        chatbot_menu = tk.Menu(self.menu_bar, tearoff=0)
-        chatbot_menu.add_command(label="Open Chatbot...", command=self.open_chatbot_dialog)
-        self.menu_bar.add_cascade(label="💬 Chatbot", menu=chatbot_menu)
+        self._add_lazy_cascade("💬 Chatbot", self._populate_chatbot_menu)
 
         # Add Crew Chat as a top-level menu
-        crew_chat_menu = tk.Menu(self.menu_bar, tearoff=0)
-        crew_chat_menu.add_command(label="Open Crew Chat...", command=self.open_crew_chat_window)
-        self.menu_bar.add_cascade(label="👥 Crew Chat", menu=crew_chat_menu)
+        self._add_lazy_cascade("👥 Crew Chat", self._populate_crew_chat_menu)
+
+        self.root.config(menu=self.menu_bar)
+
+    def _add_lazy_cascade(self, label: str, populate: Callable[[tk.Menu], None]) -> tk.Menu:
+        """Add a menu bar cascade whose entries are created when first opened."""
+        menu = tk.Menu(self.menu_bar, tearoff=0)
+
+        def build() -> None:
+            menu.configure(postcommand="")  # Only ever built once
+            populate(menu)
+
+        menu.configure(postcommand=build)
+        self.menu_bar.add_cascade(label=label, menu=menu)
+        return menu
+
+    def _populate_server_menu(self, menu: tk.Menu) -> None:
+        menu.add_command(
+            label="Launch 0101 Server",
+            command=self._launch_0101_server
+        )
+
+    @staticmethod
+    def _add_menu_items(
+        menu: tk.Menu, items: Tuple[Optional[Tuple[str, Callable]], ...]
+    ) -> None:
+        """Add (label, command) entries to menu; None adds a separator."""
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            else:
+                label, command = item
+                menu.add_command(label=label, command=command)
+
+    def _populate_tts_menu(self, menu: tk.Menu) -> None:
+        self._add_menu_items(menu, (
+            ("Read Selection (Ctrl+Shift+R)", self._read_selected_item),
+            ("Read All Details (Ctrl+Shift+A)", self._read_all_details),
+            ("Read Status (Ctrl+Shift+S)", self._read_status),
+            ("Read Item Type (Ctrl+Shift+T)", self._read_item_type),
+            None,
+            ("Stop Reading", self._stop_reading),
+            None,
+            ("Save Speech to File...", self._save_speech_to_file),
+            ("Speech Settings...", self.show_speech_settings_dialog),
+        ))
+
+    def _populate_help_menu(self, menu: tk.Menu) -> None:
+        self._add_menu_items(menu, (
+            ("Quick Start", self.show_quick_start),
+            ("Troubleshooting", self.show_troubleshooting),
+        ))
+
+    def _populate_chatbot_menu(self, menu: tk.Menu) -> None:
+        menu.add_command(label="Open Chatbot...", command=self.open_chatbot_dialog)
+
+    def _populate_crew_chat_menu(self, menu: tk.Menu) -> None:
+        menu.add_command(label="Open Crew Chat...", command=self.open_crew_chat_window)
 
     def _launch_0101_server(self):
         """Launch the 0101 server.py in a new process."""
@@ -890,6 +1313,9 @@ class CrewGUI:
 
         # File attachment (right)
         attached_file = {"path": None, "filename": None}
+        # Attachments are copied here; the folder is created on first use
+        chat_files_dir = os.path.join(os.path.expanduser("~"), ".crew_chat_files")
+        chat_files_ready = [False]
 
         def attach_file():
             # filedialog and messagebox already imported at the top
@@ -923,15 +1349,15 @@ class CrewGUI:
                 "Trader": "💰", "Gunner": "🔫", "Chief": "🛠️", "Tech": "🔧"
             }
             avatar = avatar_map.get(sender, "👤")
-            # Sender line with avatar and bold
-            chat_display.insert(tk.END, f"{avatar} ", "msg")
-            chat_display.insert(tk.END, f"{sender}", "sender")
-            chat_display.insert(tk.END, f" → {', '.join(recipients)}", "msg")
+            # Sender line with avatar and bold; Text.insert takes several
+            # text/tag pairs, so the whole entry goes in with one Tcl call
+            segments = [f"{avatar} ", "msg", f"{sender}", "sender", f" → {', '.join(recipients)}", "msg"]
             if show_timestamps[0] and timestamp:
-                chat_display.insert(tk.END, f"  [{timestamp.split('T')[0]} {timestamp.split('T')[1][:8]}]", "divider")
-            chat_display.insert(tk.END, "\n", "msg")
+                segments += [f"  [{timestamp.split('T')[0]} {timestamp.split('T')[1][:8]}]", "divider"]
+            segments += ["\n", "msg"]
             if msg:
-                chat_display.insert(tk.END, f"   {msg}\n", "msg")
+                segments += [f"   {msg}\n", "msg"]
+            chat_display.insert(tk.END, *segments)
 
             if file_meta:
                 def open_file_callback(path=file_meta["filepath"]):
@@ -972,8 +1398,9 @@ class CrewGUI:
             msg = user_entry.get().strip()
             file_meta = None
             if attached_file["path"]:
-                chat_files_dir = os.path.join(os.path.expanduser("~"), ".crew_chat_files")
-                os.makedirs(chat_files_dir, exist_ok=True)
+                if not chat_files_ready[0]:
+                    os.makedirs(chat_files_dir, exist_ok=True)
+                    chat_files_ready[0] = True
                 dest_path = os.path.join(chat_files_dir, attached_file["filename"])
                 try:
                     shutil.copy2(attached_file["path"], dest_path)
@@ -981,6 +1408,7 @@ class CrewGUI:
                 except Exception as e:
                     print(f"Failed to copy attached file: {e}")
                     file_meta = None
+                    chat_files_ready[0] = False  # Re-create the folder next time
                 attached_file["path"] = None
                 attached_file["filename"] = None
                 attach_btn.config(text="Attach File")
@@ -1404,9 +1832,13 @@ class CrewGUI:
             chat_display.config(state="normal")
             chat_display.delete(1.0, tk.END)
             query = filter_var.get().strip().lower()
-            for m in conversation:
-                if not query or query in m.get("sender", "").lower() or query in m.get("message", "").lower():
-                    chat_display.insert(tk.END, f"{m['sender']}: {m.get('message','')}\n")
+            # Build the transcript once and insert it with a single call
+            lines = [
+                f"{m['sender']}: {m.get('message','')}\n"
+                for m in conversation
+                if not query or query in m.get("sender", "").lower() or query in m.get("message", "").lower()
+            ]
+            chat_display.insert(tk.END, "".join(lines))
             chat_display.config(state="disabled")
         filter_entry.bind("<Return>", lambda e: redraw_messages())
 
@@ -1477,9 +1909,8 @@ class CrewGUI:
         def speak_last_bot_reply():
             if self.tts_available and last_bot_reply[0]:
                 try:
-                    self.tts_engine.say(last_bot_reply[0])
-                    self.tts_engine.runAndWait()
-                    status_var.set("Spoken last bot reply.")
+                    self._speak(last_bot_reply[0])
+                    status_var.set("Speaking last bot reply.")
                 except Exception as e:
                     print(f"TTS error: {e}")
                     status_var.set("TTS error.")
@@ -1772,33 +2203,36 @@ class CrewGUI:
             self.update_status("No recording available to save.", error=True)
 
     def show_speech_settings_dialog(self):
-        if not TTS_AVAILABLE or not hasattr(self, 'tts_engine') or self.tts_engine is None:
+        if not self.tts_available:
             # messagebox already imported at the top
             messagebox.showerror("Speech Settings", "Text-to-speech engine is not available.")
             return
+        if not self._tts_ready(self.show_speech_settings_dialog):
+            return
         win = tk.Toplevel(self.root)
         win.title("Speech Settings")
         win.geometry("350x250")
         win.resizable(False, False)
         # Voice selection
         tk.Label(win, text="Voice:").pack(anchor="w", padx=10, pady=(10,0))
-        voices = self.tts_engine.getProperty("voices")
+        voices = self._tts_voices
+        props = self._tts_props
         voice_names = [v.name for v in voices]
-        voice_var = tk.StringVar(value=self.tts_engine.getProperty("voice"))
+        voice_var = tk.StringVar(value=props["voice"])
         voice_map = {v.id: v.name for v in voices}
         id_to_voice = {v.name: v.id for v in voices}
-        current_voice_name = next((v.name for v in voices if v.id == self.tts_engine.getProperty("voice")), voice_names[0])
+        current_voice_name = next((v.name for v in voices if v.id == props["voice"]), voice_names[0])
         voice_dropdown = tk.OptionMenu(win, voice_var, *voice_names)
         voice_var.set(current_voice_name)
         voice_dropdown.pack(fill="x", padx=10)
         # Rate
         tk.Label(win, text="Rate:").pack(anchor="w", padx=10, pady=(10,0))
-        rate_var = tk.IntVar(value=self.tts_engine.getProperty("rate"))
+        rate_var = tk.IntVar(value=props["rate"])
         rate_scale = tk.Scale(win, from_=80, to=300, orient="horizontal", variable=rate_var)
         rate_scale.pack(fill="x", padx=10)
         # Volume
         tk.Label(win, text="Volume:").pack(anchor="w", padx=10, pady=(10,0))
-        volume_var = tk.DoubleVar(value=self.tts_engine.getProperty("volume"))
+        volume_var = tk.DoubleVar(value=props["volume"])
         volume_scale = tk.Scale(win, from_=0.0, to=1.0, resolution=0.01, orient="horizontal", variable=volume_var)
         volume_scale.pack(fill="x", padx=10)
         # Save button
@@ -1806,11 +2240,11 @@ class CrewGUI:
             # Set voice
             selected_voice_name = voice_var.get()
             selected_voice_id = id_to_voice.get(selected_voice_name, voices[0].id)
-            self.tts_engine.setProperty("voice", selected_voice_id)
-            # Set rate
-            self.tts_engine.setProperty("rate", rate_var.get())
-            # Set volume
-            self.tts_engine.setProperty("volume", volume_var.get())
+            self._set_tts_properties({
+                "voice": selected_voice_id,
+                "rate": rate_var.get(),
+                "volume": volume_var.get(),
+            })
             win.destroy()
         tk.Button(win, text="Save", command=save_settings).pack(pady=15)
 
@@ -1853,25 +2287,14 @@ class CrewGUI:
 
     def show_diagnostics_dialog(self):
         try:
-            features = []
-            # TTS
-            try:
-                import pyttsx3
-                features.append(("Text-to-Speech (pyttsx3)", True))
-            except ImportError:
-                features.append(("Text-to-Speech (pyttsx3)", False))
-            # pandas
-            try:
-                import pandas
-                features.append(("pandas", True))
-            except ImportError:
-                features.append(("pandas", False))
-            # CustomTkinter
-            try:
-                import customtkinter
-                features.append(("CustomTkinter", True))
-            except ImportError:
-                features.append(("CustomTkinter", False))
+            # pyttsx3, pandas and CustomTkinter were probed at startup and are
+            # lazily loaded; an import statement here would run their module
+            # bodies on the Tk thread just to report on them
+            features = [
+                ("Text-to-Speech (pyttsx3)", TTS_AVAILABLE),
+                ("pandas", PANDAS_AVAILABLE),
+                ("CustomTkinter", CTK_AVAILABLE),
+            ]
             # SpeechRecognition
             try:
                 import speech_recognition
@@ -1900,31 +2323,21 @@ class CrewGUI:
 
     def bind_events(self) -> None:
         try:
-            # Clear filter with Escape key
-            self.root.bind("<Escape>", lambda event: self.clear_filter())
-
-            # Focus filter field with Ctrl+F
-            self.root.bind(
-                "<Control-f>",
-                lambda event: (
-                    self.filter_var.focus_set() if hasattr(self, "filter_var") else None
-                ),
-            )
-
-            # Refresh with F5
-            self.root.bind(
-                "<F5>",
-                lambda event: (
-                    self._refresh_views() if hasattr(self, "_refresh_views") else None
-                ),
-            )
-
-            # TTS keyboard shortcuts
+            # Shortcut table: Escape clears the filter, Ctrl+F focuses it, F5 refreshes
+            bindings = [
+                ("<Escape>", self.clear_filter),
+                ("<Control-f>", self._focus_filter),
+                ("<F5>", self._refresh_views),
+            ]
             if TTS_AVAILABLE:
-                self.root.bind("<Control-Shift-R>", lambda event: self._read_selected_item())
-                self.root.bind("<Control-Shift-A>", lambda event: self._read_all_details())
-                self.root.bind("<Control-Shift-S>", lambda event: self._read_status())
-                self.root.bind("<Control-Shift-T>", lambda event: self._read_item_type())
+                bindings += [
+                    ("<Control-Shift-R>", self._read_selected_item),
+                    ("<Control-Shift-A>", self._read_all_details),
+                    ("<Control-Shift-S>", self._read_status),
+                    ("<Control-Shift-T>", self._read_item_type),
+                ]
+            for sequence, callback in bindings:
+                self.root.bind(sequence, lambda event, callback=callback: callback())
 
         except Exception as e:
             logging.error(f"Error setting up event bindings: {e}")
@@ -1942,7 +2355,8 @@ class CrewGUI:
 
     def load_window_state(self) -> None:
         try:
-            saved_window_size = self.config.get("window_size")
+            cfg = self.config.snapshot()  # One lookup source for all saved state
+            saved_window_size = cfg.get("window_size")
             if saved_window_size and saved_window_size != DEFAULT_MAIN_WINDOW_SIZE:
                 logging.info(
                     "Ignoring saved window size '%s' and forcing '%s'.",
@@ -1951,7 +2365,7 @@ class CrewGUI:
                 )
 
             self._apply_main_window_geometry()
-            saved_min_window_size = self.config.get("min_window_size")
+            saved_min_window_size = cfg.get("min_window_size")
             if (
                 saved_min_window_size
                 and saved_min_window_size != DEFAULT_MAIN_WINDOW_SIZE
@@ -1963,30 +2377,31 @@ class CrewGUI:
                 )
 
             # Store column widths for later application after table is populated
-            self._saved_column_widths = self.config.get("column_widths", {})
+            self._saved_column_widths = cfg.get("column_widths", {})
 
             # Restore column visibility preferences
-            saved_visibility = self.config.get("column_visibility", {})
-            if saved_visibility and hasattr(self, "column_visibility"):
+            saved_visibility = cfg.get("column_visibility", {})
+            if saved_visibility:
                 self.column_visibility.update(saved_visibility)
+                self._column_visibility_dirty = True
 
         except Exception as e:
             logging.error(f"Error loading window state: {e}")
 
     def save_window_state(self) -> None:
         try:
-            self.config.set("window_size", DEFAULT_MAIN_WINDOW_SIZE)
-            self.config.set("min_window_size", DEFAULT_MAIN_WINDOW_SIZE)
-
-            # Save column widths
-            column_widths = {}
-            for col in self.data_table["columns"]:
-                column_widths[col] = self.data_table.column(col, "width")
-            self.config.set("column_widths", column_widths)
-
-            # Save column visibility preferences
-            if hasattr(self, "column_visibility"):
-                self.config.set("column_visibility", self.column_visibility)
+            # Column widths come from the mirror kept in step with the table,
+            # so saving needs no Treeview round-trips; bulk_set skips the file
+            # write entirely when nothing differs from the stored config
+            self.config.bulk_set(
+                {
+                    "window_size": DEFAULT_MAIN_WINDOW_SIZE,
+                    "min_window_size": DEFAULT_MAIN_WINDOW_SIZE,
+                    "column_widths": dict(self._col_widths),
+                    # A copy, so later toggles are not already "saved" in place
+                    "column_visibility": dict(self.column_visibility),
+                }
+            )
 
         except Exception as e:
             logging.error(f"Error saving window state: {e}")
@@ -1997,8 +2412,7 @@ class CrewGUI:
                 return  # Not yet created or an issue
 
             column_options = ["All Columns"]
-            if hasattr(self, "headers") and self.headers:
-                column_options.extend(self.headers)
+            column_options.extend(self.headers or [])
             
             self.column_menu['values'] = column_options
             
@@ -2022,30 +2436,98 @@ class CrewGUI:
             # The self.column_var is automatically updated by the Combobox.
             # Call _on_apply_filter to re-filter the data with the new column selection
             # and current filter text. If filter text is empty, it will show all data.
-            if hasattr(self, '_on_apply_filter'):
-                self._on_apply_filter()
+            self._on_apply_filter()
         except Exception as e:
             logging.error(f"Error handling filter column selection: {e}")
             messagebox.showerror("Filter Error", f"Error processing column selection: {e}")
 
     def _background_worker(self) -> None:
-        while True:
-            task: Tuple[Callable, tuple, Optional[Callable]] = self.task_queue.get()
-            func, args, callback = task
-            try:
-                result = func(*args)
-                if callback:
-                    self.root.after(0, callback, result)
-            except Exception as e:
-                logging.error(f"Background task failed: {e}")
-            self.task_queue.task_done()
+        while not self._worker_stop:
+            self._task_event.wait()
+            self._task_event.clear()
+            while self._tasks and not self._worker_stop:
+                func, args, callback, key, seq = self._tasks.popleft()
+                if key is not None and self._latest_task.get(key) != seq:
+                    continue  # Superseded by a newer task with the same key
+                try:
+                    result = func(*args)
+                    if callback:
+                        self.root.after(0, callback, result)
+                except Exception as e:
+                    logging.error(f"Background task failed: {e}")
 
     def run_in_background(
-        self, func: Callable, *args, callback: Optional[Callable] = None
+        self,
+        func: Callable,
+        *args,
+        callback: Optional[Callable] = None,
+        key: Optional[str] = None,
+        parallel: bool = False,
     ) -> None:
-        self.task_queue.put((func, args, callback))
+        """Queue func(*args) on the worker; callback(result) runs on the Tk loop.
+
+        Queued tasks sharing a key are coalesced: only the most recent one
+        runs. Parallel tasks run on the thread pool instead of the ordered
+        worker queue; a keyed parallel task that has been superseded still
+        runs, but its result is dropped.
+        Tasks posted after the worker has been stopped are dropped.
+        """
+        if self._worker_stop:
+            logging.debug(f"Background worker stopped; dropping {func!r}")
+            return
+        seq = next(self._task_seq)
+        if key is not None:
+            self._latest_task[key] = seq
+        if parallel:
+            future = self._pool.submit(func, *args)
+            future.add_done_callback(
+                lambda future: self._deliver_pool_result(future, callback, key, seq)
+            )
+            return
+        self._tasks.append((func, args, callback, key, seq))
+        self._task_event.set()
+
+    def _deliver_pool_result(
+        self, future, callback: Optional[Callable], key: Optional[str], seq: int
+    ) -> None:
+        # Runs on the pool thread that finished the task
+        if future.cancelled():
+            return
+        if key is not None and self._latest_task.get(key) != seq:
+            return  # A newer task with the same key was posted meanwhile
+        try:
+            result = future.result()
+            if callback:
+                self.root.after(0, callback, result)
+        except Exception as e:
+            logging.error(f"Background task failed: {e}")
+
+    def stop_background_worker(self, timeout: float = 0.5) -> None:
+        """Discard queued tasks and let the worker thread exit."""
+        self._worker_stop = True
+        self._tasks.clear()
+        self._task_event.set()  # Wake the worker so it sees the stop flag
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.worker_thread.join(timeout)
+
+    def _on_close(self) -> None:
+        """Stop background work, save window state, close any open database, then the window."""
+        try:
+            self.stop_background_worker()
+            self.save_window_state()
+            if self._db is not None:  # Only if something actually opened it
+                self._db.close()
+        except Exception as e:
+            logging.error(f"Error during shutdown: {e}")
+        finally:
+            self.root.destroy()
 
     def setup_logging(self) -> None:
+        # basicConfig does nothing once the root logger has handlers (a
+        # launcher may have set logging up already); check first so the log
+        # file is not opened just to be discarded
+        if logging.getLogger().handlers:
+            return
         logging.basicConfig(
             level=logging.INFO, 
             format="%(asctime)s - %(levelname)s - %(message)s",
@@ -2055,16 +2537,84 @@ class CrewGUI:
             ]
         )
 
+    @property
+    def headers(self) -> List[str]:
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: List[str]) -> None:
+        # Keep a header -> column index map in step with the headers so
+        # column lookups by name are O(1); the first duplicate wins, as with list.index
+        self._headers = value
+        self._header_index = {}
+        for i, header in enumerate(value or []):
+            self._header_index.setdefault(header, i)
+        self._header_prefixes = [f"{header}: " for header in value or []]  # Details labels
+
+    @property
+    def db(self):
+        """Database manager, imported and opened on first access."""
+        db = getattr(self, "_db", None)
+        if db is None:
+            from database_manager import DatabaseManager
+            db = self._db = DatabaseManager()
+        return db
+
+    @property
+    def db_manager(self):
+        # Older name for the same shared connection
+        return self.db
+
     def setup_state(self) -> None:
-        self.db = DatabaseManager()
-        self.groups = {}  # Store groups data
-        self.current_groups = {}
-        self.group_preview = {}
-        self.current_columns = []
-        self.current_data = []
+        # Runs before any widget or callback exists; state set here is relied
+        # on directly elsewhere rather than probed with hasattr
+        self._db = None  # Opened lazily by the db property
+        self.groups: Dict[str, List[List[Any]]] = {}  # Store groups data
+        self.current_groups: Dict[str, List[List[Any]]] = {}
+        self.group_preview: Dict[str, Any] = {}
+        self.current_columns: List[str] = []
+        self.current_data: List[List[Any]] = []
         self.headers = []  # Initialize empty headers
-        self.column_visibility = {}  # Initialize column visibility tracking
+        self._lc_columns: List[List[str]] = []  # Lowercased column-major filter index
+        self._str_columns: Optional[List[List[str]]] = None  # Same, case preserved
+        self._filter_index_source = None  # Data the filter index was built from
+        self._filter_cache: "OrderedDict[Tuple[Optional[int], bool, str], List[int]]" = OrderedDict()
+        self._filter_cache_indices = 0  # Total length of the cached index lists
+        self._current_view_data: List[List[Any]] = []  # Rows shown in the data table
+        self._populate_job = None  # Pending after_idle id for chunked table inserts
+        self._suspended_yscroll = None  # Scrollbar command detached during streaming
+        self._virtual_table = False  # True when only a window of rows is rendered
+        self._rendered_range = (0, 0)  # View rows [lo, hi) present in the Treeview
+        self._table_window_job = None  # Pending after_idle id for a window shift
+        self._table_scroll_after = None  # Pending after id for a scrollbar-drag render
+        self._details_after = None  # Pending trailing details rebuild
+        self._details_shown_at = 0.0  # time.monotonic() of the last details rebuild
+        self._selected_row: Optional[int] = None  # View index of the selected row
+        self._details_shown: Optional[str] = None  # Text currently in details_text
+        self._group_names: Dict[str, str] = {}  # group_list item id -> group name
+        self.column_visibility: Dict[str, bool] = {}  # Initialize column visibility tracking
+        self.column_vars: List[tk.BooleanVar] = []  # Columns menu checkbutton variables
+        self._column_visibility_dirty = True  # Visibility not yet applied to the table
         self.filter_case_sensitive_var = tk.BooleanVar(value=False) # Default to case-insensitive
+        self._filter_after = None  # Pending debounced filter callback id
+        self._status_pending = None  # Status text awaiting the idle flush
+        self._status_shown: Optional[str] = None  # Text last written to status_var
+        self._filter_gen = 0  # Bumped per filter request; stale results are dropped
+        self._resize_after = None  # Pending column resize after a Configure burst
+        self._sort_column: Optional[int] = None  # Column index of the last sort
+        self._sort_reverse = False
+        self._saved_column_widths: Dict[str, int] = {}  # Applied on <<TreeviewPopulated>>
+        self.status_tooltip: Optional[tk.Toplevel] = None  # Created once, then reused
+        self._status_tooltip_label: Optional[tk.Label] = None
+        self._status_tooltip_after = None  # Pending delayed tooltip show
+        self._columns: Tuple[str, ...] = ()  # Treeview column ids of the data table
+        self._col_widths: Dict[str, int] = {}  # Column id -> width, mirrors the table
+        self._resizing_column = False  # A heading separator drag is in progress
+        self._col_index: Dict[str, int] = {}  # Column id -> position
+        self._display_columns: Tuple[str, ...] = ()  # Shown column ids, in display order
+        self._base_header_text: List[str] = []  # Headings without sort markers
+        self._last_configured_headers: Optional[List[str]] = None  # Headers the table columns match
+        self._marked_heading: Optional[int] = None  # Column showing the sort arrow
 
     def create_main_layout(self) -> None:
         # Configure root window
@@ -2074,14 +2624,6 @@ class CrewGUI:
         self.main_frame = ttk.Frame(self.root, padding="5")
         self.main_frame.grid(row=0, column=0, sticky="nsew")
 
-        # Configure root window weights
-        self.root.grid_rowconfigure(0, weight=1)
-        self.root.grid_columnconfigure(0, weight=1)
-
-        # Configure main frame weights
-        self.main_frame.grid_rowconfigure(0, weight=1)
-        self.main_frame.grid_columnconfigure(0, weight=1)
-
         # Create PanedWindow for resizable divider between left and right sections
         self.paned_window = ttk.PanedWindow(self.main_frame, orient="horizontal")
         self.paned_window.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
@@ -2100,16 +2642,22 @@ class CrewGUI:
         # Split left panel into Controls/Groups/Filters
         self.paned_left = ttk.PanedWindow(self.left_frame, orient="vertical")
         self.paned_left.grid(row=0, column=0, sticky="nsew")
-        # Ensure the left_frame fills the area for its PanedWindow
-        self.left_frame.grid_rowconfigure(0, weight=1)
-        self.left_frame.grid_columnconfigure(0, weight=1)
 
         # Split right panel into Data/Details
         self.paned_right = ttk.PanedWindow(self.right_frame, orient="vertical")
         self.paned_right.grid(row=0, column=0, sticky="nsew")
-        # Ensure the right_frame fills the area for its PanedWindow
-        self.right_frame.grid_rowconfigure(0, weight=1)
-        self.right_frame.grid_columnconfigure(0, weight=1)
+
+        # Let each container's single cell fill it: the root window, the main
+        # frame, and the left/right frames around their PanedWindows. One Tcl
+        # call sets all eight weights; Tk lays out once when idle either way
+        self.root.tk.call(
+            "apply",
+            _GRID_FILL_CELL,
+            self.root._w,
+            self.main_frame._w,
+            self.left_frame._w,
+            self.right_frame._w,
+        )
 
     def create_all_widgets(self) -> None:
         try:
@@ -2138,14 +2686,14 @@ class CrewGUI:
                 padding=(5, 2),
                 anchor=tk.W,  # Left align text
             )
-            self.status_bar.pack(fill=tk.X, expand=True)
-
-            # Configure status bar layout
-            self.root.grid_rowconfigure(1, weight=0)
-            self.root.grid_columnconfigure(0, weight=1)
+            # Grid, like everything else from the root down, so this subtree
+            # does not also bring in the pack geometry manager
+            self.status_bar.grid(row=0, column=0, sticky="ew")
+            status_frame.grid_columnconfigure(0, weight=1)
+            # Root row 1 keeps its default weight of 0 and column 0 is already
+            # weighted by create_main_layout
 
             # Add tooltip
-            self.status_tooltip = None
             self.status_bar.bind("<Enter>", self._show_status_tooltip)
             self.status_bar.bind("<Leave>", self._hide_status_tooltip)
 
@@ -2162,8 +2710,10 @@ class CrewGUI:
             if error:
                 message = f"❌ {message}"
                 
-            self.status_var.set(message)
-            self.root.update_idletasks()
+            # Coalesce bursts: only the latest message is written, once per idle cycle
+            if self._status_pending is None:
+                self.root.after_idle(self._flush_status)
+            self._status_pending = message
             
             # Log error messages
             if error:
@@ -2174,37 +2724,61 @@ class CrewGUI:
         except Exception as e:
             logging.error(f"Failed to update status: {e}")
 
+    def _flush_status(self) -> None:
+        """Show the most recent status message queued by update_status."""
+        message, self._status_pending = self._status_pending, None
+        # Repeated messages (e.g. the same progress text) would only make the
+        # label redisplay unchanged text
+        if message is not None and message != self._status_shown:
+            self.status_var.set(message)
+            self._status_shown = message
+
     def _show_status_tooltip(self, event: tk.Event) -> None:
+        # Wait for the pointer to rest before showing, so passing over the
+        # status bar does not map a window
+        self._cancel_status_tooltip()
+        self._status_tooltip_after = self.root.after(
+            self.STATUS_TOOLTIP_DELAY_MS,
+            self._display_status_tooltip,
+            event.x_root + 10,
+            event.y_root + 10,
+        )
+
+    def _display_status_tooltip(self, x: int, y: int) -> None:
+        self._status_tooltip_after = None
         msg = self.status_var.get()
-        if len(msg) > 50:  # Only show for long messages
-            # Create a simple tooltip using a Toplevel window
+        if len(msg) <= 50:  # Only show for long messages
+            return
+        if self.status_tooltip is None:
+            # A single borderless Toplevel, withdrawn between hovers
             self.status_tooltip = tk.Toplevel(self.root)
             self.status_tooltip.wm_overrideredirect(True)
-
-            # Position tooltip near the cursor
-            x = event.x_root + 10
-            y = event.y_root + 10
-            self.status_tooltip.geometry(f"+{x}+{y}")
-
-            # Create tooltip content
-            tooltip_label = tk.Label(
+            self._status_tooltip_label = tk.Label(
                 self.status_tooltip,
-                text=msg,
                 background="lightyellow",
                 relief="solid",
                 borderwidth=1,
                 font=("TkDefaultFont", 9),
                 wraplength=300,
             )
-            tooltip_label.pack()
+            self._status_tooltip_label.pack()
+        self._status_tooltip_label.configure(text=msg)
+        # Position tooltip near the cursor
+        self.status_tooltip.geometry(f"+{x}+{y}")
+        self.status_tooltip.deiconify()
+
+    def _cancel_status_tooltip(self) -> None:
+        if self._status_tooltip_after is not None:
+            self.root.after_cancel(self._status_tooltip_after)
+            self._status_tooltip_after = None
 
     def _hide_status_tooltip(self, event: tk.Event) -> None:
-        if hasattr(self, "status_tooltip") and self.status_tooltip:
+        self._cancel_status_tooltip()
+        if self.status_tooltip:
             try:
-                self.status_tooltip.destroy()
-                self.status_tooltip = None
+                self.status_tooltip.withdraw()
             except tk.TclError:
-                # Tooltip already destroyed
+                # Tooltip already destroyed with the main window
                 self.status_tooltip = None
 
     def create_control_section(self) -> None:
@@ -2276,7 +2850,12 @@ class CrewGUI:
             item = self.group_list.identify_row(event.y)
             if item:
                 self.group_list.selection_set(item)
-                self.group_menu.post(event.x_root, event.y_root)
+                # Same posting as the details menu: tk_popup grabs so a click
+                # elsewhere dismisses the menu, then the grab is released
+                try:
+                    self.group_menu.tk_popup(event.x_root, event.y_root)
+                finally:
+                    self.group_menu.grab_release()
         except Exception as e:
             logging.error(f"Error showing group menu: {e}")
 
@@ -2288,7 +2867,7 @@ class CrewGUI:
                 return
 
             item_id = selection[0]
-            group_name = self.group_list.item(item_id)["text"]
+            group_name = self._group_name(item_id)
 
             # Confirm deletion
             if messagebox.askyesno("Confirm Delete", f"Delete group '{group_name}'?"):
@@ -2298,6 +2877,7 @@ class CrewGUI:
 
                 # Remove from treeview
                 self.group_list.delete(item_id)
+                self._group_names.pop(item_id, None)
 
                 # If this was the currently displayed group, show all data
                 self._update_data_view(self.current_data)
@@ -2308,6 +2888,15 @@ class CrewGUI:
             logging.error(f"Error deleting group: {e}")
             messagebox.showerror("Error", f"Failed to delete group: {e}")
 
+    def _group_name(self, item_id: str) -> str:
+        """Return the group name shown by a group_list item.
+
+        Names are recorded as the items are inserted, so this normally
+        avoids a Tcl round-trip to read the item text back.
+        """
+        name = self._group_names.get(item_id)
+        return name if name is not None else self.group_list.item(item_id)["text"]
+
     def create_filter_section(self) -> None:
         try:
             default_font = tkfont.nametofont("TkDefaultFont")
@@ -2338,6 +2927,8 @@ class CrewGUI:
             # Filter entry
             self.filter_entry_widget = ttk.Entry(filter_frame, textvariable=self.filter_var) 
             self.filter_entry_widget.pack(fill="x", pady=2)
+            # Apply the filter as the user types, debounced to one pass per pause
+            self.filter_var.trace_add("write", self._schedule_filter)
             
             # Case sensitive checkbox
             case_sensitive_check = ttk.Checkbutton(
@@ -2399,23 +2990,27 @@ class CrewGUI:
                 table_frame, show="headings", selectmode="browse", height=8  # Set height to 8 lines
             )
 
-            # Create scrollbars
+            # Create scrollbars; the vertical one goes through _on_table_yview and
+            # _on_table_yscroll so it can span the whole view when only a window
+            # of rows is rendered
             y_scroll = ttk.Scrollbar(
-                table_frame, orient="vertical", command=self.data_table.yview
+                table_frame, orient="vertical", command=self._on_table_yview
             )
+            self.data_y_scroll = y_scroll
             x_scroll = ttk.Scrollbar(
                 table_frame, orient="horizontal", command=self.data_table.xview
             )
 
             # Configure treeview to use scrollbars
             self.data_table.configure(
-                yscrollcommand=y_scroll.set,
+                yscrollcommand=self._on_table_yscroll,
                 xscrollcommand=x_scroll.set,
                 style="Treeview",
             )
 
             # Bind sorting event
             self.data_table.bind("<Button-1>", self._on_column_click)
+            self.data_table.bind("<ButtonRelease-1>", self._on_table_button_release)
 
             # Grid layout with scrollbars
             self.data_table.grid(row=0, column=0, sticky="nsew")
@@ -2427,30 +3022,37 @@ class CrewGUI:
             style.configure("Treeview", rowheight=25)
             style.configure("Treeview.Heading", font=("TkDefaultFont", 10, "bold"))
 
-            # Add hook to apply saved column widths after table is populated
-            def apply_saved_column_widths(event=None):
-                if hasattr(self, "_saved_column_widths") and self._saved_column_widths:
-                    # Ensure columns exist before trying to configure them
-                    table_columns = self.data_table["columns"]
-                    if not table_columns: # Table might not be fully populated yet
-                        return
-
-                    for col_id, width in self._saved_column_widths.items():
-                        # Check if col_id is a valid column identifier for the current table
-                        if col_id in table_columns:
-                            self.data_table.column(col_id, width=width)
-                        else:
-                            logging.warning(f"Column ID {col_id} not found in table while applying saved widths.")
-                    # Optionally, clear saved widths if they should only be applied once
-                    # self._saved_column_widths = {}
-
-            # Bind to table population event
-            self.data_table.bind("<<TreeviewPopulated>>", apply_saved_column_widths)
+            # Apply saved column widths each time the table is populated
+            self.data_table.bind(
+                "<<TreeviewPopulated>>", self._apply_saved_column_widths
+            )
 
         except Exception as e:
             logging.error(f"Failed to create data section: {e}")
             raise
 
+    def _apply_saved_column_widths(self, event=None) -> None:
+        """Apply the widths restored from config after each populate.
+
+        Membership is checked against the _col_index mirror and columns
+        already at their saved width are skipped, so repopulating a wide
+        table only issues Tcl calls for columns that actually change.
+        """
+        saved = self._saved_column_widths
+        # Table might not be fully populated yet
+        if not saved or not self._columns:
+            return
+        col_index = self._col_index
+        current = self._col_widths
+        for col_id, width in saved.items():
+            if col_id not in col_index:
+                logging.warning(f"Column ID {col_id} not found in table while applying saved widths.")
+                continue
+            if current.get(col_id) == width:
+                continue
+            self.data_table.column(col_id, width=width)
+            current[col_id] = width
+
     def create_details_section(self) -> None:
         try:
             details_frame = ttk.LabelFrame(
@@ -2514,30 +3116,30 @@ class CrewGUI:
             return
 
         try:
-            # Create context menu for TTS
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Cut", command=self._cut_text)
-            context_menu.add_command(label="Copy", command=self._copy_text)
-            context_menu.add_command(label="Paste", command=self._paste_text)
-            context_menu.add_separator()
-            context_menu.add_command(
-                label="Read Selection", command=self._read_selection
-            )
-            context_menu.add_command(label="Read All", command=self._read_all_details)
-            context_menu.add_command(label="Stop Reading", command=self._stop_reading)
-
-            # Bind right-click to show context menu
-            def show_context_menu(event):
-                try:
-                    context_menu.tk_popup(event.x_root, event.y_root)
-                finally:
-                    context_menu.grab_release()
-
-            self.details_text.bind("<Button-3>", show_context_menu)  # Right-click
+            # The right-click menu itself is only built on first use
+            self._details_menu: Optional[tk.Menu] = None
+            self.details_text.bind("<Button-3>", self._show_details_menu)  # Right-click
 
         except Exception as e:
             logging.error(f"Error setting up details TTS: {e}")
 
+    def _show_details_menu(self, event: tk.Event) -> None:
+        menu = self._details_menu
+        if menu is None:
+            # Create context menu for TTS
+            menu = self._details_menu = tk.Menu(self.root, tearoff=0)
+            menu.add_command(label="Cut", command=self._cut_text)
+            menu.add_command(label="Copy", command=self._copy_text)
+            menu.add_command(label="Paste", command=self._paste_text)
+            menu.add_separator()
+            menu.add_command(label="Read Selection", command=self._read_selection)
+            menu.add_command(label="Read All", command=self._read_all_details)
+            menu.add_command(label="Stop Reading", command=self._stop_reading)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
     def _cut_text(self) -> None:
         if hasattr(self, "details_text"):
             self.details_text.event_generate("<<Cut>>")
@@ -2551,7 +3153,7 @@ class CrewGUI:
             self.details_text.event_generate("<<Paste>>")
 
     def _read_selection(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
 
@@ -2568,17 +3170,14 @@ class CrewGUI:
                 )
 
             if selected_text.strip():
-                cleaned_text = self._clean_text(selected_text)
-                self.tts_engine.say(cleaned_text)
-                self.tts_engine.runAndWait()
-                logging.info("TTS playback completed for selection.")
+                self._speak(self._clean_text(selected_text))
 
         except Exception as e:
             logging.error(f"TTS selection error: {e}")
             messagebox.showerror("TTS Error", f"Failed to read selection: {e}")
 
     def _read_all_details(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
 
@@ -2586,17 +3185,14 @@ class CrewGUI:
             logging.info("Starting TTS playback for all details.")
             all_text = self.details_text.get("1.0", tk.END)
             if all_text.strip():
-                cleaned_text = self._clean_text(all_text)
-                self.tts_engine.say(cleaned_text)
-                self.tts_engine.runAndWait()
-                logging.info("TTS playback completed for all details.")
+                self._speak(self._clean_text(all_text))
 
         except Exception as e:
             logging.error(f"TTS all details error: {e}")
             messagebox.showerror("TTS Error", f"Failed to read all details: {e}")
 
     def _read_status(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
 
@@ -2605,47 +3201,50 @@ class CrewGUI:
             if hasattr(self, "status_var") and self.status_var:
                 status_text = self.status_var.get()
                 if status_text.strip():
-                    cleaned_text = self._clean_text(status_text)
-                    self.tts_engine.say(cleaned_text)
-                    self.tts_engine.runAndWait()
-                    logging.info("TTS playback completed for status.")
+                    self._speak(self._clean_text(status_text))
         except Exception as e:
             logging.error(f"TTS status error: {e}")
             messagebox.showerror("TTS Error", f"Failed to read status: {e}")
 
     def _read_selected_item(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
 
         try:
             if hasattr(self, "data_table"):
-                selection = self.data_table.selection()
-                if selection:
-                    item_id = selection[0]
-                    item_values = self.data_table.item(item_id, "values")
+                item_values = self._selected_row_values()
+                if item_values is not None:
                     # Read a summary or specific columns
                     if item_values:
                         # Example: Read the first column's value if it exists
                         text_to_read = str(item_values[0]) if item_values else "No details"
-                        self.tts_engine.say(text_to_read)
-                        self.tts_engine.runAndWait()
+                        self._speak(text_to_read)
         except Exception as e:
             logging.error(f"TTS selected item error: {e}")
 
     def _stop_reading(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
-            return
-
         try:
-            # pyttsx3's stop method is on the engine instance.
-            # It stops the current utterance and clears the queue.
-            self.tts_engine.stop()
+            # Drop utterances not yet started, keeping settings changes and
+            # tasks someone is waiting on; pyttsx3's stop ends the current
+            # utterance (it is the one engine call made from the Tk thread,
+            # to interrupt runAndWait). Nothing can be playing before the
+            # engine exists, so stopping never creates it.
+            pending = self._tts_pending
+            for _ in range(len(pending)):
+                try:
+                    task = pending.popleft()
+                except IndexError:
+                    break  # The speech thread took the rest
+                if not task[2]:
+                    pending.append(task)
+            if self.tts_engine is not None:
+                self.tts_engine.stop()
         except Exception as e:
             logging.error(f"Error stopping TTS: {e}")
 
     def _pause_reading(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if self.tts_engine is None:
             return
         try:
             self.tts_engine.pause()
@@ -2653,7 +3252,7 @@ class CrewGUI:
             logging.error(f"Error pausing TTS: {e}")
 
     def _resume_reading(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if self.tts_engine is None:
             return
         try:
             self.tts_engine.resume()
@@ -2662,29 +3261,13 @@ class CrewGUI:
 
     def preprocess_text_for_speech(self, text: str) -> str:
         """Clean and prepare text for better TTS pronunciation"""
-        import re
-        
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
+        text = _WHITESPACE_RE.sub(" ", text.strip())
+
         # Handle common abbreviations and technical terms
-        replacements = {
-            'CSV': 'C S V', 'JSON': 'Jason', 'XML': 'X M L', 'HTML': 'H T M L',
-            'URL': 'U R L', 'API': 'A P I', 'GUI': 'G U I', 'CLI': 'C L I',
-            'DB': 'database', 'SQL': 'S Q L', 'ID': 'I D', 'UUID': 'U U I D',
-            'HTTP': 'H T T P', 'HTTPS': 'H T T P S', 'FTP': 'F T P', 'SSH': 'S S H',
-            'TCP': 'T C P', 'UDP': 'U D P', 'IP': 'I P', 'DNS': 'D N S',
-            'CPU': 'C P U', 'GPU': 'G P U', 'RAM': 'ram', 'ROM': 'rom',
-            'USB': 'U S B', 'PDF': 'P D F', 'JPG': 'J P G', 'PNG': 'P N G',
-            'GIF': 'gif', 'MP3': 'M P 3', 'MP4': 'M P 4', 'WAV': 'wave',
-            'ZIP': 'zip', 'RAR': 'rar', 'TAR': 'tar', 'GZ': 'G Z',
-            'EXE': 'executable', 'DLL': 'D L L', 'SO': 'S O', 'LIB': 'library',
-        }
-        
-        for abbrev, replacement in replacements.items():
-            text = re.sub(r'\b' + re.escape(abbrev) + r'\b', replacement, text, flags=re.IGNORECASE)
-        
-        return text
+        return _SPEECH_ABBREV_RE.sub(
+            lambda m: _SPEECH_REPLACEMENTS[m.group().upper()], text
+        )
 
     def chunk_text(self, text: str, max_length: int = 400) -> list[str]:
         """Split text into smaller chunks for smoother playback."""
@@ -2707,67 +3290,188 @@ class CrewGUI:
         return chunks
 
     def _read_text_in_background(self, text: str) -> None:
-        """Run TTS in a background thread to avoid blocking the GUI."""
-        threading.Thread(target=self._read_text, args=(text,), daemon=True).start()
+        """Read text without blocking the GUI; playback is always off the Tk thread."""
+        self._read_text(text)
 
     def _read_text(self, text: str) -> None:
         """Read text using TTS with chunk-based playback."""
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
 
-        try:
-            # Split text into chunks
-            chunks = self.chunk_text(text, max_length=400)
-            for chunk in chunks:
-                self.tts_engine.say(chunk)  # Queue each chunk for playback
-            self.tts_engine.runAndWait()  # Execute playback
-        except Exception as e:
-            logging.error(f"TTS playback error: {e}")
-            messagebox.showerror("TTS Error", f"Failed to read text: {e}")
+        self._speak(*self.chunk_text(text, max_length=400))
+
+    def _get_tts_engine(self):
+        """Return the shared pyttsx3 engine, creating it on first use.
+
+        Only called on the speech thread: some drivers (sapi5's COM objects)
+        belong to the thread that created them. Returns None, and clears
+        tts_available, if the engine cannot start.
+        """
+        if self.tts_engine is None and self.tts_available:
+            try:
+                engine = pyttsx3.init()
+                engine.setProperty("rate", 150)
+                engine.setProperty("volume", 0.8)
+                engine.setProperty("voice", "english")
+                # Mirrors for the settings dialogs, so the Tk thread never
+                # queries the engine; voices last, as it marks them ready.
+                # Read back, as a driver may not know the "english" voice
+                props = {
+                    name: engine.getProperty(name) for name in ("voice", "rate", "volume")
+                }
+                props.update(self._tts_props)  # Changes queued before the start
+                self._tts_props = props
+                self._tts_voices = list(engine.getProperty("voices") or [])
+                self.tts_engine = engine
+            except Exception as e:
+                self.tts_available = False
+                logging.error(f"pyttsx3 could not start; TTS disabled: {e}")
+        return self.tts_engine
+
+    def _run_on_speech_thread(
+        self,
+        func: Callable[[Any], Any],
+        callback: Optional[Callable[[Any], None]] = None,
+        droppable: bool = False,
+    ) -> None:
+        """Queue func(engine) on the speech thread; callback(result) runs on the Tk loop.
+
+        The engine is created on that thread and all speech, saving and
+        property changes run there, one task at a time, so a run loop never
+        starts while another is playing. Only stop, pause and resume are
+        called from the Tk thread, since they must reach a running
+        utterance. Stop Reading discards droppable tasks (plain utterances)
+        still queued.
+        """
+        self._tts_pending.append((func, callback, droppable))
+        if self._tts_thread is None:
+            self._tts_thread = threading.Thread(target=self._tts_loop, daemon=True)
+            self._tts_thread.start()
+        self._tts_event.set()
+
+    def _speak(self, *texts: str) -> None:
+        """Queue texts to be spoken together on the speech thread.
+
+        runAndWait blocks for the whole utterance, so it never runs on the
+        Tk thread.
+        """
+        def say_all(engine) -> None:
+            for text in texts:
+                engine.say(text)
+            engine.runAndWait()
+
+        self._run_on_speech_thread(say_all, droppable=True)
+
+    def _set_tts_properties(self, props: Dict[str, Any]) -> None:
+        """Apply engine properties on the speech thread, after any queued speech."""
+        self._tts_props.update(props)
+
+        def apply(engine) -> None:
+            for name, value in props.items():
+                engine.setProperty(name, value)
+
+        self._run_on_speech_thread(apply)
+
+    def _preview_tts_settings(
+        self, rate: int, volume: float, callback: Callable[[Optional[Exception]], None]
+    ) -> None:
+        """Speak a test phrase at rate/volume, then restore the saved settings.
+
+        Runs on the speech thread behind any queued speech; callback gets
+        the error, or None, on the Tk loop.
+        """
+        original = dict(self._tts_props)
+
+        def preview(engine) -> Optional[Exception]:
+            try:
+                # Apply current settings temporarily for test
+                engine.setProperty("rate", rate)
+                engine.setProperty("volume", volume)
+                engine.say("This is a test of the current speech settings. How does this sound?")
+                engine.runAndWait()
+            except Exception as e:
+                return e
+            finally:
+                # Restore original settings
+                engine.setProperty("rate", original["rate"])
+                engine.setProperty("volume", original["volume"])
+            return None
+
+        self._run_on_speech_thread(preview, callback)
+
+    def _tts_ready(self, reopen: Callable[[], None]) -> bool:
+        """Whether the engine has started and its settings are mirrored.
+
+        If not, the speech thread is asked to start it and reopen() runs on
+        the Tk loop once it has; a dialog calls this with itself.
+        """
+        if self._tts_voices is not None:
+            return True
+        if self.tts_available:
+            self._run_on_speech_thread(lambda engine: None, lambda _: reopen())
+        return False
+
+    def _tts_loop(self) -> None:
+        engine = self._get_tts_engine()
+        while True:
+            self._tts_event.wait()
+            self._tts_event.clear()
+            while self._tts_pending:
+                func, callback, _ = self._tts_pending.popleft()
+                if engine is None:
+                    self._tts_pending.clear()
+                    self.root.after(0, self.update_status, "Text-to-speech engine is not available.", True)
+                    break
+                try:
+                    result = func(engine)
+                except Exception as e:
+                    logging.error(f"TTS playback error: {e}")
+                    self.root.after(0, self.update_status, f"Speech playback failed: {e}", True)
+                    continue
+                if callback is not None:
+                    self.root.after(0, callback, result)
+
+    @staticmethod
+    def _pick_female_voice(voices: List[Any]) -> Optional[str]:
+        """Return the id of a female-sounding voice, else the second voice, else None."""
+        if not voices:
+            return None
+        # Look for female voices
+        female_indicators = ['female', 'zira', 'hazel', 'susan', 'anna', 'catherine']
+        for voice in voices:
+            voice_name = voice.name.lower() if voice.name else ''
+            voice_id = voice.id.lower() if voice.id else ''
+            if any(indicator in voice_name or indicator in voice_id for indicator in female_indicators):
+                return voice.id
+        # If no female voice found, use the second voice if available
+        if len(voices) > 1:
+            return voices[1].id
+        return None
 
     def setup_female_voice(self, engine) -> bool:
         """Attempt to set up a female voice if available"""
         try:
-            voices = engine.getProperty('voices')
-            if not voices:
+            voice_id = self._pick_female_voice(engine.getProperty('voices'))
+            if voice_id is None:
                 return False
-            
-            # Look for female voices
-            female_indicators = ['female', 'zira', 'hazel', 'susan', 'anna', 'catherine']
-            
-            for voice in voices:
-                voice_name = voice.name.lower() if voice.name else ''
-                voice_id = voice.id.lower() if voice.id else ''
-                
-                if any(indicator in voice_name or indicator in voice_id for indicator in female_indicators):
-                    engine.setProperty('voice', voice.id)
-                    return True
-            
-            # If no female voice found, use the second voice if available
-            if len(voices) > 1:
-                engine.setProperty('voice', voices[1].id)
-                return True
-                
-            return False
+            engine.setProperty('voice', voice_id)
+            return True
         except Exception as e:
             logging.error(f"Error setting up female voice: {e}")
             return False
 
     def _read_item_type(self) -> None:
         """Read the type or category of the selected item"""
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             return
 
         try:
             if hasattr(self, "data_table"):
-                selection = self.data_table.selection()
-                if selection:
-                    item_id = selection[0]
-                    item_values = self.data_table.item(item_id, "values")
-                    
+                item_values = self._selected_row_values()
+                if item_values is not None:
                     # Try to determine item type from headers/values
-                    if item_values and hasattr(self, 'headers'):
+                    if item_values:
                         # Look for type-related columns
                         type_info = []
                         for i, header in enumerate(self.headers):
@@ -2781,29 +3485,24 @@ class CrewGUI:
                             text_to_read = f"Item: {item_values[0] if item_values else 'Unknown'}"
                         
                         cleaned_text = self.preprocess_text_for_speech(text_to_read)
-                        chunks = self.chunk_text(cleaned_text)
-                        
-                        for chunk in chunks:
-                            self.tts_engine.say(chunk)
-                        self.tts_engine.runAndWait()
+                        self._speak(*self.chunk_text(cleaned_text))
                     else:
-                        self.tts_engine.say("No item selected or no type information available")
-                        self.tts_engine.runAndWait()
+                        self._speak("No item selected or no type information available")
                 else:
-                    self.tts_engine.say("No item selected")
-                    self.tts_engine.runAndWait()
+                    self._speak("No item selected")
             else:
-                self.tts_engine.say("Data table not available")
-                self.tts_engine.runAndWait()
+                self._speak("Data table not available")
                 
         except Exception as e:
             logging.error(f"Error reading item type: {e}")
 
     def _show_speech_settings(self) -> None:
         """Show TTS configuration dialog with improved sizing"""
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showinfo("TTS Not Available", "Text-to-speech functionality is not available.")
             return
+        if not self._tts_ready(self._show_speech_settings):
+            return
         
         try:
             import tkinter.ttk as ttk
@@ -2834,11 +3533,11 @@ class CrewGUI:
             voice_frame.pack(fill="x", pady=(0, 10))
             
             ttk.Label(voice_frame, text="Available Voices:").pack(anchor="w", pady=(0, 5))
-            voices = self.tts_engine.getProperty('voices')
+            voices = self._tts_voices
             voice_names = [voice.name for voice in voices] if voices else ['Default']
             
             voice_var = tk.StringVar()
-            current_voice = self.tts_engine.getProperty('voice')
+            current_voice = self._tts_props["voice"]
             for voice in voices:
                 if voice.id == current_voice:
                     voice_var.set(voice.name)
@@ -2872,7 +3571,7 @@ class CrewGUI:
             speed_frame.pack(fill="x", pady=(0, 10))
             
             ttk.Label(speed_frame, text="Speaking Speed:").pack(anchor="w")
-            speed_var = tk.IntVar(value=self.tts_engine.getProperty('rate'))
+            speed_var = tk.IntVar(value=self._tts_props["rate"])
             
             speed_control_frame = ttk.Frame(speed_frame)
             speed_control_frame.pack(fill="x", pady=(5, 0))
@@ -2901,7 +3600,7 @@ class CrewGUI:
             volume_frame.pack(fill="x")
             
             ttk.Label(volume_frame, text="Volume:").pack(anchor="w")
-            volume_var = tk.DoubleVar(value=self.tts_engine.getProperty('volume'))
+            volume_var = tk.DoubleVar(value=self._tts_props["volume"])
             
             volume_control_frame = ttk.Frame(volume_frame)
             volume_control_frame.pack(fill="x", pady=(5, 0))
@@ -2931,29 +3630,16 @@ class CrewGUI:
             
             # Test button with better feedback
             def test_voice():
-                try:
-                    settings_window.config(cursor="watch")
-                    settings_window.update()
-                    
-                    # Apply current settings temporarily for test
-                    original_rate = self.tts_engine.getProperty('rate')
-                    original_volume = self.tts_engine.getProperty('volume')
-                    
-                    self.tts_engine.setProperty("rate", int(speed_var.get()))
-                    self.tts_engine.setProperty("volume", volume_var.get())
-                    
-                    test_text = "This is a test of the current speech settings. How does this sound?"
-                    self.tts_engine.say(test_text)
-                    self.tts_engine.runAndWait()
-                    
-                    # Restore original settings
-                    self.tts_engine.setProperty("rate", original_rate)
-                    self.tts_engine.setProperty("volume", original_volume)
-                    
-                except Exception as e:
-                    messagebox.showerror("Test Error", f"Failed to test voice: {e}")
-                finally:
-                    settings_window.config(cursor="")
+                settings_window.config(cursor="watch")
+
+                def done(error):
+                    # The window may have been closed while the test played
+                    if settings_window.winfo_exists():
+                        settings_window.config(cursor="")
+                    if error is not None:
+                        messagebox.showerror("Test Error", f"Failed to test voice: {error}")
+
+                self._preview_tts_settings(int(speed_var.get()), volume_var.get(), done)
         
             test_btn = ttk.Button(
                 button_frame, 
@@ -2975,12 +3661,16 @@ class CrewGUI:
                     voice_mapping[display_name] = voice
 
             def apply_settings():
+                props: Dict[str, Any] = {}
                 try:
                     # Handle voice selection with female preference
                     if female_voice_var.get():
                         # User wants female voice - try to find one
                         logging.info("Attempting to set female voice")
-                        if not self.setup_female_voice(self.tts_engine):
+                        female_voice = self._pick_female_voice(voices)
+                        if female_voice is not None:
+                            props["voice"] = female_voice
+                        else:
                             # No female voice found, show warning
                             messagebox.showwarning(
                                 "Female Voice", 
@@ -2990,7 +3680,7 @@ class CrewGUI:
                             selected_voice = voice_var.get()
                             for voice in voices:
                                 if voice.name == selected_voice:
-                                    self.tts_engine.setProperty("voice", voice.id)
+                                    props["voice"] = voice.id
                                     logging.info(f"Female voice not found, using selected: {voice.name}")
                                     break
                     else:
@@ -2998,17 +3688,18 @@ class CrewGUI:
                         selected_voice = voice_var.get()
                         for voice in voices:
                             if voice.name == selected_voice:
-                                self.tts_engine.setProperty("voice", voice.id)
+                                props["voice"] = voice.id
                                 logging.info(f"Voice set to: {voice.name}")
                                 break
 
-                    # Set speed and volume
-                    self.tts_engine.setProperty("rate", int(speed_var.get()))
-                    self.tts_engine.setProperty("volume", volume_var.get())
+                    # Set speed and volume; the engine picks them up on the
+                    # speech thread, after anything already queued
+                    props["rate"] = int(speed_var.get())
+                    props["volume"] = volume_var.get()
+                    self._set_tts_properties(props)
                     
                     # Save settings
-                    if hasattr(self, 'config'):
-                        self._save_tts_settings()
+                    self._save_tts_settings()
                     
                     settings_window.destroy()
                     self.update_status("Speech settings applied successfully")
@@ -3048,7 +3739,7 @@ class CrewGUI:
 
     def _save_speech_to_file(self) -> None:
         """Save current text content as audio file"""
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showinfo("TTS Not Available", "Text-to-speech functionality is not available.")
             return
         
@@ -3076,44 +3767,68 @@ class CrewGUI:
                 # Preprocess text
                 cleaned_text = self.preprocess_text_for_speech(text_content)
                 
-                # Save to file
-                self.tts_engine.save_to_file(cleaned_text, file_path)
-                self.tts_engine.runAndWait()
-                
-                self.update_status(f"Speech saved to: {os.path.basename(file_path)}")
-                messagebox.showinfo("Success", f"Speech saved to:\n{file_path}")
+                # Save to file on the speech thread, after any queued speech
+                def save(engine) -> Optional[Exception]:
+                    try:
+                        engine.save_to_file(cleaned_text, file_path)
+                        engine.runAndWait()
+                    except Exception as e:
+                        return e
+                    return None
+
+                self.update_status(f"Saving speech to: {os.path.basename(file_path)}...")
+                self._run_on_speech_thread(
+                    save, lambda error: self._on_speech_saved(file_path, error)
+                )
         
         except Exception as e:
             logging.error(f"Error saving speech to file: {e}")
             messagebox.showerror("Save Error", f"Failed to save speech: {e}")
 
+    def _on_speech_saved(self, file_path: str, error: Optional[Exception]) -> None:
+        if error is not None:
+            logging.error(f"Error saving speech to file: {error}")
+            messagebox.showerror("Save Error", f"Failed to save speech: {error}")
+            return
+        self.update_status(f"Speech saved to: {os.path.basename(file_path)}")
+        messagebox.showinfo("Success", f"Speech saved to:\n{file_path}")
+
     def _update_details_view(self, item_data: Optional[Dict[str, Any]]) -> None:
         try:
             if not hasattr(self, "details_text"):
                 return
 
-            # Clear current content
-            self.details_text.delete("1.0", "end")
-
             if item_data and "values" in item_data:
                 values = item_data["values"]
 
-                # Filter visible columns
-                visible_details = []
-                if hasattr(self, "headers") and hasattr(self, "column_visibility"):
-                    for i, header in enumerate(self.headers):
-                        if i < len(values) and self.column_visibility.get(header, True):
-                            visible_details.append(f"{header}: {values[i]}")
+                # Filter visible columns; the "Header: " labels are built once
+                # per header change rather than formatted for every selection
+                visibility = self.column_visibility
+                visible_details = [
+                    prefix + str(value)
+                    for header, prefix, value in zip(self.headers, self._header_prefixes, values)
+                    if visibility.get(header, True)
+                ]
 
                 if visible_details:
-                    self.details_text.insert("1.0", "\n".join(visible_details))
+                    text = "\n".join(visible_details)
                 else:
-                    self.details_text.insert("1.0", "No visible columns to display.")
+                    text = "No visible columns to display."
             else:
-                self.details_text.insert("1.0", "Error displaying details after selection.")
+                text = "Error displaying details after selection."
+
+            # Re-selecting a row (or re-firing the select event) produces the
+            # same text; leave the widget alone instead of rewriting it. Any
+            # other edit to the widget sets Tk's modified flag.
+            if text == self._details_shown and not self.details_text.edit_modified():
+                return
+            # One Tcl call for the delete, insert and flag reset
+            self.details_text.tk.call("apply", _TEXT_REPLACE, self.details_text._w, text)
+            self._details_shown = text
 
         except Exception as e:
             logging.error(f"Error updating details view: {e}")
+            self._details_shown = None
             self.details_text.delete("1.0", "end")
             self.details_text.insert("1.0", "Error displaying details after selection.")
 
@@ -3125,14 +3840,15 @@ class CrewGUI:
 
             if os.path.exists(default_data_path):
                 self.update_status(f"Loading default data from {default_data_path}...")
-                with open(default_data_path, "r", encoding="utf-8") as file:
-                    reader = csv.reader(file)
-                    self.headers = next(reader)  # First row as headers
-                    self.current_data = list(reader)
-                    self._update_data_view(self.current_data)
-                    self.update_status(
-                        f"Loaded {len(self.current_data)} records from {default_data_path}."
-                    )
+                # Parse on the pool like File > Open, so the window paints
+                # without waiting for pandas; _on_data_loaded fills the view
+                self.run_in_background(
+                    self._load_data_background,
+                    default_data_path,
+                    callback=self._on_data_loaded,
+                    key="load",
+                    parallel=True,
+                )
             else:
                 self.update_status("Default data file not found.")
         except Exception as e:
@@ -3145,27 +3861,86 @@ class CrewGUI:
             column_name = self.column_var.get() # This is the header text of the column
 
             # self.current_data should hold the original, unfiltered data
-            if not hasattr(self, 'current_data') or not self.current_data:
+            if not self.current_data:
                 logging.warning("No data loaded to filter.")
                 return
 
-            # Apply the filter
-            # The _apply_filter method expects List[List[Any]]
-            # Ensure self.current_data matches this structure
-            filtered_data = self._apply_filter(self.current_data, filter_text, column_name)
-            
+            # Tk variables are read here; the scan itself runs on the worker
+            # thread. A newer request bumps the generation so older results
+            # arriving late are dropped instead of replacing the view.
+            self._filter_gen += 1
+            self.run_in_background(
+                self._compute_filter,
+                self._filter_gen,
+                self.current_data,
+                filter_text,
+                column_name,
+                self.filter_case_sensitive_var.get(),
+                callback=self._on_filter_computed,
+                key="filter",
+            )
+
+        except Exception as e:
+            logging.error(f"Error applying filter: {e}")
+            messagebox.showerror("Error", f"Failed to apply filter: {e}")
+
+    def _compute_filter(
+        self,
+        gen: int,
+        data: List[List[Any]],
+        filter_text: str,
+        column_name: str,
+        case_sensitive: bool,
+    ) -> Tuple[int, List[List[Any]], Optional[List[List[Any]]]]:
+        """Filter rows on the worker thread, skipping superseded requests."""
+        if gen != self._filter_gen:
+            return gen, data, None
+        return gen, data, self._apply_filter(data, filter_text, column_name, case_sensitive)
+
+    def _on_filter_computed(
+        self, result: Tuple[int, List[List[Any]], Optional[List[List[Any]]]]
+    ) -> None:
+        try:
+            gen, data, filtered_data = result
+            if filtered_data is None or gen != self._filter_gen or data is not self.current_data:
+                return  # Superseded by a newer filter or a new data load
+
             # Update the data view with filtered data
             self._update_data_view(filtered_data) # This method should handle repopulating the Treeview
             self.update_status(f"Filtered data. Displaying {len(filtered_data)} records.")
-
         except Exception as e:
             logging.error(f"Error applying filter: {e}")
             messagebox.showerror("Error", f"Failed to apply filter: {e}")
 
+    def _schedule_filter(self, *args: Any) -> None:
+        """Debounce filter application while the filter text is being typed."""
+        try:
+            self._cancel_scheduled_filter()
+            self._filter_after = self.root.after(150, self._run_scheduled_filter)
+        except Exception as e:
+            logging.error(f"Error scheduling filter: {e}")
+
+    def _cancel_scheduled_filter(self) -> None:
+        if self._filter_after is not None:
+            self.root.after_cancel(self._filter_after)
+            self._filter_after = None
+
+    def _run_scheduled_filter(self) -> None:
+        self._filter_after = None
+        self._on_apply_filter()
+
+    def _focus_filter(self) -> None:
+        """Move keyboard focus to the data filter entry, once it exists."""
+        entry = getattr(self, "filter_entry_widget", None)
+        if entry is not None:
+            entry.focus_set()
+
     def clear_filter(self) -> None:
         try:
             # Clear filter inputs
             self.filter_var.set("")
+            self._cancel_scheduled_filter()  # The view is restored below
+            self._filter_gen += 1  # Drop any filter result still in flight
             self.column_var.set("All Columns")
             self.filter_case_sensitive_var.set(False) # Reset case sensitivity
 
@@ -3173,7 +3948,7 @@ class CrewGUI:
             selection = self.group_list.selection()
             if selection:
                 item_id = selection[0]
-                group_name = self.group_list.item(item_id)["text"]
+                group_name = self._group_name(item_id)
                 if group_name.startswith("Filter"):
                     self.group_list.selection_remove(item_id)
                     # Show full data
@@ -3197,16 +3972,15 @@ class CrewGUI:
             self.update_status("Refreshing views...")
 
             # Refresh data view with current data
-            if hasattr(self, "current_data") and self.current_data:
+            if self.current_data:
                 self._update_data_view(self.current_data)
 
             # Refresh groups view
-            if hasattr(self, "groups") and self.groups:
+            if self.groups:
                 self._update_groups_view()
 
             # Update column menu
-            if hasattr(self, "_update_column_menu"):
-                self._update_column_menu()
+            self._update_column_menu()
 
             self.update_status("Views refreshed")
 
@@ -3214,63 +3988,271 @@ class CrewGUI:
             logging.error(f"Error refreshing views: {e}")
             self.update_status(f"Error refreshing views: {e}")
 
-    def _update_data_view(self, data: List[Any] = None) -> None:
+    def _populate_table_chunked(
+        self, rows: List[List[Any]], i: int = 0, chunk: int = 500
+    ) -> None:
+        """Insert rows into the data table in batches between idle ticks.
+
+        The first batch is inserted immediately; the rest are scheduled with
+        after_idle so the GUI keeps handling events while large data streams
+        in. <<TreeviewPopulated>> is generated once the last row is inserted.
+        """
         try:
-            self.data_table.delete(*self.data_table.get_children())
+            self._populate_job = None
+            end = min(i + chunk, len(rows))
+            self._insert_table_rows(rows, range(i, end), "end")
+            if end < len(rows):
+                if i == 0:
+                    self._suspend_table_scroll_updates()
+                self._populate_job = self.root.after_idle(
+                    self._populate_table_chunked, rows, end, chunk
+                )
+            else:
+                self._resume_table_scroll_updates()
+                self._refresh_column_visibility()
+                self.data_table.event_generate("<<TreeviewPopulated>>")
+        except Exception as e:
+            logging.error(f"Error populating data table: {e}")
 
-            data = data if data is not None else self.current_data
-            if not data:
+    def _insert_table_rows(
+        self, rows: List[List[Any]], indices: range, position: Any
+    ) -> None:
+        """Insert rows[index] for each index as item str(index), in one Tcl call.
+
+        The rows are handed to Tcl as a single list and inserted by a Tcl
+        loop, rather than crossing from Python once per row; this also
+        skips Treeview.insert re-parsing its keyword options every time.
+        Cells are stringified as Treeview.insert does: tk.call would turn a
+        bool into Tcl's 1/0 rather than showing True/False.
+        """
+        items = []
+        for index in indices:
+            items.append(str(index))
+            items.append(tuple(map(str, rows[index])))
+        if items:
+            self.data_table.tk.call(
+                "apply", _TREE_INSERT_BATCH, self.data_table._w, position, tuple(items)
+            )
+
+    def _clear_data_table(self) -> None:
+        """Remove all rows; the item ids never cross into Python."""
+        self.data_table.tk.call("apply", _TREE_CLEAR, self.data_table._w)
+
+    def _cancel_table_population(self) -> None:
+        """Stop any chunked table population or window render still pending."""
+        self._cancel_table_scroll()
+        if self._populate_job is not None:
+            self.root.after_cancel(self._populate_job)
+            self._populate_job = None
+            self._resume_table_scroll_updates()
+
+    def _suspend_table_scroll_updates(self) -> None:
+        """Detach the vertical scrollbar while rows stream into the table.
+
+        Every idle tick between chunks would otherwise recompute and redraw
+        the scrollbar for a row count that is about to change again.
+        """
+        self._suspended_yscroll = self.data_table.cget("yscrollcommand")
+        self.data_table.configure(yscrollcommand="")
+
+    def _resume_table_scroll_updates(self) -> None:
+        if self._suspended_yscroll:
+            # The next redisplay reports the final scroll region to the scrollbar
+            self.data_table.configure(yscrollcommand=self._suspended_yscroll)
+            self._suspended_yscroll = None
+
+    def _get_row(self, index: int) -> List[Any]:
+        """Return the row behind data table item iid str(index)."""
+        return self._current_view_data[index]
+
+    def _selected_row_values(self) -> Optional[List[Any]]:
+        """Return the selected data row from memory, or None if none is selected."""
+        if self._selected_row is None or self._selected_row >= len(self._current_view_data):
+            return None
+        return self._get_row(self._selected_row)
+
+    def _render_table_window(self, top: int) -> None:
+        """Render the slice of the current view around row ``top``.
+
+        Only rows entering the window are inserted and only rows leaving it
+        are deleted; item ids stay the row's index in the view.
+        """
+        rows = self._current_view_data
+        total = len(rows)
+        size = self.TABLE_WINDOW_ROWS
+        lo = max(0, min(top - size // 2, total - size))
+        hi = min(total, lo + size)
+        old_lo, old_hi = self._rendered_range
+        if (lo, hi) != (old_lo, old_hi):
+            stale = [str(i) for i in range(old_lo, old_hi) if i < lo or i >= hi]
+            if stale:
+                self.data_table.delete(*stale)
+            if old_hi <= lo or hi <= old_lo:
+                old_lo = old_hi = hi  # No overlap: the tree is empty, fill from the top
+            # Rows above the kept block go in last-first at index 0: Tk finds
+            # the head of the child list directly, while a numeric index or
+            # "end" walks the siblings on every insert
+            self._insert_table_rows(rows, range(old_lo - 1, lo - 1, -1), 0)
+            self._insert_table_rows(rows, range(max(lo, old_hi), hi), "end")
+            self._rendered_range = (lo, hi)
+            selected = self._selected_row
+            if selected is not None and lo <= selected < hi:
+                self.data_table.selection_set(str(selected))
+        if hi > lo:
+            self.data_table.yview_moveto((min(max(top, lo), hi) - lo) / (hi - lo))
+
+    def _on_table_yscroll(self, first: str, last: str) -> None:
+        """Treeview yscrollcommand: map the rendered window onto the full view."""
+        try:
+            first, last = float(first), float(last)
+            if not self._virtual_table:
+                self.data_y_scroll.set(first, last)
+                return
+            lo, hi = self._rendered_range
+            total = len(self._current_view_data)
+            if hi <= lo or not total:
+                self.data_y_scroll.set(0.0, 1.0)
                 return
+            top = lo + first * (hi - lo)
+            bottom = lo + last * (hi - lo)
+            self.data_y_scroll.set(top / total, bottom / total)
+            near_edge = (lo > 0 and top - lo < self.TABLE_WINDOW_MARGIN) or (
+                hi < total and hi - bottom < self.TABLE_WINDOW_MARGIN
+            )
+            size = self.TABLE_WINDOW_ROWS
+            moves = max(0, min(int(top) - size // 2, total - size)) != lo
+            if near_edge and moves and self._table_window_job is None:
+                self._table_window_job = self.root.after_idle(self._shift_table_window)
+        except Exception as e:
+            logging.error(f"Error updating data table scroll position: {e}")
 
-            # Configure columns
-            columns = [f"col{i}" for i in range(len(self.headers))]
-            self.data_table["columns"] = columns
+    def _shift_table_window(self) -> None:
+        """Re-center the rendered window on the rows currently in view."""
+        try:
+            self._table_window_job = None
+            lo, hi = self._rendered_range
+            top = lo + int(self.data_table.yview()[0] * (hi - lo))
+            self._render_table_window(top)
+        except Exception as e:
+            logging.error(f"Error shifting data table window: {e}")
 
-            # Hide the first empty column
-            self.data_table["show"] = "headings"
+    def _on_table_yview(self, *args: str) -> None:
+        """Vertical scrollbar command for the data table."""
+        try:
+            if self._virtual_table and args and args[0] == "moveto":
+                # Dragging the thumb sends a moveto per motion event: move the
+                # thumb at once, but only render rows once the drag pauses
+                total = len(self._current_view_data)
+                fraction = min(max(float(args[1]), 0.0), 1.0)
+                first, last = self.data_y_scroll.get()
+                self.data_y_scroll.set(fraction, min(1.0, fraction + last - first))
+                self._cancel_table_scroll()
+                self._table_scroll_after = self.root.after(
+                    self.TABLE_SCROLL_SETTLE_MS,
+                    self._settle_table_scroll,
+                    max(0, min(int(fraction * total), total - 1)),
+                )
+            else:
+                self.data_table.yview(*args)
+        except Exception as e:
+            logging.error(f"Error scrolling data table: {e}")
 
-            # Set column headers
-            for col, header in zip(columns, self.headers):
-                self.data_table.heading(col, text=str(header))
-                self.data_table.column(col, width=100)  # Fixed width
+    def _settle_table_scroll(self, top: int) -> None:
+        """Render the window a scrollbar drag came to rest on."""
+        try:
+            self._table_scroll_after = None
+            self._render_table_window(top)
+        except Exception as e:
+            logging.error(f"Error scrolling data table: {e}")
 
-            # Add the data rows
-            for i, row in enumerate(data):
-                self.data_table.insert("", "end", iid=str(i), values=row)
+    def _cancel_table_scroll(self) -> None:
+        if self._table_scroll_after is not None:
+            self.root.after_cancel(self._table_scroll_after)
+            self._table_scroll_after = None
 
-            # Update column menu with current headers
-            self._update_column_menu()
-            self._update_filter_column_dropdown() # Add this line
+    def _update_data_view(self, data: List[Any] = None) -> None:
+        try:
+            self._cancel_table_population()
+            self._clear_data_table()
+
+            data = data if data is not None else self.current_data
+            self._current_view_data = data  # Rows currently shown, used for sorting
+            self._rendered_range = (0, 0)
+            self._selected_row = None
+            if not data:
+                return
+
+            # Configure columns only when the schema changed; filters and
+            # sorts reuse the existing columns, headings and widths
+            configure = self._last_configured_headers != self.headers
+            if configure:
+                self._configure_data_columns()
+            elif self._marked_heading is not None:
+                # Clear the sort arrow; _sort_by_column re-marks it if needed
+                col = self._marked_heading
+                self.data_table.heading(self._columns[col], text=self._base_header_text[col])
+            self._marked_heading = None
+
+            # Add the data rows: very large views render only the rows around
+            # the viewport, others stream in chunks
+            self._virtual_table = len(data) > self.VIRTUAL_TABLE_THRESHOLD
+            if self._virtual_table:
+                self._render_table_window(0)
+                self.data_table.event_generate("<<TreeviewPopulated>>")
+            else:
+                self._populate_table_chunked(data)
+
+            if configure:
+                # Update column menu with current headers
+                self._update_column_menu()
+                self._update_filter_column_dropdown() # Add this line
 
             # Apply current column visibility settings
-            self._apply_column_visibility()
+            self._refresh_column_visibility()
 
         except Exception as e:
             logging.error(f"Error updating data view: {e}")
             raise
 
+    def _configure_data_columns(self) -> None:
+        """Set up data table columns and headings for the current headers."""
+        columns = [f"col{i}" for i in range(len(self.headers))]
+        self.data_table["columns"] = columns
+        # Cache column ids and header text so later lookups stay in Python
+        self._columns = tuple(columns)
+        self._col_index = {col: i for i, col in enumerate(self._columns)}
+        self._display_columns = self._columns
+        self._base_header_text = [str(header) for header in self.headers]
+
+        # Hide the first empty column
+        self.data_table["show"] = "headings"
+
+        # Set column headers
+        for col, header in zip(columns, self.headers):
+            self.data_table.heading(col, text=str(header))
+            self.data_table.column(col, width=100)  # Fixed width
+        self._col_widths = dict.fromkeys(self._columns, 100)
+        self._last_configured_headers = list(self.headers)
+        self._column_visibility_dirty = True  # New columns start out shown
+
     def _update_column_menu(self) -> None:
         try:
-            if not hasattr(self, "column_visibility_menu") or not hasattr(
-                self, "headers"
-            ):
+            if not hasattr(self, "column_visibility_menu"):
                 return
 
             # Clear existing menu items
             self.column_visibility_menu.delete(0, "end")
 
-            # Initialize column visibility tracking if needed
-            if not hasattr(self, "column_visibility"):
-                self.column_visibility = {}
+            # One checkbutton variable per column, defaulting to visible
+            # for headers not tracked yet
+            visibility = self.column_visibility
+            self.column_vars = [
+                tk.BooleanVar(value=visibility.setdefault(header, True))
+                for header in self.headers
+            ]
 
             # Add menu items for each column
-            for i, header in enumerate(self.headers):
-                # Default to visible if not already tracked
-                if header not in self.column_visibility:
-                    self.column_visibility[header] = True
-
-                # Create checkable menu item
-                var = tk.BooleanVar(value=self.column_visibility[header])
+            for header, var in zip(self.headers, self.column_vars):
                 self.column_visibility_menu.add_checkbutton(
                     label=header,
                     variable=var,
@@ -3282,44 +4264,34 @@ class CrewGUI:
         except Exception as e:
             logging.error(f"Error updating column menu: {e}")
 
+    def _refresh_column_visibility(self) -> None:
+        """Apply column visibility only if it changed since it was last applied."""
+        if self._column_visibility_dirty:
+            self._apply_column_visibility()
+
     def _apply_column_visibility(self) -> None:
         try:
-            if (
-                not hasattr(self, "data_table")
-                or not hasattr(self, "column_visibility")
-                or not hasattr(self, "headers")
-            ):
-                return
-
             # Get current table columns
-            columns = self.data_table["columns"]
+            columns = self._columns
             if not columns:
                 return
 
-            # Apply visibility settings
-            for i, header in enumerate(self.headers):
-                if i < len(columns):
-                    col_id = columns[i]
-                    if (
-                        header in self.column_visibility
-                        and not self.column_visibility[header]
-                    ):
-                        self.data_table.column(
-                            col_id, width=0, minwidth=0
-                        )  # Hide column
-                    else:
-                        self.data_table.column(
-                            col_id, width=100, minwidth=50
-                        )  # Show column
+            # Hide columns through displaycolumns: one Tcl call for all of
+            # them, hidden columns are skipped by layout and keep their widths
+            visibility = self.column_visibility
+            self._display_columns = tuple(
+                col_id
+                for col_id, header in zip(columns, self.headers)
+                if visibility.get(header, True)
+            )
+            self.data_table.configure(displaycolumns=self._display_columns)
+            self._column_visibility_dirty = False
 
         except Exception as e:
             logging.error(f"Error applying column visibility: {e}")
 
     def _toggle_column_visibility(self, header: str, var: tk.BooleanVar) -> None:
         try:
-            if not hasattr(self, "column_visibility"):
-                self.column_visibility = {}
-
             # Update visibility state
             self.column_visibility[header] = var.get()
 
@@ -3332,17 +4304,29 @@ class CrewGUI:
     def _on_treeview_configure(
         self, event: tk.Event, original_widths: Dict[int, int]
     ) -> None:
+        """Coalesce Configure events; only the size after a drag settles is applied."""
+        try:
+            if self._resize_after is not None:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(
+                50, self._resize_columns, event.width, original_widths
+            )
+        except Exception as e:
+            logging.error(f"Error during treeview configure: {e}")
+
+    def _resize_columns(self, width: int, original_widths: Dict[int, int]) -> None:
         try:
+            self._resize_after = None
             if not hasattr(self, "last_width"):
-                self.last_width = event.width
+                self.last_width = width
                 return
 
             # Only adjust if width actually changed
-            if event.width == self.last_width:
+            if width == self.last_width:
                 return
 
-            self.last_width = event.width
-            available_width = event.width - 20  # Account for scrollbar and borders
+            self.last_width = width
+            available_width = width - 20  # Account for scrollbar and borders
 
             # Calculate total of original widths
             total_original = sum(original_widths.values())
@@ -3352,90 +4336,264 @@ class CrewGUI:
 
             # Proportionally adjust column widths
             for col_index, original_width in original_widths.items():
-                if col_index < len(self.data_table["columns"]):
-                    col_id = self.data_table["columns"][col_index]
+                if col_index < len(self._columns):
+                    col_id = self._columns[col_index]
                     new_width = max(
                         50, int((original_width / total_original) * available_width)
                     )
                     self.data_table.column(col_id, width=new_width)
+                    self._col_widths[col_id] = new_width
 
         except Exception as e:
             logging.error(f"Error during treeview configure: {e}")
 
+    def _build_filter_index(self, data: Optional[List[List[Any]]] = None) -> None:
+        """Precompute lowercased column strings (column-major) for filtering.
+
+        Built once per data load so each filter pass only does substring
+        checks against ready-made strings instead of str()/lower() per cell.
+        Cached filter results belong to the previous data and are dropped.
+        """
+        data = self.current_data if data is None else data
+        self._filter_index_source = data
+        self._filter_cache = OrderedDict()
+        self._filter_cache_indices = 0
+        self._str_columns = None  # Case-preserving columns, built on first use
+        self._filter_arrays = {}  # (case_sensitive, column) -> NumPy string array
+        self._filter_blobs = {}  # case_sensitive -> joined row strings
+        if not data:
+            self._lc_columns = []
+            return
+        width = max(len(row) for row in data)
+        self._lc_columns = [
+            [str(row[c]).lower() if c < len(row) else "" for row in data]
+            for c in range(width)
+        ]
+
+    def _case_sensitive_columns(self) -> List[List[str]]:
+        """Column-major cell strings for case-sensitive filtering."""
+        if self._str_columns is None:
+            data = self._filter_index_source or []
+            width = len(self._lc_columns)
+            self._str_columns = [
+                [str(row[c]) if c < len(row) else "" for row in data]
+                for c in range(width)
+            ]
+        return self._str_columns
+
     def _apply_filter(
-        self, data: List[List[Any]], filter_text: str, column_name: str
+        self,
+        data: List[List[Any]],
+        filter_text: str,
+        column_name: str,
+        case_sensitive: Optional[bool] = None,
     ) -> List[List[Any]]:
         if not filter_text:
             return data
+        indices = self._match_indices(data, filter_text, column_name, case_sensitive)
+        return [data[i] for i in indices]
+
+    def _match_indices(
+        self,
+        data: List[List[Any]],
+        filter_text: str,
+        column_name: str,
+        case_sensitive: Optional[bool] = None,
+    ) -> List[int]:
+        """Return indices of rows in data matching the filter.
+
+        Results are kept in a small LRU keyed by (column, case, text). A text
+        that extends a cached one only needs to search the cached matches,
+        since adding characters can only narrow the result.
+
+        Pass case_sensitive when calling off the Tk thread, where the
+        checkbox variable must not be read.
+        """
+        if case_sensitive is None:
+            case_sensitive = self.filter_case_sensitive_var.get()
 
-        filtered_data = []
-        case_sensitive = self.filter_case_sensitive_var.get()
+        # Rebuild the lowercase index only when the underlying data changed
+        if self._filter_index_source is not data:
+            self._build_filter_index(data)
 
-        for row in data:
-            if column_name == "All Columns":
-                # Search in all columns
-                if any(
-                    (filter_text in str(cell)) if case_sensitive else (filter_text.lower() in str(cell).lower())
-                    for cell in row
-                ):
-                    filtered_data.append(row)
+        if column_name == "All Columns":
+            col_index = None
+        else:
+            col_index = self._header_index.get(column_name)
+            if col_index is None:
+                return []
+
+        needle = filter_text if case_sensitive else filter_text.lower()
+        key = (col_index, case_sensitive, needle)
+        cache = self._filter_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # Narrow from the longest cached prefix of this text, if any
+        candidates: Any = range(len(data))
+        best_length = -1
+        for (cached_col, cached_case, cached_text), indices in cache.items():
+            if (
+                cached_col == col_index
+                and cached_case == case_sensitive
+                and len(cached_text) > best_length
+                and needle.startswith(cached_text)
+            ):
+                candidates = indices
+                best_length = len(cached_text)
+
+        columns = self._case_sensitive_columns() if case_sensitive else self._lc_columns
+        if col_index is None:
+            if _ROW_BLOB_SEP in needle:
+                # The needle could straddle two cells of a joined row
+                column = None
+                matches = [i for i in candidates if any(needle in col[i] for col in columns)]
             else:
-                # Search in specific column
-                if hasattr(self, "headers") and column_name in self.headers:
-                    col_index = self.headers.index(column_name)
-                    if col_index < len(row):
-                        cell_value = str(row[col_index])
-                        if (filter_text in cell_value) if case_sensitive else (filter_text.lower() in cell_value.lower()):
-                            filtered_data.append(row)
-
-        return filtered_data
+                # One substring search per row over all its cells joined
+                column = self._row_blobs(case_sensitive)
+        elif col_index < len(columns):
+            column = columns[col_index]
+        else:
+            column, matches = None, []
+        if column is not None:
+            if PANDAS_AVAILABLE and (best_length < 0 or len(candidates) >= self.FILTER_VECTOR_MIN):
+                # Full scans and large refinements run the substring search in
+                # NumPy, the latter only over the cached matches
+                matches = self._vectorized_matches(
+                    needle,
+                    (case_sensitive, col_index),
+                    column,
+                    None if best_length < 0 else candidates,
+                )
+            else:
+                matches = [i for i in candidates if needle in column[i]]
+
+        # Bound the cache by entry count and by total indices held, so
+        # broad filters over large data sets cannot pile up; the newest
+        # result is always kept
+        cache[key] = matches
+        self._filter_cache_indices += len(matches)
+        while len(cache) > 1 and (
+            len(cache) > self.FILTER_CACHE_SIZE
+            or self._filter_cache_indices > self.FILTER_CACHE_MAX_INDICES
+        ):
+            _, evicted = cache.popitem(last=False)
+            self._filter_cache_indices -= len(evicted)
+        return matches
+
+    def _vectorized_matches(
+        self,
+        needle: str,
+        array_key: Tuple[bool, Optional[int]],
+        column: List[str],
+        candidates: Optional[List[int]] = None,
+    ) -> List[int]:
+        """Find matching row indices with a vectorized NumPy substring search.
+
+        With candidates, only those rows are searched.
+        """
+        _finish_lazy_imports(np)
+        array = self._filter_arrays.get(array_key)
+        if array is None:
+            array = np.array(column, dtype=str)
+            self._filter_arrays[array_key] = array
+        if candidates is None:
+            return np.flatnonzero(np.char.find(array, needle) >= 0).tolist()
+        rows = np.asarray(candidates, dtype=np.intp)
+        return rows[np.char.find(array[rows], needle) >= 0].tolist()
+
+    def _row_blobs(self, case_sensitive: bool) -> List[str]:
+        """Each row's filter strings joined into one, for all-columns filters."""
+        blobs = self._filter_blobs.get(case_sensitive)
+        if blobs is None:
+            columns = self._case_sensitive_columns() if case_sensitive else self._lc_columns
+            blobs = [_ROW_BLOB_SEP.join(cells) for cells in zip(*columns)]
+            self._filter_blobs[case_sensitive] = blobs
+        return blobs
 
     def _on_column_click(self, event: tk.Event) -> None:
         try:
             region = self.data_table.identify_region(event.x, event.y)
+            # A press on a heading separator starts a column resize drag
+            self._resizing_column = region == "separator"
             if region == "heading":
-                col = self.data_table.identify_column(event.x)
-                col_index = int(col.replace("#", "")) - 1
-                if hasattr(self, "headers") and col_index < len(self.headers):
-                    header = self.headers[col_index]
-                    self._sort_by_column(col_index, header)
+                # "#n" counts displayed columns only; map it back through
+                # displaycolumns to the data column index
+                display_index = int(self.data_table.identify_column(event.x).replace("#", "")) - 1
+                if 0 <= display_index < len(self._display_columns):
+                    col_index = self._col_index[self._display_columns[display_index]]
+                    if col_index < len(self.headers):
+                        self._sort_by_column(col_index, self.headers[col_index])
 
         except Exception as e:
             logging.error(f"Error handling column click: {e}")
 
+    def _on_table_button_release(self, event: tk.Event) -> None:
+        # The drag may end anywhere, so go by where it started, not by what
+        # is under the pointer now
+        try:
+            if self._resizing_column:
+                self._resizing_column = False
+                self._refresh_column_widths()
+        except Exception as e:
+            logging.error(f"Error handling column resize: {e}")
+
+    def _refresh_column_widths(self) -> None:
+        """Read the widths of the shown columns back into the width mirror."""
+        columns = self._display_columns
+        if not columns:
+            return
+        widths = self.data_table.tk.splitlist(
+            self.data_table.tk.call(
+                "apply", _TREE_COLUMN_WIDTHS, self.data_table._w, columns
+            )
+        )
+        for col_id, width in zip(columns, widths):
+            self._col_widths[col_id] = int(width)
+
     def _sort_by_column(self, col_index: int, header: str) -> None:
         try:
             # Toggle sort direction
-            if not hasattr(self, "_sort_column") or self._sort_column != col_index:
+            if self._sort_column != col_index:
                 self._sort_reverse = False
             else:
                 self._sort_reverse = not self._sort_reverse
 
             self._sort_column = col_index
 
-            # Get current data
-            data = []
-            for item in self.data_table.get_children():
-                values = self.data_table.item(item, "values")
-                data.append(list(values))
+            # Sort the rows currently on display in memory rather than reading
+            # every value back out of the Treeview
+            rows = self._current_view_data or []
+
+            # Each key function reads its cell once; the sort calls it once
+            # per row, so an extra helper call per key is measurable
+            def numeric_key(row: List[Any]) -> Any:
+                value = row[col_index] if col_index < len(row) else ""
+                return float(value) if value else 0
+
+            def text_key(row: List[Any]) -> str:
+                return str(row[col_index] if col_index < len(row) else "").lower()
 
-            # Sort data
             try:
                 # Try numeric sort first
-                data.sort(
-                    key=lambda x: float(x[col_index]) if x[col_index] else 0,
-                    reverse=self._sort_reverse,
-                )
+                data = sorted(rows, key=numeric_key, reverse=self._sort_reverse)
             except (ValueError, TypeError):
                 # Fall back to string sort
-                data.sort(
-                    key=lambda x: str(x[col_index]).lower(),
-                    reverse=self._sort_reverse,
-                )
+                data = sorted(rows, key=text_key, reverse=self._sort_reverse)
 
             # Update view
             self._update_data_view(data)
 
+            # Mark the sorted column; the other headings were just reset
+            arrow = " \u25bc" if self._sort_reverse else " \u25b2"
+            if col_index < len(self._columns):
+                self.data_table.heading(
+                    self._columns[col_index],
+                    text=self._base_header_text[col_index] + arrow,
+                )
+                self._marked_heading = col_index
+
             # Update status
             direction = "descending" if self._sort_reverse else "ascending"
             self.update_status(f"Sorted by {header} ({direction})")
@@ -3445,11 +4603,9 @@ class CrewGUI:
 
     def _on_save_file(self) -> None:
         try:
-            # Get current data
-            data = []
-            for item in self.data_table.get_children():
-                values = self.data_table.item(item, "values")
-                data.append(list(values))
+            # Save the rows in the current view; a virtual table only holds
+            # the rows around the viewport
+            data = [list(row) for row in self._current_view_data or []]
 
             if not data:
                 messagebox.showwarning("No Data", "No data available to save.")
@@ -3467,35 +4623,59 @@ class CrewGUI:
             )
 
             if file_path:
-                self._save_data_to_file(data, file_path)
+                # Writing a large table (openpyxl especially) takes seconds;
+                # do it on the pool and report back on the Tk loop
+                self.update_status(f"Saving to {os.path.basename(file_path)}...")
+                self.run_in_background(
+                    self._save_data_background,
+                    data,
+                    list(self.headers),
+                    file_path,
+                    callback=self._on_data_saved,
+                    key="save",
+                    parallel=True,
+                )
 
         except Exception as e:
             logging.error(f"Error in save file dialog: {e}")
             messagebox.showerror("Error", f"Failed to save file: {e}")
 
     def _save_data_to_file(self, data: List[List[Any]], file_path: str) -> None:
+        """Write data under the current headers and report the outcome."""
+        self._on_data_saved(self._save_data_background(data, self.headers, file_path))
+
+    def _save_data_background(
+        self, data: List[List[Any]], headers: List[str], file_path: str
+    ) -> Tuple[str, Optional[Exception]]:
+        """Write the file without touching Tk; returns (file_path, error)."""
         try:
             if PANDAS_AVAILABLE and file_path.endswith(".xlsx"):
-                df = pd.DataFrame(data, columns=self.headers if hasattr(self, 'headers') else None)
+                _finish_lazy_imports(np, pd)
+                df = pd.DataFrame(data, columns=headers)
                 df.to_excel(file_path, index=False)
             elif file_path.endswith(".csv"):
                 with open(file_path, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
-                    if hasattr(self, 'headers'):
-                        writer.writerow(self.headers)
+                    writer.writerow(headers)
                     writer.writerows(data)
             else:
                 # Basic text save for other types or if pandas/csv is not appropriate
                 with open(file_path, "w", encoding="utf-8") as f:
-                    if hasattr(self, 'headers'):
-                        f.write(",".join(map(str, self.headers)) + "\n")
+                    f.write(",".join(map(str, headers)) + "\n")
                     for row in data:
                         f.write(",".join(map(str, row)) + "\n")
-            self.update_status(f"Saved to {file_path}")
+            return file_path, None
         except Exception as e:
             logging.error(f"Error saving to file {file_path}: {e}") # Log error
-            self.root.after(0, lambda e=e: messagebox.showerror("Save Error", str(e))) # Show error to user
-            self.update_status(f"Error saving to {file_path}") # Update status
+            return file_path, e
+
+    def _on_data_saved(self, result: Tuple[str, Optional[Exception]]) -> None:
+        file_path, error = result
+        if error is None:
+            self.update_status(f"Saved to {file_path}")
+            return
+        self.update_status(f"Error saving to {file_path}") # Update status
+        messagebox.showerror("Save Error", str(error)) # Show error to user
 
     def _on_open_file(self) -> None:
         """Handles opening different file types."""
@@ -3524,7 +4704,11 @@ class CrewGUI:
                     if hasattr(self, 'details_text'):
                         self.details_text.delete("1.0", tk.END)  # Clear details view
                     self.run_in_background(
-                        self._load_data_background, file_path, callback=self._on_data_loaded
+                        self._load_data_background,
+                        file_path,
+                        callback=self._on_data_loaded,
+                        key="load",
+                        parallel=True,
                     )
                 elif file_extension in [".txt", ".py", ".md"]:  # Added .md
                     self.update_status(f"Opening text file: {os.path.basename(file_path)}...")
@@ -3532,9 +4716,15 @@ class CrewGUI:
                     self.current_data = None
                     self.headers = []
                     if hasattr(self, 'data_table'):
-                        self.data_table.delete(*self.data_table.get_children())  # Clear data table
+                        self._cancel_table_population()
+                        self._clear_data_table()
+                        self._current_view_data = []
                     self.run_in_background(
-                        self._load_text_background, file_path, callback=self._on_text_loaded_callback
+                        self._load_text_background,
+                        file_path,
+                        callback=self._on_text_loaded_callback,
+                        key="load",
+                        parallel=True,
                     )
                 else:
                     self.update_status(f"Unsupported file type: {file_extension}", error=True)
@@ -3555,11 +4745,23 @@ class CrewGUI:
             selection = self.data_table.selection()  # Get current selection
             if selection:
                 item_id = selection[0]  # Get the first selected item ID
-                item_data = self.data_table.item(item_id)  # Get item details
-                self._update_details_view(item_data)  # Call with actual item data
+                # Item ids are row indices into the current view
+                row = int(item_id)
+                if row == self._selected_row:
+                    return  # Re-selected as the window shifted; details are current
+                self._selected_row = row
+                self._schedule_details_update()
+            elif self._virtual_table and self._selected_row is not None:
+                # The selected row only scrolled out of the rendered window
+                lo, hi = self._rendered_range
+                if not lo <= self._selected_row < hi:
+                    return
+                self._selected_row = None
+                self._update_details_view(None)
             else:
                 # Optionally, clear details view or show a default message if nothing is selected
-                self._update_details_view(None) 
+                self._selected_row = None
+                self._update_details_view(None)
         except Exception as e:
             logging.error(f"Error handling data table selection: {e}")
             # Optionally, update details view with an error message
@@ -3567,6 +4769,47 @@ class CrewGUI:
                 self.details_text.delete("1.0", "end")
                 self.details_text.insert("1.0", f"Error processing selection: {e}")
 
+    def _schedule_details_update(self) -> None:
+        """Rebuild the details view at most once per DETAILS_THROTTLE_MS.
+
+        Holding an arrow key moves the selection faster than the details
+        are worth redrawing; selections inside the gap collapse into one
+        trailing rebuild showing whichever row is selected by then.
+        """
+        if self._details_after is not None:
+            return  # The pending rebuild reads _selected_row when it runs
+        wait_ms = int(
+            (self._details_shown_at - time.monotonic()) * 1000 + self.DETAILS_THROTTLE_MS
+        )
+        if wait_ms <= 0:
+            self._flush_details_update()
+        else:
+            self._details_after = self.root.after(wait_ms, self._flush_details_update)
+
+    def _flush_details_update(self) -> None:
+        try:
+            self._details_after = None
+            self._details_shown_at = time.monotonic()
+            values = self._selected_row_values()
+            self._update_details_view(None if values is None else {"values": values})
+        except Exception as e:
+            logging.error(f"Error updating details view: {e}")
+
+    def _on_script_menu_post(self) -> None:
+        """Rebuild the Run Script submenu only if the scripts folder changed.
+
+        Adding, removing or renaming a script updates the folder's mtime;
+        "Refresh Scripts" still forces a rebuild.
+        """
+        try:
+            stamp = os.stat(self.scripts_dir).st_mtime_ns
+        except (AttributeError, TypeError, OSError):
+            stamp = None
+        if stamp is not None and stamp == self._script_menu_stamp:
+            return
+        self._update_script_menu()
+        self._script_menu_stamp = stamp
+
     def _update_script_menu(self) -> None:
         logging.info("Updating script menu as it is about to be displayed...")
         if not hasattr(self, 'script_menu') or not isinstance(self.script_menu, tk.Menu):
@@ -3699,6 +4942,8 @@ class CrewGUI:
             data, headers = result
             self.current_data = data
             self.headers = headers
+            # The filter index is only touched by the worker thread
+            self.run_in_background(self._build_filter_index, data, key="filter_index")
             self._update_data_view(data)
             self._update_column_menu()
             self.update_status(f"Loaded {len(data)} records")
@@ -3722,7 +4967,9 @@ class CrewGUI:
                 status = f"Loaded: {os.path.basename(self.current_file_path)}" if hasattr(self, 'current_file_path') else "Text content loaded."
                 self.update_status(status)
             if hasattr(self, 'data_table'):
-                self.data_table.delete(*self.data_table.get_children())
+                self._cancel_table_population()
+                self._clear_data_table()
+            self._current_view_data = []
             self.current_data = None
             self.headers = []
             self._update_column_menu() 
@@ -3737,39 +4984,114 @@ class CrewGUI:
             if not PANDAS_AVAILABLE:
                 # Fallback to CSV reading without pandas
                 if file_path.lower().endswith('.csv'):
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                    with open(
+                        file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20
+                    ) as f:
                         reader = csv.reader(f)
                         headers = next(reader)
                         data = list(reader)
-                        return data, headers
                 else:
                     raise ImportError("Pandas is required to load Excel files.")
-        
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()
-            
-            if ext == '.csv':
-                df = pd.read_csv(file_path)
-            elif ext in ['.xlsx', '.xls']:
-                try:
-                    df = pd.read_excel(file_path)
-                except Exception:
-                    # Try with specific engine
-                    engine = 'openpyxl' if ext == '.xlsx' else 'xlrd'
-                    df = pd.read_excel(file_path, engine=engine)
             else:
-                raise ValueError(f"Unsupported file extension: {ext}")
-            
-            # Convert to lists for compatibility
-            data = df.values.tolist()
-            headers = df.columns.tolist()
-            
+                _finish_lazy_imports(np, pd)
+                _, ext = os.path.splitext(file_path)
+                ext = ext.lower()
+
+                if ext == '.csv':
+                    data, headers = self._read_csv_typed(file_path)
+                elif ext in ['.xlsx', '.xls']:
+                    try:
+                        df = pd.read_excel(file_path)
+                    except Exception:
+                        # Try with specific engine
+                        engine = 'openpyxl' if ext == '.xlsx' else 'xlrd'
+                        df = pd.read_excel(file_path, engine=engine)
+                    # Convert to lists for compatibility
+                    data = df.values.tolist()
+                    headers = df.columns.tolist()
+                else:
+                    raise ValueError(f"Unsupported file extension: {ext}")
+
+            _share_repeated_values(data)
             return data, headers
         
         except Exception as e:
             logging.error(f"Error loading data in background: {e}")
             raise
 
+    def _read_csv_typed(self, file_path: str) -> Tuple[List[List[Any]], List[str]]:
+        """Read a CSV with pandas' C parser, reusing remembered column dtypes.
+
+        Dtypes are remembered per file with its mtime and size, and handed
+        to _store_type_hints on the main thread via root.after. Later loads
+        of the unchanged file skip type inference and read it in chunks of
+        CSV_CHUNK_ROWS rows, converting each to lists as it arrives rather
+        than holding a whole DataFrame alongside the rows. Empty cells stay
+        empty strings, matching the stdlib csv reader.
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        entry = self.config.get("csv_column_types", {}).get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            and entry.get("types")
+        ):
+            try:
+                data: List[List[Any]] = []
+                headers: List[str] = []
+                with pd.read_csv(
+                    file_path,
+                    dtype=entry["types"],
+                    keep_default_na=False,
+                    engine="c",
+                    chunksize=self.CSV_CHUNK_ROWS,
+                ) as reader:
+                    for chunk in reader:
+                        headers = chunk.columns.tolist()
+                        data.extend(chunk.values.tolist())
+                if headers:
+                    self.root.after(0, self._store_type_hints, key, entry)
+                    return data, headers
+            except (ValueError, TypeError) as e:
+                # Hints no longer fit the file
+                logging.info(f"Stale column type hints for {file_path}: {e}")
+        # The first load infers dtypes from the whole file in one read, so a
+        # column is not typed differently from one chunk to the next
+        df = self._read_csv_inferred(file_path)
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "types": {str(column): str(dtype) for column, dtype in df.dtypes.items()},
+        }
+        self.root.after(0, self._store_type_hints, key, entry)
+        return df.values.tolist(), df.columns.tolist()
+
+    def _read_csv_inferred(self, file_path: str) -> "pd.DataFrame":
+        """Read a whole CSV, parsing with pyarrow when it is installed."""
+        if ARROW_AVAILABLE:
+            try:
+                return pd.read_csv(file_path, keep_default_na=False, engine="pyarrow")
+            except (ImportError, ValueError, TypeError) as e:
+                # Older pandas, or a file the Arrow parser rejects
+                logging.info(f"pyarrow CSV parse failed for {file_path}: {e}")
+        return pd.read_csv(file_path, keep_default_na=False)
+
+    def _store_type_hints(self, key: str, entry: Dict[str, Any]) -> None:
+        """Remember a file's column dtypes, keeping the most recent CSV_TYPE_HINTS_MAX."""
+        try:
+            type_hints = dict(self.config.get("csv_column_types", {}))
+            if type_hints and next(reversed(type_hints)) == key and type_hints[key] == entry:
+                return  # Already the newest entry
+            type_hints.pop(key, None)
+            type_hints[key] = entry
+            for stale in list(type_hints)[:-self.CSV_TYPE_HINTS_MAX]:
+                del type_hints[stale]
+            self.config.set("csv_column_types", type_hints)
+        except Exception as e:
+            logging.error(f"Error saving column type hints: {e}")
+
     def _load_text_background(self, file_path: str) -> str:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -3790,11 +5112,12 @@ class CrewGUI:
     def _save_tts_settings(self) -> None:
         """Save current TTS settings to configuration"""
         try:
-            if hasattr(self, 'tts_engine') and self.tts_engine:
+            # Read from the mirror; the engine belongs to the speech thread
+            if self._tts_props:
                 tts_settings = {
-                    'voice': self.tts_engine.getProperty('voice'),
-                    'rate': self.tts_engine.getProperty('rate'),
-                    'volume': self.tts_engine.getProperty('volume')
+                    'voice': self._tts_props['voice'],
+                    'rate': self._tts_props['rate'],
+                    'volume': self._tts_props['volume']
                 }
                 self.config.set('tts_settings', tts_settings)
                 logging.info("TTS settings saved successfully")
@@ -3804,26 +5127,25 @@ class CrewGUI:
     def _load_tts_settings(self) -> None:
         """Load TTS settings from configuration"""
         try:
-            if hasattr(self, 'tts_engine') and self.tts_engine:
+            if self.tts_available:
                 tts_settings = self.config.get('tts_settings', {})
-                if tts_settings:
-                    if 'voice' in tts_settings:
-                        self.tts_engine.setProperty('voice', tts_settings['voice'])
-                    if 'rate' in tts_settings:
-                        self.tts_engine.setProperty('rate', tts_settings['rate'])
-                    if 'volume' in tts_settings:
-                        self.tts_engine.setProperty('volume', tts_settings['volume'])
+                props = {
+                    name: tts_settings[name]
+                    for name in ('voice', 'rate', 'volume')
+                    if name in tts_settings
+                }
+                if props:
+                    self._set_tts_properties(props)
                     logging.info("TTS settings loaded successfully")
         except Exception as e:
             logging.error(f"Error loading TTS settings: {e}")
 
     def _test_tts(self) -> None:
-        if not TTS_AVAILABLE or not self.tts_engine:
+        if not self.tts_available:
             messagebox.showerror("TTS Error", "Text-to-speech functionality is not available.")
             return
         try:
-            self.tts_engine.say("This is a test of the text-to-speech system.")
-            self.tts_engine.runAndWait()
+            self._speak("This is a test of the text-to-speech system.")
         except Exception as e:
             logging.error(f"TTS test error: {e}")
             messagebox.showerror("TTS Error", f"Failed to test TTS: {e}")
@@ -3833,16 +5155,27 @@ class CrewGUI:
         try:
             # Clear existing groups in the treeview
             if hasattr(self, 'group_list'):
-                self.group_list.delete(*self.group_list.get_children())
+                self.group_list.tk.call("apply", _TREE_CLEAR, self.group_list._w)
+            self._group_names = {}
             
-            # Add groups to the treeview
-            if hasattr(self, 'groups') and self.groups:
-                for group_name, group_data in self.groups.items():
-                    item_count = len(group_data) if isinstance(group_data, list) else 0
-                    display_text = f"{group_name} ({item_count} items)"
-                    self.group_list.insert("", "end", text=group_name, values=[display_text])
+            # Add groups to the treeview in name order: derive every item
+            # first, then insert them all in one Tcl call
+            if self.groups:
+                items = []
+                names = self._group_names
+                for i, (group_name, group_data) in enumerate(sorted(self.groups.items())):
+                    item_id = f"group{i}"
+                    names[item_id] = group_name
+                    items.extend((
+                        item_id,
+                        str(group_name),
+                        (f"{group_name} ({len(group_data) if isinstance(group_data, list) else 0} items)",),
+                    ))
+                self.group_list.tk.call(
+                    "apply", _TREE_INSERT_TEXT_BATCH, self.group_list._w, tuple(items)
+                )
             
-            logging.info(f"Updated groups view with {len(self.groups) if hasattr(self, 'groups') else 0} groups")
+            logging.info(f"Updated groups view with {len(self.groups)} groups")
             
         except Exception as e:
             logging.error(f"Error updating groups view: {e}")
@@ -35,7 +35,8 @@ class StateManager:
             min_window_size = self.config.get("min_window_size")
             if min_window_size:
                 try:
-                    width, height = map(int, min_window_size.split("x"))
+                    width, _, height = min_window_size.partition("x")
+                    width, height = int(width), int(height)
                     self.root.minsize(width, height)
                     logging.debug(f"Restored minimum window size: {width}x{height}")
                 except ValueError as e:
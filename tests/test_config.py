@@ -124,6 +124,38 @@ class TestConfig(unittest.TestCase):
         log_level = config.get("log_level")
         self.assertEqual(log_level, "INFO")
 
+    def test_bulk_set_saves_once(self):
+        """Setting several values together should write the file once."""
+        config = Config(config_dir=self.test_dir)
+        with patch.object(config, "save_config") as save:
+            config.bulk_set({"window_size": "900x700", "auto_save": False})
+        save.assert_called_once_with()
+        self.assertEqual(config.snapshot()["window_size"], "900x700")
+        self.assertFalse(config.get("auto_save"))
+
+    def test_bulk_set_skips_invalid_values(self):
+        """Values with the wrong type should be skipped like set()."""
+        config = Config(config_dir=self.test_dir)
+        config.bulk_set({"backup_count": "many", "theme": "dark"})
+        self.assertEqual(config.get("backup_count"), 5)
+        self.assertEqual(Config(config_dir=self.test_dir).get("theme"), "dark")
+
+    def test_bulk_set_unchanged_values_skip_write(self):
+        """Saving values identical to the stored ones should not touch the file."""
+        config = Config(config_dir=self.test_dir)
+        with patch.object(config, "save_config") as save:
+            config.bulk_set({"window_size": "800x800", "column_widths": {}})
+        save.assert_not_called()
+
+    def test_window_geometry_parsing(self):
+        """Stored sizes parse with or without offsets; bad values give None."""
+        config = Config(config_dir=self.test_dir)
+        self.assertEqual(config.get_window_geometry(), (800, 800, 0, 0))
+        config.config["window_size"] = "1024x768+10-20"
+        self.assertEqual(config.get_window_geometry(), (1024, 768, 10, -20))
+        config.config["window_size"] = "1024x"
+        self.assertIsNone(config.get_window_geometry())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -162,6 +162,7 @@ class TestGUIModule(unittest.TestCase):
                 continue
 
         self.assertIsNotNone(tts_menu, "TTS menu not found in menu bar.")
+        tts_menu.tk.eval(tts_menu.cget("postcommand"))  # Built when first opened
 
         # Retrieve labels from the TTS menu
         tts_labels = []
@@ -0,0 +1,350 @@
+#!/usr/bin/python3
+"""Tests for workspace auto-import behavior in the GUI."""
+
+import builtins
+import importlib.machinery
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gui
+from gui import CrewGUI
+
+
+class TestFinalizeImports(unittest.TestCase):
+    """Verify results from the background auto-import are applied."""
+
+    def test_finalize_imports_stores_results_and_updates_status(self):
+        """The worker callback should store the lists and report counts."""
+        app = CrewGUI.__new__(CrewGUI)
+        app.update_status = MagicMock()
+
+        app._finalize_imports((["alpha", "beta"], [("gamma.py", "Import error: x")]))
+
+        self.assertEqual(app.imported_modules, ["alpha", "beta"])
+        self.assertEqual(app.failed_imports, [("gamma.py", "Import error: x")])
+        app.update_status.assert_called_once_with(
+            "Ready - Auto-imported 2 modules (1 failed)"
+        )
+
+    def test_auto_import_results_marshalled_to_tk_thread(self):
+        """The auto-import thread should hand results back through root.after."""
+        app = CrewGUI.__new__(CrewGUI)
+        app.root = MagicMock()
+        result = (["alpha"], [])
+        with patch.object(gui, "auto_import_py_files", return_value=result):
+            app._do_auto_import()
+        app.root.after.assert_called_once_with(0, app._finalize_imports, result)
+
+    def test_failed_auto_import_still_finalizes(self):
+        """An unexpected error should still finalize with empty results."""
+        app = CrewGUI.__new__(CrewGUI)
+        app.root = MagicMock()
+        with patch.object(gui, "auto_import_py_files", side_effect=RuntimeError("boom")):
+            app._do_auto_import()
+        app.root.after.assert_called_once_with(0, app._finalize_imports, ([], []))
+
+
+class TestImportCache(unittest.TestCase):
+    """Verify the auto-import cache signature tracks workspace changes."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.module_path = os.path.join(self.tmpdir.name, "module.py")
+        with open(self.module_path, "w") as f:
+            f.write("VALUE = 1\n")
+        self.signature = self.current_signature()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def current_signature(self):
+        files = gui._scan_py_files(self.tmpdir.name)
+        return gui._workspace_signature(gui._stat_py_files(files))
+
+    def test_unchanged_files_keep_signature(self):
+        """Matching stats should allow the cached results to be reused."""
+        self.assertEqual(self.current_signature(), self.signature)
+
+    def test_modified_file_changes_signature(self):
+        """A changed mtime should force a fresh scan."""
+        mtime = os.stat(self.module_path).st_mtime
+        os.utime(self.module_path, (mtime + 10, mtime + 10))
+        self.assertNotEqual(self.current_signature(), self.signature)
+
+    def test_removed_file_changes_signature(self):
+        """A cached path that no longer exists should force a fresh scan."""
+        os.remove(self.module_path)
+        self.assertNotEqual(self.current_signature(), self.signature)
+
+    def test_added_file_changes_signature(self):
+        """A new module anywhere in the workspace should force a fresh scan."""
+        os.makedirs(os.path.join(self.tmpdir.name, "pkg"))
+        with open(os.path.join(self.tmpdir.name, "pkg", "extra.py"), "w") as f:
+            f.write("")
+        self.assertNotEqual(self.current_signature(), self.signature)
+
+
+class TestLazyImport(unittest.TestCase):
+    """Verify optional libraries are only executed when first used."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmpdir.name, "crew_optional_lib.py"), "w") as f:
+            f.write("import builtins\nbuiltins.crew_optional_ran = True\nVALUE = 7\n")
+        sys.path.insert(0, self.tmpdir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmpdir.name)
+        sys.modules.pop("crew_optional_lib", None)
+        if hasattr(builtins, "crew_optional_ran"):
+            del builtins.crew_optional_ran
+        self.tmpdir.cleanup()
+
+    def test_module_runs_on_first_attribute_access(self):
+        """The module is registered at once but executed on first use."""
+        module = gui._lazy_import("crew_optional_lib")
+        self.assertIs(sys.modules["crew_optional_lib"], module)
+        self.assertFalse(hasattr(builtins, "crew_optional_ran"))
+        self.assertEqual(module.VALUE, 7)
+        self.assertTrue(builtins.crew_optional_ran)
+
+    def test_missing_module_returns_none(self):
+        """An uninstalled library should report as unavailable."""
+        self.assertIsNone(gui._lazy_import("crew_no_such_library"))
+        self.assertNotIn("crew_no_such_library", sys.modules)
+
+    def test_concurrent_first_use_sees_finished_module(self):
+        """No thread should see a lazy module before its body has finished."""
+        with open(os.path.join(self.tmpdir.name, "crew_slow_lib.py"), "w") as f:
+            f.write("import time\ntime.sleep(0.05)\nVALUE = 3\n")
+        try:
+            module = gui._lazy_import("crew_slow_lib")
+            seen = []
+
+            def use_module():
+                gui._finish_lazy_imports(module, None)
+                seen.append(getattr(module, "VALUE", None))
+
+            threads = [threading.Thread(target=use_module) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(seen, [3, 3, 3, 3])
+        finally:
+            sys.modules.pop("crew_slow_lib", None)
+
+class TestScanPyFiles(unittest.TestCase):
+    """Verify the workspace walk prunes excluded directories."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = self.tmpdir.name
+        for rel in ("a.py", "pkg/b.py", "pkg/notes.txt", "venv/lib/c.py", ".hidden/d.py"):
+            path = os.path.join(root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_excluded_and_hidden_dirs_not_entered(self):
+        """Only .py files outside pruned directories are returned."""
+        root = self.tmpdir.name
+        files = gui._scan_py_files(root)
+        self.assertEqual(
+            sorted(files), [os.path.join(root, "a.py"), os.path.join(root, "pkg", "b.py")]
+        )
+
+    def test_environment_prefixes_not_entered(self):
+        """Virtual environments are pruned by location, not only by name."""
+        root = self.tmpdir.name
+        with patch.object(gui, "_ENV_PREFIXES", (os.path.join(root, "pkg", ""),)):
+            self.assertEqual(gui._scan_py_files(root), [os.path.join(root, "a.py")])
+            # ...unless the workspace itself lives inside the environment
+            pkg = os.path.join(root, "pkg")
+            self.assertEqual(gui._scan_py_files(pkg), [os.path.join(pkg, "b.py")])
+
+
+class TestAutoImportScan(unittest.TestCase):
+    """Run auto_import_py_files against a small temporary workspace."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        with open("crew_plugin_alpha.py", "w") as f:
+            f.write("VALUE = 1\n")
+        with open("crew_plugin_script.py", "w") as f:
+            f.write("import sys\nprint(sys.argv)\n")
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        sys.modules.pop("crew_plugin_alpha", None)
+        self.tmpdir.cleanup()
+
+    def test_imports_modules_and_skips_scripts(self):
+        """Plain modules are imported; script-like files are skipped."""
+        imported, failed = gui.auto_import_py_files()
+        self.assertEqual(imported, ["crew_plugin_alpha"])
+        self.assertEqual(failed, [])
+        self.assertIn("crew_plugin_alpha", sys.modules)
+
+    def test_module_body_runs_on_first_attribute_access(self):
+        """Imported modules are registered lazily and executed when used."""
+        with open("crew_plugin_lazy.py", "w") as f:
+            f.write("import builtins\nbuiltins.crew_lazy_ran = True\nVALUE = 3\n")
+        try:
+            imported, _ = gui.auto_import_py_files()
+            self.assertIn("crew_plugin_lazy", imported)
+            self.assertFalse(hasattr(builtins, "crew_lazy_ran"))
+            self.assertEqual(sys.modules["crew_plugin_lazy"].VALUE, 3)
+            self.assertTrue(builtins.crew_lazy_ran)
+        finally:
+            sys.modules.pop("crew_plugin_lazy", None)
+            if hasattr(builtins, "crew_lazy_ran"):
+                del builtins.crew_lazy_ran
+
+    def test_syntax_errors_reported_at_scan_time(self):
+        """Deferring execution must not hide files that do not compile."""
+        with open("crew_plugin_broken.py", "w") as f:
+            f.write("def broken(:\n")
+        _, failed = gui.auto_import_py_files()
+        self.assertEqual([path for path, _ in failed], ["crew_plugin_broken.py"])
+        self.assertNotIn("crew_plugin_broken", sys.modules)
+
+    def test_current_bytecode_skips_compile_check(self):
+        """Files with up-to-date bytecode are not compiled again on a rescan."""
+        with patch.object(sys, "dont_write_bytecode", False):
+            gui.auto_import_py_files()
+        sys.modules.pop("crew_plugin_alpha", None)
+        with open("crew_plugin_delta.py", "w") as f:
+            f.write("VALUE = 4\n")
+        compiled = []
+        get_code = importlib.machinery.SourceFileLoader.get_code
+
+        def record(loader, name):
+            compiled.append(name)
+            return get_code(loader, name)
+
+        try:
+            with patch.object(importlib.machinery.SourceFileLoader, "get_code", record):
+                imported, _ = gui.auto_import_py_files()
+        finally:
+            sys.modules.pop("crew_plugin_delta", None)
+        self.assertEqual(imported, ["crew_plugin_alpha", "crew_plugin_delta"])
+        self.assertEqual(compiled, ["crew_plugin_delta"])
+
+    def test_skip_reasons_logged_once_per_scan(self):
+        """Skipped files are summarized by reason in a single log record."""
+        with open("crew_demo.py", "w") as f:
+            f.write("VALUE = 1\n")
+        with self.assertLogs(level="INFO") as logs:
+            gui.auto_import_py_files()
+        reasons = [line for line in logs.output if "skip reasons" in line]
+        self.assertEqual(len(reasons), 1)
+        self.assertIn("'name pattern': 1", reasons[0])
+        self.assertIn("'contains script patterns': 1", reasons[0])
+
+    def test_already_loaded_module_reported_as_cached(self):
+        """Modules already in sys.modules are not executed again."""
+        sentinel = MagicMock()
+        sys.modules["crew_plugin_alpha"] = sentinel
+        imported, _ = gui.auto_import_py_files()
+        self.assertEqual(imported, ["crew_plugin_alpha (cached)"])
+        self.assertIs(sys.modules["crew_plugin_alpha"], sentinel)
+
+    def test_file_names_are_screened_and_sanitized(self):
+        """Skipped name patterns are not imported; odd characters become underscores."""
+        for name in ("crew plugin-gamma.py", "crew_unittest_helpers.py", "crew_demo.py"):
+            with open(name, "w") as f:
+                f.write("VALUE = 1\n")
+        try:
+            imported, _ = gui.auto_import_py_files()
+        finally:
+            sys.modules.pop("crew_plugin_gamma", None)
+        self.assertEqual(sorted(imported), ["crew_plugin_alpha", "crew_plugin_gamma"])
+
+    def test_nested_files_get_dotted_module_names(self):
+        """Files in subdirectories are named after their relative path."""
+        os.mkdir("crewpkg")
+        with open(os.path.join("crewpkg", "crew_plugin_nested.py"), "w") as f:
+            f.write("VALUE = 1\n")
+        try:
+            imported, _ = gui.auto_import_py_files()
+        finally:
+            sys.modules.pop("crewpkg.crew_plugin_nested", None)
+        self.assertEqual(imported, ["crew_plugin_alpha", "crewpkg.crew_plugin_nested"])
+
+    def test_pooled_prescreen_keeps_import_order(self):
+        """Prescreening in threads must not change which modules import, or their order."""
+        names = [f"crew_plugin_pool{i}" for i in range(3)]
+        for name in names:
+            with open(f"{name}.py", "w") as f:
+                f.write("VALUE = 1\n")
+        try:
+            with patch.object(gui, "_PRESCREEN_POOL_MIN", 0):
+                imported, _ = gui.auto_import_py_files()
+        finally:
+            for name in names:
+                sys.modules.pop(name, None)
+        self.assertEqual(imported, ["crew_plugin_alpha"] + names)
+
+    def test_repeat_scan_served_from_session_memo(self):
+        """A second scan with nothing changed should not touch the cache file."""
+        first = gui.auto_import_py_files()
+        with patch.object(gui, "_load_import_cache") as load_cache:
+            self.assertEqual(gui.auto_import_py_files(), first)
+        load_cache.assert_not_called()
+
+    def test_corrupt_cache_triggers_fresh_scan(self):
+        """An unreadable cache file should be ignored rather than fail the scan."""
+        with open(".auto_import_cache.pkl", "wb") as f:
+            f.write(b"not a pickle")
+        imported, _ = gui.auto_import_py_files()
+        self.assertEqual(imported, ["crew_plugin_alpha"])
+
+    def test_cache_hit_restores_modules_lazily(self):
+        """A cached scan in a new session registers modules without running them."""
+        gui.auto_import_py_files()
+        sys.modules.pop("crew_plugin_alpha")
+        with patch.dict(gui._IMPORT_SCAN_MEMO, clear=True):
+            imported, _ = gui.auto_import_py_files()
+        self.assertEqual(imported, ["crew_plugin_alpha"])
+        module = sys.modules["crew_plugin_alpha"]
+        # Read the namespace without the attribute access that runs the body
+        self.assertNotIn("VALUE", object.__getattribute__(module, "__dict__"))
+        self.assertEqual(module.VALUE, 1)
+
+    def test_session_memo_invalidated_by_new_file(self):
+        """Adding a module should trigger a fresh scan."""
+        gui.auto_import_py_files()
+        with open("crew_plugin_beta.py", "w") as f:
+            f.write("VALUE = 2\n")
+        imported, _ = gui.auto_import_py_files()
+        sys.modules.pop("crew_plugin_beta", None)
+        self.assertIn("crew_plugin_beta", imported)
+
+    def test_cache_records_content_skipped_files(self):
+        """Files rejected by the content check are remembered in the cache."""
+        gui.auto_import_py_files()
+        with open(".auto_import_cache.pkl", "rb") as f:
+            cache_data = pickle.load(f)
+        self.assertEqual(
+            list(cache_data["content_skipped"]),
+            [os.path.join(os.getcwd(), "crew_plugin_script.py")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,569 @@
+#!/usr/bin/python3
+"""Tests for populating the GUI data table."""
+
+import os
+import sys
+import tempfile
+import tkinter
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gui
+from gui import CrewGUI
+
+
+class TestChunkedPopulation(unittest.TestCase):
+    """Verify large tables are streamed into the Treeview in batches."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.root.after_idle.return_value = "idle#1"
+        self.app.data_table = MagicMock()
+        self.app._apply_column_visibility = MagicMock()
+        self.app._populate_job = None
+        self.app._table_scroll_after = None
+        self.app._suspended_yscroll = None
+        self.app._column_visibility_dirty = True
+        self.rows = [[str(i)] for i in range(5)]
+
+    def test_first_chunk_inserted_and_rest_scheduled(self):
+        """Only the first chunk should be inserted synchronously."""
+        self.app._populate_table_chunked(self.rows, chunk=2)
+        self.app.data_table.tk.call.assert_called_once_with(
+            "apply", gui._TREE_INSERT_BATCH, self.app.data_table._w, "end",
+            ("0", ("0",), "1", ("1",)),
+        )
+        self.app.root.after_idle.assert_called_once_with(
+            self.app._populate_table_chunked, self.rows, 2, 2
+        )
+        self.assertEqual(self.app._populate_job, "idle#1")
+        self.app.data_table.event_generate.assert_not_called()
+        self.app.data_table.configure.assert_called_once_with(yscrollcommand="")
+
+    def test_scrollbar_reattached_after_last_chunk(self):
+        """The scrollbar command detached while streaming should be restored."""
+        self.app.data_table.cget.return_value = "scroll_set"
+        self.app._populate_table_chunked(self.rows, chunk=3)
+        self.app._populate_table_chunked(self.rows, i=3, chunk=3)
+        self.app.data_table.configure.assert_called_with(yscrollcommand="scroll_set")
+        self.assertIsNone(self.app._suspended_yscroll)
+
+    def test_last_chunk_signals_population_complete(self):
+        """The final chunk should fire <<TreeviewPopulated>>."""
+        self.app._populate_table_chunked(self.rows, i=4, chunk=2)
+        self.app.data_table.tk.call.assert_called_once_with(
+            "apply", gui._TREE_INSERT_BATCH, self.app.data_table._w, "end", ("4", ("4",))
+        )
+        self.app.data_table.event_generate.assert_called_once_with(
+            "<<TreeviewPopulated>>"
+        )
+        self.assertIsNone(self.app._populate_job)
+
+    def test_cancel_pending_population(self):
+        """A pending chunk should be cancelled before the table is rebuilt."""
+        self.app._populate_job = "idle#1"
+        self.app._cancel_table_population()
+        self.app.root.after_cancel.assert_called_once_with("idle#1")
+        self.assertIsNone(self.app._populate_job)
+
+
+class TestColumnConfiguration(unittest.TestCase):
+    """Verify columns are only reconfigured when the headers change."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.headers = ["Name", "Role"]
+        self.app.current_data = [["Alice", "Pilot"], ["Bob", "Medic"]]
+        self.app.data_table = MagicMock()
+        self.app.data_table.get_children.return_value = ()
+        self.app._populate_job = None
+        self.app._table_scroll_after = None
+        self.app._suspended_yscroll = None
+        self.app._last_configured_headers = None
+        self.app._marked_heading = None
+        for name in ("_populate_table_chunked", "_update_column_menu",
+                     "_update_filter_column_dropdown", "_apply_column_visibility"):
+            setattr(self.app, name, MagicMock())
+
+    def test_same_headers_skip_reconfiguration(self):
+        """Refreshing rows under unchanged headers should not touch headings."""
+        self.app._update_data_view()
+        self.app.data_table.heading.reset_mock()
+        self.app._update_data_view(self.app.current_data[:1])
+        self.app.data_table.heading.assert_not_called()
+        self.app._update_column_menu.assert_called_once_with()
+
+    def test_new_headers_reconfigure(self):
+        """A different schema should rebuild the columns."""
+        self.app._update_data_view()
+        self.app.headers = ["Name", "Age"]
+        self.app._update_data_view([["Zed", "50"]])
+        self.app.data_table.heading.assert_called_with("col1", text="Age")
+        self.assertEqual(self.app._update_column_menu.call_count, 2)
+
+    def test_visibility_applied_only_when_changed(self):
+        """Refreshing rows should not re-send unchanged column visibility."""
+        del self.app._apply_column_visibility  # Use the real method
+        self.app.column_visibility = {}
+        self.app._column_visibility_dirty = True
+        self.app._update_data_view()
+        self.app.data_table.configure.assert_called_once_with(displaycolumns=("col0", "col1"))
+        self.app.data_table.configure.reset_mock()
+        self.app._update_data_view(self.app.current_data[:1])
+        self.app.data_table.configure.assert_not_called()
+
+    def test_toggle_hides_column_through_displaycolumns(self):
+        """Hiding a column should be one displaycolumns update, not width changes."""
+        del self.app._apply_column_visibility  # Use the real method
+        self.app.column_visibility = {}
+        self.app._update_data_view()
+        self.app.data_table.column.reset_mock()
+        self.app._toggle_column_visibility("Name", MagicMock(get=MagicMock(return_value=False)))
+        self.app.data_table.configure.assert_called_with(displaycolumns=("col1",))
+        self.app.data_table.column.assert_not_called()
+        self.assertFalse(self.app.column_visibility["Name"])
+
+    def test_heading_click_maps_displayed_column(self):
+        """A click on the first shown heading should sort by that data column."""
+        self.app._col_index = {"col0": 0, "col1": 1}
+        self.app._display_columns = ("col1",)
+        self.app.data_table.identify_region.return_value = "heading"
+        self.app.data_table.identify_column.return_value = "#1"
+        self.app._sort_by_column = MagicMock()
+        self.app._on_column_click(MagicMock(x=10, y=5))
+        self.app._sort_by_column.assert_called_once_with(1, "Role")
+
+    def test_column_menu_keeps_one_var_per_header(self):
+        """The Columns menu variables are kept in header order."""
+        del self.app._update_column_menu  # Use the real method
+        self.app.column_visibility_menu = MagicMock()
+        self.app.column_visibility = {"Role": False}
+        with patch("gui.tk.BooleanVar", side_effect=lambda value: value):
+            self.app._update_column_menu()
+        self.assertEqual(self.app.column_vars, [True, False])
+        self.assertEqual(self.app.column_visibility, {"Role": False, "Name": True})
+
+    def test_sort_marker_cleared_on_refresh(self):
+        """A stale sort arrow should be removed when the rows are replaced."""
+        self.app._update_data_view()
+        self.app._marked_heading = 1
+        self.app._update_data_view()
+        self.app.data_table.heading.assert_called_with("col1", text="Role")
+        self.assertIsNone(self.app._marked_heading)
+
+
+    def test_save_uses_width_mirror(self):
+        """Saving window state should not query the table for widths."""
+        self.app._update_data_view()
+        self.app.data_table.column.reset_mock()
+        self.app.config = MagicMock()
+        self.app.column_visibility = {}
+        self.app.save_window_state()
+        self.app.data_table.column.assert_not_called()
+        saved = self.app.config.bulk_set.call_args[0][0]
+        self.assertEqual(saved["column_widths"], {"col0": 100, "col1": 100})
+
+    def test_separator_release_reads_widths_in_one_call(self):
+        """Ending a resize drag anywhere should refresh the mirror from the table."""
+        tcl = tkinter.Tcl()
+        widths = {"col0": "140", "col1": "60"}
+        tcl.createcommand(".tree", lambda command, col, option: widths[col])
+        self.app.data_table.tk = MagicMock(splitlist=tcl.splitlist)
+        self.app.data_table.tk.call.side_effect = tcl.call
+        self.app.data_table._w = ".tree"
+        self.app.data_table.identify_region.side_effect = ["separator", "cell"]
+        self.app._display_columns = ("col0", "col1")
+        self.app._col_widths = {"col0": 100, "col1": 100}
+        self.app._on_column_click(MagicMock(x=100, y=5))
+        self.app._on_table_button_release(MagicMock(x=180, y=40))  # Released off the heading
+        self.assertEqual(self.app.data_table.tk.call.call_count, 1)
+        self.assertEqual(self.app._col_widths, {"col0": 140, "col1": 60})
+
+    def test_plain_click_release_leaves_widths(self):
+        """A click that did not start on a separator should not read widths."""
+        self.app.data_table.identify_region.return_value = "cell"
+        self.app._on_column_click(MagicMock(x=10, y=40))
+        self.app._on_table_button_release(MagicMock(x=10, y=40))
+        self.app.data_table.tk.call.assert_not_called()
+
+    def test_saved_widths_only_touch_changed_columns(self):
+        """Columns already at their saved width should not be reconfigured."""
+        self.app._columns = ("col0", "col1")
+        self.app._col_index = {"col0": 0, "col1": 1}
+        self.app._col_widths = {"col0": 120, "col1": 100}
+        self.app._saved_column_widths = {"col0": 120, "col1": 80, "gone": 50}
+        self.app._apply_saved_column_widths()
+        self.app.data_table.column.assert_called_once_with("col1", width=80)
+        self.assertEqual(self.app._col_widths, {"col0": 120, "col1": 80})
+        self.app._apply_saved_column_widths()  # Repopulate with nothing to change
+        self.assertEqual(self.app.data_table.column.call_count, 1)
+
+
+class TestResizeDebounce(unittest.TestCase):
+    """Verify column widths are recomputed once per burst of resizes."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.root.after.side_effect = ["after#1", "after#2"]
+        self.app.data_table = MagicMock()
+        self.app._resize_after = None
+        self.app._columns = ("col0", "col1")
+        self.app._col_widths = {}
+        self.widths = {0: 100, 1: 300}
+
+    def test_configure_burst_schedules_one_resize(self):
+        """Each Configure event should replace the pending resize."""
+        self.app._on_treeview_configure(MagicMock(width=500), self.widths)
+        self.app._on_treeview_configure(MagicMock(width=520), self.widths)
+        self.app.root.after_cancel.assert_called_once_with("after#1")
+        self.app.root.after.assert_called_with(50, self.app._resize_columns, 520, self.widths)
+        self.app.data_table.column.assert_not_called()
+
+    def test_resize_scales_columns_proportionally(self):
+        """The settled width should be shared in the original proportions."""
+        self.app.last_width = 400
+        self.app._resize_columns(420, self.widths)
+        self.app.data_table.column.assert_any_call("col0", width=100)
+        self.app.data_table.column.assert_any_call("col1", width=300)
+        self.assertEqual(self.app._col_widths, {"col0": 100, "col1": 300})
+
+
+class FakeTree:
+    """Minimal stand-in for the Treeview calls used by windowed rendering.
+
+    Tcl calls run in a real interpreter, where the widget command records
+    each insert, so the batched insert script itself is exercised.
+    """
+
+    _w = ".tree"
+
+    def __init__(self):
+        self.children = []
+        self.positions = []  # Index argument of each insert
+        self.values = {}  # iid -> cell strings as Tcl received them
+        self._tcl = tkinter.Tcl()
+        self._tcl.createcommand(self._w, self._widget_command)
+        self.tk = MagicMock()
+        self.tk.call.side_effect = self._tcl.call
+        self.selection_set = MagicMock()
+        self.yview_moveto = MagicMock()
+
+    def _widget_command(self, command, parent, index, _id_opt, iid, _values_opt, values):
+        self.positions.append(index)
+        self.values[iid] = self._tcl.splitlist(values)
+        position = len(self.children) if index == "end" else int(index)
+        self.children.insert(position, iid)
+
+    def delete(self, *iids):
+        self.children = [iid for iid in self.children if iid not in iids]
+
+
+class TestVirtualTable(unittest.TestCase):
+    """Verify only a window of rows is rendered for large views."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.data_table = FakeTree()
+        self.app.data_y_scroll = MagicMock()
+        self.app.root = MagicMock()
+        self.app._current_view_data = [[str(i)] for i in range(1000)]
+        self.app._rendered_range = (0, 0)
+        self.app._selected_row = None
+        self.app._virtual_table = True
+        self.app._table_window_job = None
+        self.app._table_scroll_after = None
+
+    def rendered(self):
+        return [int(iid) for iid in self.app.data_table.children]
+
+    def test_initial_window_starts_at_top(self):
+        """The first render should hold the first TABLE_WINDOW_ROWS rows."""
+        self.app._render_table_window(0)
+        self.assertEqual(self.rendered(), list(range(CrewGUI.TABLE_WINDOW_ROWS)))
+
+    def test_shifting_window_keeps_rows_in_order(self):
+        """Moving the window only swaps rows at its edges, keeping order."""
+        size = CrewGUI.TABLE_WINDOW_ROWS
+        self.app._render_table_window(0)
+        self.app._render_table_window(300)
+        self.assertEqual(self.rendered(), list(range(300 - size // 2, 300 + size // 2)))
+        self.app._render_table_window(250)
+        self.assertEqual(self.rendered(), list(range(250 - size // 2, 250 + size // 2)))
+
+    def test_cells_shown_as_python_strings(self):
+        """Bools should show as True/False, as Treeview.insert would, not Tcl's 1/0."""
+        self.app._current_view_data = [["x", True, 1.5], ["y", False, 2]]
+        self.app._render_table_window(0)
+        self.assertEqual(self.app.data_table.values["0"], ("x", "True", "1.5"))
+        self.assertEqual(self.app.data_table.values["1"], ("y", "False", "2"))
+
+    def test_rows_above_window_inserted_at_head(self):
+        """Rows added above the kept block should all go in at index 0."""
+        self.app._render_table_window(300)
+        self.app.data_table.positions.clear()
+        self.app.data_table.tk.call.reset_mock()
+        self.app._render_table_window(250)
+        self.assertEqual(set(self.app.data_table.positions), {"0"})
+        self.assertEqual(self.app.data_table.tk.call.call_count, 1)  # One batch
+
+    def drag_to(self, fraction):
+        self.app.data_y_scroll.get.return_value = (0.0, 0.02)
+        self.app._on_table_yview("moveto", fraction)
+
+    def test_window_clamped_at_end(self):
+        """Jumping past the end should render the last full window."""
+        self.drag_to("1.0")
+        func, *args = self.app.root.after.call_args[0][1:]
+        func(*args)
+        size = CrewGUI.TABLE_WINDOW_ROWS
+        self.assertEqual(self.rendered(), list(range(1000 - size, 1000)))
+
+    def test_scrollbar_drag_renders_once_it_settles(self):
+        """Each drag step moves the thumb; only the last one renders rows."""
+        self.app.root.after.side_effect = ["after#1", "after#2"]
+        self.drag_to("0.3")
+        self.drag_to("0.5")
+        self.assertEqual(self.rendered(), [])
+        self.app.data_y_scroll.set.assert_called_with(0.5, 0.52)
+        self.app.root.after_cancel.assert_called_once_with("after#1")
+        self.app.root.after.assert_called_with(
+            CrewGUI.TABLE_SCROLL_SETTLE_MS, self.app._settle_table_scroll, 500
+        )
+        self.app._settle_table_scroll(500)
+        self.assertIn(500, self.rendered())
+        self.assertIsNone(self.app._table_scroll_after)
+
+    def test_scrollbar_reflects_whole_view(self):
+        """Scroll fractions of the window are mapped onto the full view."""
+        self.app._rendered_range = (100, 300)
+        self.app._on_table_yscroll("0.5", "0.6")
+        self.app.data_y_scroll.set.assert_called_once_with(0.2, 0.22)
+        self.app.root.after_idle.assert_not_called()
+
+    def test_nearing_window_edge_schedules_shift(self):
+        """Scrolling close to the window edge should re-center the window."""
+        self.app._rendered_range = (100, 300)
+        self.app._on_table_yscroll("0.0", "0.05")
+        self.app.root.after_idle.assert_called_once_with(self.app._shift_table_window)
+
+    def test_selected_values_read_from_memory(self):
+        """The selected row should come from the view data, even off-window."""
+        self.app._selected_row = 900
+        self.assertEqual(self.app._selected_row_values(), ["900"])
+        self.app._selected_row = None
+        self.assertIsNone(self.app._selected_row_values())
+
+    def test_selection_restored_when_row_returns(self):
+        """A selected row re-entering the window should be selected again."""
+        self.app._selected_row = 5
+        self.app._render_table_window(0)
+        self.app.data_table.selection_set.assert_called_once_with("5")
+
+
+class TestClearDataTable(unittest.TestCase):
+    """Verify the table is emptied in a single Tcl call."""
+
+    def test_all_items_deleted_inside_tcl(self):
+        """Children are listed and deleted by Tcl, not passed through Python."""
+        tcl = tkinter.Tcl()
+        tcl.eval(
+            "set ::items {0 1 2}\n"
+            "proc .tree {cmd args} {\n"
+            "  if {$cmd eq \"children\"} {return $::items}\n"
+            "  set ::deleted $args; set ::items {}\n"
+            "}"
+        )
+        app = CrewGUI.__new__(CrewGUI)
+        app.data_table = MagicMock(_w=".tree")
+        app.data_table.tk.call.side_effect = tcl.call
+        app._clear_data_table()
+        self.assertEqual(app.data_table.tk.call.call_count, 1)
+        (deleted,) = tcl.splitlist(tcl.getvar("deleted"))  # One item-list argument
+        self.assertEqual(tcl.splitlist(deleted), ("0", "1", "2"))
+        self.assertEqual(tcl.getvar("items"), "")
+
+
+class TestSelectionThrottle(unittest.TestCase):
+    """Verify rapid selection changes collapse into few details rebuilds."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.data_table = MagicMock()
+        self.app.root = MagicMock()
+        self.app.root.after.return_value = "after#1"
+        self.app._current_view_data = [["Alice"], ["Bob"], ["Carol"]]
+        self.app._selected_row = None
+        self.app._details_after = None
+        self.app._details_shown_at = 0.0
+        self.app._update_details_view = MagicMock()
+
+    def select(self, row):
+        self.app.data_table.selection.return_value = (str(row),)
+        self.app._on_data_table_select(MagicMock())
+
+    def test_burst_gets_one_trailing_update(self):
+        """Selections inside the throttle gap should share one rebuild."""
+        self.select(0)
+        self.app._update_details_view.assert_called_once_with({"values": ["Alice"]})
+        self.select(1)
+        self.select(2)
+        self.app.root.after.assert_called_once()
+        self.assertEqual(self.app._update_details_view.call_count, 1)
+        self.app._flush_details_update()  # The trailing after() fires
+        self.app._update_details_view.assert_called_with({"values": ["Carol"]})
+
+    def test_reselected_row_skips_rebuild(self):
+        """The window shift re-selecting the shown row should not redraw it."""
+        self.select(1)
+        self.app._details_shown_at = 0.0
+        self.select(1)
+        self.assertEqual(self.app._update_details_view.call_count, 1)
+
+
+class TestDetailsView(unittest.TestCase):
+    """Verify the details pane is only rewritten when its text changes."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.headers = ["Name", "Role"]
+        self.app.column_visibility = {"Role": False}
+        self.tcl = tkinter.Tcl()
+        self.tcl.eval(
+            "set ::written {}; set ::modified 1\n"
+            "proc .details {cmd args} {\n"
+            "  if {$cmd eq \"replace\"} {lappend ::written [lindex $args 2]}\n"
+            "  if {$cmd eq \"edit\"} {set ::modified [lindex $args 1]}\n"
+            "}"
+        )
+        self.app.details_text = MagicMock(_w=".details")
+        self.app.details_text.tk.call.side_effect = self.tcl.call
+        self.app.details_text.edit_modified.return_value = False
+        self.app._details_shown = None
+
+    def written(self):
+        return self.tcl.splitlist(self.tcl.getvar("written"))
+
+    def test_visible_columns_written(self):
+        """Hidden columns should be left out of the details text."""
+        self.app._update_details_view({"values": ["Alice", "Pilot"]})
+        self.assertEqual(self.written(), ("Name: Alice",))
+        self.assertEqual(self.tcl.getvar("modified"), "0")
+        self.assertEqual(self.app.details_text.tk.call.call_count, 1)
+
+    def test_same_row_not_rewritten(self):
+        """Showing the same details twice should touch the widget once."""
+        self.app._update_details_view({"values": ["Alice", "Pilot"]})
+        self.app._update_details_view({"values": ["Alice", "Pilot"]})
+        self.assertEqual(len(self.written()), 1)
+
+    def test_edited_widget_is_rewritten(self):
+        """Text changed elsewhere should be replaced on the next selection."""
+        self.app._update_details_view({"values": ["Alice", "Pilot"]})
+        self.app.details_text.edit_modified.return_value = True
+        self.app._update_details_view({"values": ["Alice", "Pilot"]})
+        self.assertEqual(len(self.written()), 2)
+
+
+class TestTypedCsvLoading(unittest.TestCase):
+    """Verify CSV loads remember column dtypes between runs."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmpdir.name, "crew.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("Name,Age,Notes\nAlice,30,\nBob,41,NA\n")
+        self.stored = {}
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.config = MagicMock()
+        self.app.config.get.side_effect = lambda key, default=None: self.stored.get(key, default)
+        self.app.config.set.side_effect = self.stored.__setitem__
+        self.app.root = MagicMock()
+        self.app.root.after.side_effect = lambda ms, func, *args: func(*args)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_first_load_learns_and_stores_type_hints(self):
+        """Dtypes inferred on first load should be persisted to the config."""
+        data, headers = self.app._load_data_background(self.csv_path)
+        self.assertEqual(headers, ["Name", "Age", "Notes"])
+        self.assertEqual(data, [["Alice", 30, ""], ["Bob", 41, "NA"]])
+        entry = self.stored["csv_column_types"][os.path.abspath(self.csv_path)]
+        stat = os.stat(self.csv_path)
+        self.assertEqual(entry["types"]["Age"], "int64")
+        self.assertEqual((entry["mtime_ns"], entry["size"]), (stat.st_mtime_ns, stat.st_size))
+
+    def test_hinted_load_reads_in_chunks(self):
+        """A load with stored hints should stream chunks into the same rows."""
+        first = self.app._load_data_background(self.csv_path)
+        with patch.object(CrewGUI, "CSV_CHUNK_ROWS", 1), patch.object(
+            self.app, "_read_csv_inferred"
+        ) as inferred:
+            self.assertEqual(self.app._load_data_background(self.csv_path), first)
+        inferred.assert_not_called()
+
+    def test_arrow_parse_failure_falls_back_to_c_parser(self):
+        """Loading should still work when the pyarrow engine is unusable."""
+        frame = gui.pd.read_csv(self.csv_path, keep_default_na=False)
+        with patch.object(gui, "ARROW_AVAILABLE", True), patch.object(
+            gui.pd, "read_csv", side_effect=[ImportError("no pyarrow"), frame]
+        ) as read_csv:
+            data, _ = self.app._load_data_background(self.csv_path)
+        self.assertEqual(read_csv.call_args_list[0].kwargs["engine"], "pyarrow")
+        self.assertEqual(data, [["Alice", 30, ""], ["Bob", 41, "NA"]])
+
+    def test_repeated_values_share_one_string(self):
+        """Low-cardinality columns should reuse one object per distinct value."""
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("Name,Role\n")
+            for i in range(1200):
+                f.write(f"Crew{i},{'Pilot' if i % 2 else 'Medic'}\n")
+        for pandas_available in (True, False):
+            with patch.object(gui, "PANDAS_AVAILABLE", pandas_available):
+                data, _ = self.app._load_data_background(self.csv_path)
+            self.assertEqual(len({id(row[1]) for row in data}), 2)
+            self.assertEqual(data[3], ["Crew3", "Pilot"])
+
+    def test_stale_hints_fall_back_to_inference(self):
+        """Hints that no longer fit the file should not break loading."""
+        stat = os.stat(self.csv_path)
+        key = os.path.abspath(self.csv_path)
+        self.stored["csv_column_types"] = {
+            key: {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "types": {"Name": "int64"}}
+        }
+        data, _ = self.app._load_data_background(self.csv_path)
+        self.assertEqual(data[0][0], "Alice")
+        self.assertNotEqual(self.stored["csv_column_types"][key]["types"]["Name"], "int64")
+
+    def test_hints_for_a_changed_file_are_ignored(self):
+        """A file rewritten since its hints were stored should be re-inferred."""
+        self.app._load_data_background(self.csv_path)
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("Name,Age,Notes\nAlice,thirty,\nBob,41,NA\n")
+        data, _ = self.app._load_data_background(self.csv_path)
+        self.assertEqual(data[0][1], "thirty")
+        entry = self.stored["csv_column_types"][os.path.abspath(self.csv_path)]
+        self.assertEqual(entry["size"], os.stat(self.csv_path).st_size)
+        self.assertNotEqual(entry["types"]["Age"], "int64")
+
+    def test_hint_table_keeps_most_recent_files(self):
+        """Only the most recently loaded CSV_TYPE_HINTS_MAX files keep hints."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = os.path.join(self.tmpdir.name, f"{name}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Name\nAlice\n")
+            paths.append(os.path.abspath(path))
+        with patch.object(CrewGUI, "CSV_TYPE_HINTS_MAX", 2):
+            for path in (paths[0], paths[1], paths[0], paths[2]):
+                self.app._load_data_background(path)
+        self.assertEqual(list(self.stored["csv_column_types"]), [paths[0], paths[2]])
+
+if __name__ == "__main__":
+    unittest.main()
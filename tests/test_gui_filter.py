@@ -0,0 +1,243 @@
+#!/usr/bin/python3
+"""Tests for data filtering in the GUI."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gui
+from gui import CrewGUI
+
+
+def make_app(data, headers, case_sensitive=False):
+    """Create a CrewGUI instance without building any widgets."""
+    app = CrewGUI.__new__(CrewGUI)
+    with patch.object(gui.tk, "BooleanVar", MagicMock):  # No Tk root here
+        app.setup_state()
+    app.headers = headers
+    app.current_data = data
+    app.filter_case_sensitive_var = MagicMock()
+    app.filter_case_sensitive_var.get.return_value = case_sensitive
+    return app
+
+
+class TestApplyFilter(unittest.TestCase):
+    """Verify _apply_filter results for the supported modes."""
+
+    def setUp(self):
+        self.headers = ["Name", "Role", "Age"]
+        self.data = [
+            ["Alice", "Pilot", 30],
+            ["Bob", "Engineer", 41],
+            ["Carol", "pilot", 25],
+            ["Dave", "Medic"],
+        ]
+
+    def test_empty_filter_returns_all_rows(self):
+        """An empty filter should not remove any rows."""
+        app = make_app(self.data, self.headers)
+        self.assertEqual(app._apply_filter(self.data, "", "All Columns"), self.data)
+
+    def test_single_column_is_case_insensitive_by_default(self):
+        """Column filters should ignore case unless requested otherwise."""
+        app = make_app(self.data, self.headers)
+        result = app._apply_filter(self.data, "PILOT", "Role")
+        self.assertEqual(result, [self.data[0], self.data[2]])
+
+    def test_all_columns_matches_non_string_cells(self):
+        """All-columns filters should match numeric cells by their text."""
+        app = make_app(self.data, self.headers)
+        self.assertEqual(app._apply_filter(self.data, "41", "All Columns"), [self.data[1]])
+
+    def test_short_rows_do_not_match_missing_cells(self):
+        """Rows without a value for the column should be excluded."""
+        app = make_app(self.data, self.headers)
+        self.assertEqual(app._apply_filter(self.data, "2", "Age"), [self.data[2]])
+
+    def test_case_sensitive_filter(self):
+        """Case-sensitive mode should only match the exact case."""
+        app = make_app(self.data, self.headers, case_sensitive=True)
+        self.assertEqual(app._apply_filter(self.data, "pilot", "Role"), [self.data[2]])
+
+    def test_case_sensitive_all_columns(self):
+        """Case-sensitive all-columns filters should respect case in every cell."""
+        app = make_app(self.data, self.headers, case_sensitive=True)
+        self.assertEqual(app._apply_filter(self.data, "P", "All Columns"), [self.data[0]])
+
+    def test_all_columns_does_not_match_across_cells(self):
+        """Text spanning the end of one cell and the start of the next is no match."""
+        app = make_app(self.data, self.headers)
+        self.assertEqual(app._apply_filter(self.data, "ep", "All Columns"), [])
+        self.assertEqual(app._apply_filter(self.data, "e\x1fp", "All Columns"), [])
+
+    def test_index_rebuilt_when_data_changes(self):
+        """Replacing the data set should invalidate the lowercase index."""
+        app = make_app(self.data, self.headers)
+        app._apply_filter(self.data, "alice", "Name")
+        new_data = [["Zed", "Cook", 50]]
+        app.current_data = new_data
+        self.assertEqual(app._apply_filter(new_data, "zed", "Name"), new_data)
+
+    def test_header_index_follows_header_changes(self):
+        """Column lookups should use the current headers after reassignment."""
+        app = make_app(self.data, self.headers)
+        app.headers = ["Role", "Name", "Age"]
+        self.assertEqual(app._header_index["Name"], 1)
+        self.assertEqual(app._apply_filter(self.data, "bob", "Name"), [])
+        self.assertEqual(app._apply_filter(self.data, "bob", "Role"), [self.data[1]])
+
+
+class TestFilterCache(unittest.TestCase):
+    """Verify filter results are cached and refined incrementally."""
+
+    def setUp(self):
+        self.headers = ["Name", "Role"]
+        self.data = [["Alice", "Pilot"], ["Alan", "Medic"], ["Bob", "Pilot"]]
+        self.app = make_app(self.data, self.headers)
+
+    def test_repeated_filter_served_from_cache(self):
+        """The same filter should not rescan the data."""
+        first = self.app._match_indices(self.data, "al", "Name")
+        self.app._lc_columns = None  # Any rescan would now fail
+        self.assertIs(self.app._match_indices(self.data, "al", "Name"), first)
+
+    def test_longer_text_refines_cached_prefix(self):
+        """Extending the text should only search the previous matches."""
+        self.assertEqual(self.app._match_indices(self.data, "a", "Name"), [0, 1])
+        self.app._lc_columns[0][2] = "bal"  # Outside the cached "a" matches
+        self.assertEqual(self.app._match_indices(self.data, "al", "Name"), [0, 1])
+
+    def test_cache_is_bounded(self):
+        """The cache should evict the least recently used entries."""
+        for i in range(CrewGUI.FILTER_CACHE_SIZE + 5):
+            self.app._match_indices(self.data, f"x{i}", "Name")
+        self.assertEqual(len(self.app._filter_cache), CrewGUI.FILTER_CACHE_SIZE)
+
+    def test_cache_bounded_by_total_indices(self):
+        """Large results should be evicted once the index budget is exceeded."""
+        with patch.object(CrewGUI, "FILTER_CACHE_MAX_INDICES", 3):
+            self.app._match_indices(self.data, "a", "Name")  # 2 indices
+            self.app._match_indices(self.data, "i", "Role")  # 3 more
+        self.assertEqual(list(self.app._filter_cache), [(1, False, "i")])
+        self.assertEqual(self.app._filter_cache_indices, 3)
+
+    def test_new_data_clears_cache(self):
+        """Cached results must not leak into a different data set."""
+        self.app._match_indices(self.data, "al", "Name")
+        new_data = [["Alf", "Cook"]]
+        self.assertEqual(self.app._apply_filter(new_data, "al", "Name"), new_data)
+
+
+@unittest.skipUnless(gui.PANDAS_AVAILABLE, "NumPy not available")
+class TestVectorizedFilter(unittest.TestCase):
+    """Verify the NumPy scan agrees with the pure-Python scan."""
+
+    def setUp(self):
+        self.headers = ["Name", "Role", "Age"]
+        self.data = [["Alice", "Pilot", 30], ["Bob", "pilot"], ["Carol", "Medic", 25]]
+
+    def python_matches(self, text, column, case_sensitive=False):
+        app = make_app(self.data, self.headers, case_sensitive)
+        gui.PANDAS_AVAILABLE = False
+        try:
+            return app._match_indices(self.data, text, column)
+        finally:
+            gui.PANDAS_AVAILABLE = True
+
+    def test_matches_python_scan(self):
+        """Both scans should return the same row indices."""
+        for text, column, case_sensitive in [
+            ("pilot", "Role", False),
+            ("Pilot", "Role", True),
+            ("2", "All Columns", False),
+            ("a", "All Columns", True),
+            ("5", "Age", False),
+        ]:
+            app = make_app(self.data, self.headers, case_sensitive)
+            self.assertEqual(
+                app._match_indices(self.data, text, column),
+                self.python_matches(text, column, case_sensitive),
+            )
+
+    def test_refinement_matches_python_scan(self):
+        """Refining cached matches in NumPy should agree with the Python scan."""
+        app = make_app(self.data, self.headers)
+        with patch.object(CrewGUI, "FILTER_VECTOR_MIN", 0):
+            app._match_indices(self.data, "a", "All Columns")
+            refined = app._match_indices(self.data, "al", "All Columns")
+        self.assertEqual(refined, self.python_matches("al", "All Columns"))
+        self.assertEqual(refined, [0])
+
+
+class TestBackgroundFilter(unittest.TestCase):
+    """Verify filter passes run on the worker and stale results are dropped."""
+
+    def setUp(self):
+        self.data = [["Alice", "Pilot"], ["Bob", "Medic"]]
+        self.app = make_app(self.data, ["Name", "Role"])
+        self.app.filter_var = MagicMock()
+        self.app.filter_var.get.return_value = "bob"
+        self.app.column_var = MagicMock()
+        self.app.column_var.get.return_value = "All Columns"
+        self.app.run_in_background = MagicMock()
+        self.app._update_data_view = MagicMock()
+        self.app.update_status = MagicMock()
+
+    def run_pending(self):
+        func, *args = self.app.run_in_background.call_args[0]
+        return func(*args)
+
+    def test_filter_dispatched_to_worker(self):
+        """Applying a filter should not touch the view until the result arrives."""
+        self.app._on_apply_filter()
+        self.app._update_data_view.assert_not_called()
+        self.app._on_filter_computed(self.run_pending())
+        self.app._update_data_view.assert_called_once_with([self.data[1]])
+
+    def test_superseded_result_is_discarded(self):
+        """A result from an older request must not replace a newer view."""
+        self.app._on_apply_filter()
+        stale = self.run_pending()
+        self.app._on_apply_filter()
+        self.app._on_filter_computed(stale)
+        self.app._update_data_view.assert_not_called()
+
+    def test_result_for_replaced_data_is_discarded(self):
+        """Loading new data should invalidate filters computed on the old rows."""
+        self.app._on_apply_filter()
+        result = self.run_pending()
+        self.app.current_data = [["Zed", "Cook"]]
+        self.app._on_filter_computed(result)
+        self.app._update_data_view.assert_not_called()
+
+
+class TestFilterDebounce(unittest.TestCase):
+    """Verify typing in the filter box schedules a single filter pass."""
+
+    def setUp(self):
+        self.app = make_app([], [])
+        self.app.root = MagicMock()
+        self.app.root.after.side_effect = ["after#1", "after#2"]
+
+    def test_repeated_typing_cancels_previous_schedule(self):
+        """Each keystroke should replace the pending filter callback."""
+        self.app._schedule_filter()
+        self.app._schedule_filter()
+        self.app.root.after_cancel.assert_called_once_with("after#1")
+        self.assertEqual(self.app._filter_after, "after#2")
+
+    def test_scheduled_filter_applies_filter(self):
+        """The debounced callback should run the filter and clear the id."""
+        self.app._on_apply_filter = MagicMock()
+        self.app._filter_after = "after#1"
+        self.app._run_scheduled_filter()
+        self.app._on_apply_filter.assert_called_once_with()
+        self.assertIsNone(self.app._filter_after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""Tests for the GUI groups list."""
+
+import sys
+import tkinter
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui import CrewGUI
+
+
+class TestGroupNames(unittest.TestCase):
+    """Verify group names are resolved without reading items back from Tk."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.groups = {"Pilots": [["Alice"]], "Medics": [["Bob"], ["Carol"]]}
+        self.tcl = tkinter.Tcl()
+        self.tcl.eval(
+            "set ::inserted {}\n"
+            "proc .groups {cmd args} {\n"
+            "  if {$cmd eq \"children\"} {return {}}\n"
+            "  if {$cmd eq \"insert\"} {lappend ::inserted $args}\n"
+            "}"
+        )
+        self.app.group_list = MagicMock(_w=".groups")
+        self.app.group_list.tk.call.side_effect = self.tcl.call
+
+    def test_inserted_items_are_recorded(self):
+        """Each inserted item id should map to its group name."""
+        self.app._update_groups_view()
+        self.assertEqual(self.app._group_names, {"group0": "Medics", "group1": "Pilots"})
+        self.assertEqual(self.app._group_name("group1"), "Pilots")
+        self.app.group_list.item.assert_not_called()
+
+    def test_groups_inserted_in_one_tcl_call(self):
+        """Clearing and filling the list should cross into Tcl once each."""
+        self.app._update_groups_view()
+        self.assertEqual(self.app.group_list.tk.call.call_count, 2)
+        first = self.tcl.splitlist(self.tcl.splitlist(self.tcl.getvar("inserted"))[0])
+        self.assertEqual(first[:7], ("", "end", "-id", "group0", "-text", "Medics", "-values"))
+        self.assertEqual(self.tcl.splitlist(first[7]), ("Medics (2 items)",))
+        self.app.group_list.insert.assert_not_called()
+
+    def test_unknown_item_falls_back_to_tree(self):
+        """Items not recorded should still resolve through the Treeview."""
+        self.app._group_names = {}
+        self.app.group_list.item.return_value = {"text": "Other"}
+        self.assertEqual(self.app._group_name("I009"), "Other")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+"""Tests for the main window layout."""
+
+import sys
+import tkinter
+import unittest
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gui
+
+
+class TestGridFillCell(unittest.TestCase):
+    """Verify the batched grid weights script configures every container."""
+
+    def test_row_and_column_weights_for_each_container(self):
+        """Each path should get row 0 and column 0 weighted in one call."""
+        tcl = tkinter.Tcl()
+        tcl.eval("proc grid {args} {lappend ::calls $args}")
+        tcl.call("apply", gui._GRID_FILL_CELL, ".", ".main")
+        self.assertEqual(
+            [tuple(tcl.splitlist(call)) for call in tcl.splitlist(tcl.getvar("calls"))],
+            [
+                ("rowconfigure", ".", "0", "-weight", "1"),
+                ("columnconfigure", ".", "0", "-weight", "1"),
+                ("rowconfigure", ".main", "0", "-weight", "1"),
+                ("columnconfigure", ".main", "0", "-weight", "1"),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
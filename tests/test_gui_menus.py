@@ -0,0 +1,185 @@
+#!/usr/bin/python3
+"""Tests for the GUI menus."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gui
+from gui import CrewGUI
+
+
+class TestScriptMenuPost(unittest.TestCase):
+    """Verify the submenu is only rebuilt when the scripts folder changes."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.scripts_dir = self.tmpdir.name
+        self.app._script_menu_stamp = None
+        self.app._update_script_menu = MagicMock()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_unchanged_folder_reuses_menu(self):
+        """Opening the menu twice should only build it once."""
+        self.app._on_script_menu_post()
+        self.app._on_script_menu_post()
+        self.app._update_script_menu.assert_called_once_with()
+
+    def test_new_script_rebuilds_menu(self):
+        """A script added to the folder should show up on the next open."""
+        self.app._on_script_menu_post()
+        os.utime(self.tmpdir.name, ns=(0, 0))  # Stand-in for a new file
+        self.app._on_script_menu_post()
+        self.assertEqual(self.app._update_script_menu.call_count, 2)
+
+    def test_missing_folder_always_rebuilds(self):
+        """Without a folder to stamp, every open rebuilds the menu."""
+        self.app.scripts_dir = os.path.join(self.tmpdir.name, "missing")
+        self.app._on_script_menu_post()
+        self.app._on_script_menu_post()
+        self.assertEqual(self.app._update_script_menu.call_count, 2)
+
+
+class TestLazyCascade(unittest.TestCase):
+    """Verify deferred menus are filled once, when first opened."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.menu_bar = MagicMock()
+        self.populate = MagicMock()
+
+    def test_menu_filled_on_first_open_only(self):
+        """The populate callback runs on the first post and is then removed."""
+        with patch.object(gui.tk, "Menu") as menu_class:
+            menu = self.app._add_lazy_cascade("Help", self.populate)
+        self.app.menu_bar.add_cascade.assert_called_once_with(label="Help", menu=menu)
+        self.populate.assert_not_called()
+        build = menu_class.return_value.configure.call_args.kwargs["postcommand"]
+        build()
+        self.populate.assert_called_once_with(menu)
+        menu.configure.assert_called_with(postcommand="")
+
+    def test_menu_items_spec_adds_commands_and_separators(self):
+        """Item specs should become commands in order, with None as a separator."""
+        menu = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        CrewGUI._add_menu_items(menu, (("One", first), None, ("Two", second)))
+        self.assertEqual(
+            menu.mock_calls,
+            [
+                call.add_command(label="One", command=first),
+                call.add_separator(),
+                call.add_command(label="Two", command=second),
+            ],
+        )
+
+
+class TestShortcutBindings(unittest.TestCase):
+    """Verify keyboard shortcuts call their handlers directly."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.clear_filter = MagicMock()
+        self.app._refresh_views = MagicMock()
+
+    def bound(self):
+        return {call[0][0]: call[0][1] for call in self.app.root.bind.call_args_list}
+
+    def test_shortcuts_invoke_handlers(self):
+        """Each bound sequence should forward to its handler."""
+        with patch.object(gui, "TTS_AVAILABLE", False):
+            self.app.bind_events()
+        bound = self.bound()
+        self.assertEqual(set(bound), {"<Escape>", "<Control-f>", "<F5>"})
+        bound["<Escape>"](None)
+        bound["<F5>"](None)
+        self.app.clear_filter.assert_called_once_with()
+        self.app._refresh_views.assert_called_once_with()
+
+    def test_focus_filter_before_and_after_entry_exists(self):
+        """Ctrl+F should be harmless until the filter entry is built."""
+        self.app.bind_events()
+        focus = self.bound()["<Control-f>"]
+        focus(None)
+        self.app.filter_entry_widget = MagicMock()
+        focus(None)
+        self.app.filter_entry_widget.focus_set.assert_called_once_with()
+
+
+class TestDetailsContextMenu(unittest.TestCase):
+    """Verify the details right-click menu is built on first use only."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.details_text = MagicMock()
+
+    def test_menu_built_on_first_right_click(self):
+        """Setup should only bind; the menu is created once when first shown."""
+        with patch.object(gui, "TTS_AVAILABLE", True), patch("gui.tk.Menu") as menu:
+            self.app._setup_details_tts()
+            menu.assert_not_called()
+            event = MagicMock(x_root=5, y_root=6)
+            self.app._show_details_menu(event)
+            self.app._show_details_menu(event)
+        menu.assert_called_once()
+        self.assertEqual(menu.return_value.tk_popup.call_count, 2)
+        self.app.details_text.bind.assert_called_once_with(
+            "<Button-3>", self.app._show_details_menu
+        )
+
+
+class TestGroupContextMenu(unittest.TestCase):
+    """Verify the group right-click menu is the one built with the list."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.group_list = MagicMock()
+        self.app.group_menu = MagicMock()
+        self.event = MagicMock(y=12, x_root=30, y_root=40)
+
+    def test_right_click_on_group_selects_and_pops_up(self):
+        """The clicked group is selected and the shared menu popped up."""
+        self.app.group_list.identify_row.return_value = "I001"
+        self.app._show_group_menu(self.event)
+        self.app.group_list.selection_set.assert_called_once_with("I001")
+        self.app.group_menu.tk_popup.assert_called_once_with(30, 40)
+        self.app.group_menu.grab_release.assert_called_once_with()
+
+    def test_right_click_on_empty_space_shows_nothing(self):
+        """No menu appears when no group is under the pointer."""
+        self.app.group_list.identify_row.return_value = ""
+        self.app._show_group_menu(self.event)
+        self.app.group_menu.tk_popup.assert_not_called()
+
+
+class TestDiagnosticsDialog(unittest.TestCase):
+    """Verify the feature report uses the startup probes."""
+
+    def test_lazy_modules_not_imported(self):
+        """Optional modules loaded lazily should be reported from their flags."""
+        app = CrewGUI.__new__(CrewGUI)
+        blocked = {"pyttsx3": None, "pandas": None, "customtkinter": None}
+        with patch.dict(sys.modules, blocked), \
+                patch("gui.TTS_AVAILABLE", True), patch("gui.PANDAS_AVAILABLE", True), \
+                patch("gui.CTK_AVAILABLE", False), \
+                patch("tkinter.messagebox.showinfo") as showinfo:
+            app.show_diagnostics_dialog()
+        message = showinfo.call_args[0][1]
+        self.assertIn("Text-to-Speech (pyttsx3): Available", message)
+        self.assertIn("pandas: Available", message)
+        self.assertIn("CustomTkinter: Missing", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
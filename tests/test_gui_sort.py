@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+"""Tests for column sorting in the GUI data view."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui import CrewGUI
+
+
+class TestSortByColumn(unittest.TestCase):
+    """Verify sorting works from the in-memory rows on display."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app._current_view_data = [
+            ["Carol", "10"],
+            ["alice", "9"],
+            ["Bob", ""],
+        ]
+        self.app._update_data_view = MagicMock()
+        self.app.update_status = MagicMock()
+        self.app._sort_column = None
+        self.app._sort_reverse = False
+        self.app._columns = ("col0", "col1")
+        self.app._base_header_text = ["Name", "Age"]
+        self.app.data_table = MagicMock()
+
+    def sorted_rows(self):
+        return self.app._update_data_view.call_args[0][0]
+
+    def test_numeric_column_sorts_numerically(self):
+        """Numeric text should sort by value, blanks counting as zero."""
+        self.app._sort_by_column(1, "Age")
+        self.assertEqual([row[0] for row in self.sorted_rows()], ["Bob", "alice", "Carol"])
+
+    def test_text_column_sorts_case_insensitively(self):
+        """Non-numeric columns should fall back to a case-insensitive sort."""
+        self.app._sort_by_column(0, "Name")
+        self.assertEqual([row[0] for row in self.sorted_rows()], ["alice", "Bob", "Carol"])
+
+    def test_second_click_reverses_order(self):
+        """Sorting the same column twice should toggle the direction."""
+        self.app._sort_by_column(0, "Name")
+        self.app._sort_by_column(0, "Name")
+        self.assertEqual([row[0] for row in self.sorted_rows()], ["Carol", "Bob", "alice"])
+        self.app.update_status.assert_called_with("Sorted by Name (descending)")
+
+    def test_sorted_heading_shows_direction(self):
+        """The sorted column heading should carry a direction marker."""
+        self.app._sort_by_column(1, "Age")
+        self.app.data_table.heading.assert_called_once_with("col1", text="Age \u25b2")
+
+
+if __name__ == "__main__":
+    unittest.main()
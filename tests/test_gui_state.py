@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+"""Tests for lazily created GUI state."""
+
+import logging
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui import CrewGUI, ToolTip
+
+
+class TestLazyDatabase(unittest.TestCase):
+    """Verify the database manager is only opened when first used."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app._db = None
+
+    def test_database_opened_once_on_first_access(self):
+        """Both names should share one manager created on demand."""
+        with patch("database_manager.DatabaseManager") as manager:
+            manager.return_value = MagicMock()
+            manager.assert_not_called()
+            self.assertIs(self.app.db, manager.return_value)
+            self.assertIs(self.app.db_manager, self.app.db)
+        manager.assert_called_once_with()
+
+
+class TestStatusCoalescing(unittest.TestCase):
+    """Verify bursts of status updates write the label once."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.status_var = MagicMock()
+        self.app._status_pending = None
+        self.app._status_shown = None
+
+    def test_burst_schedules_one_flush_with_latest_message(self):
+        """Only the last message of a burst should reach the label."""
+        for i in range(5):
+            self.app.update_status(f"Step {i}")
+        self.app.root.after_idle.assert_called_once_with(self.app._flush_status)
+        self.app.status_var.set.assert_not_called()
+        self.app._flush_status()
+        self.app.status_var.set.assert_called_once_with("Step 4")
+
+    def test_update_after_flush_schedules_again(self):
+        """A new message after a flush should queue another flush."""
+        self.app.update_status("First")
+        self.app._flush_status()
+        self.app.update_status("", error=True)
+        self.assertEqual(self.app.root.after_idle.call_count, 2)
+        self.app._flush_status()
+        self.app.status_var.set.assert_called_with("❌ Ready")
+
+    def test_unchanged_message_not_rewritten(self):
+        """Flushing the text already shown should leave the label alone."""
+        for _ in range(2):
+            self.app.update_status("Loading...")
+            self.app._flush_status()
+        self.app.status_var.set.assert_called_once_with("Loading...")
+
+
+class TestStatusTooltip(unittest.TestCase):
+    """Verify the status tooltip is delayed and its window reused."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.root.after.side_effect = ["after#1", "after#2"]
+        self.app.status_var = MagicMock()
+        self.app.status_var.get.return_value = "x" * 60
+        self.app.status_tooltip = None
+        self.app._status_tooltip_label = None
+        self.app._status_tooltip_after = None
+        self.event = MagicMock(x_root=100, y_root=200)
+
+    def test_leaving_before_delay_cancels_show(self):
+        """A quick pass over the status bar should not create a window."""
+        self.app._show_status_tooltip(self.event)
+        self.app._hide_status_tooltip(self.event)
+        self.app.root.after_cancel.assert_called_once_with("after#1")
+        self.assertIsNone(self.app._status_tooltip_after)
+        self.assertIsNone(self.app.status_tooltip)
+
+    def test_window_created_once_and_reused(self):
+        """Repeated hovers should withdraw and reshow one Toplevel."""
+        with patch("gui.tk.Toplevel") as toplevel, patch("gui.tk.Label") as label:
+            for _ in range(2):
+                self.app._display_status_tooltip(110, 210)
+                self.app._hide_status_tooltip(self.event)
+        toplevel.assert_called_once()
+        label.assert_called_once()
+        self.assertEqual(toplevel.return_value.deiconify.call_count, 2)
+        self.assertEqual(toplevel.return_value.withdraw.call_count, 2)
+        label.return_value.configure.assert_called_with(text="x" * 60)
+        toplevel.return_value.destroy.assert_not_called()
+
+    def test_short_message_shows_nothing(self):
+        """Messages that fit the status bar need no tooltip."""
+        self.app.status_var.get.return_value = "Ready"
+        with patch("gui.tk.Toplevel") as toplevel:
+            self.app._display_status_tooltip(110, 210)
+        toplevel.assert_not_called()
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Verify logging setup leaves existing configuration alone."""
+
+    def test_existing_handlers_skip_log_file(self):
+        """A configured root logger should not cause the log file to be opened."""
+        app = CrewGUI.__new__(CrewGUI)
+        with patch.object(logging.getLogger(), "handlers", [logging.NullHandler()]), \
+                patch("gui.logging.FileHandler") as file_handler:
+            app.setup_logging()
+        file_handler.assert_not_called()
+
+
+class TestWidgetToolTip(unittest.TestCase):
+    """Verify widget tooltips reuse one window across hovers."""
+
+    def test_window_created_once(self):
+        """Hovering repeatedly should hide and reshow the same Toplevel."""
+        widget = MagicMock()
+        widget.bbox.return_value = (0, 0, 0, 0)
+        widget.winfo_rootx.return_value = widget.winfo_rooty.return_value = 0
+        tip = ToolTip(widget, "Filter rows")
+        with patch("gui.tk.Toplevel") as toplevel, patch("gui.tk.Label") as label:
+            for _ in range(3):
+                tip.show_tip()
+                tip.show_tip()  # Repeated Enter while shown is ignored
+                tip.hide_tip()
+        toplevel.assert_called_once_with(widget)
+        self.assertEqual(toplevel.return_value.deiconify.call_count, 3)
+        self.assertEqual(toplevel.return_value.withdraw.call_count, 3)
+        toplevel.return_value.destroy.assert_not_called()
+        label.return_value.configure.assert_called_with(text="Filter rows")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+#!/usr/bin/python3
+"""Tests for the GUI background worker."""
+
+import itertools
+import sys
+import threading
+import unittest
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui import CrewGUI
+
+
+class TestBackgroundWorker(unittest.TestCase):
+    """Verify tasks run off the main thread and report back via after()."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app._tasks = deque()
+        self.app._task_event = threading.Event()
+        self.app._task_seq = itertools.count()
+        self.app._latest_task = {}
+        self.app._worker_stop = False
+        self.app._db = None
+        self.worker = threading.Thread(target=self.app._background_worker, daemon=True)
+        self.worker.start()
+        self.app.worker_thread = self.worker
+        self.app._pool = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.app._pool.shutdown)
+
+    def test_task_result_delivered_to_callback(self):
+        """The callback should be scheduled on the Tk loop with the result."""
+        done = threading.Event()
+        self.app.root.after.side_effect = lambda *args: done.set()
+        callback = MagicMock()
+
+        self.app.run_in_background(lambda x, y: x + y, 2, 3, callback=callback)
+
+        self.assertTrue(done.wait(5))
+        self.app.root.after.assert_called_once_with(0, callback, 5)
+
+    def test_failing_task_does_not_stop_worker(self):
+        """An exception in one task should not prevent later tasks running."""
+        done = threading.Event()
+        self.app.root.after.side_effect = lambda *args: done.set()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        self.app.run_in_background(fail, callback=MagicMock())
+        self.app.run_in_background(lambda: "ok", callback=MagicMock())
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.app.root.after.call_args[0][2], "ok")
+
+    def test_parallel_task_result_delivered_to_callback(self):
+        """Pool tasks should report back through after() like queued ones."""
+        done = threading.Event()
+        self.app.root.after.side_effect = lambda *args: done.set()
+        callback = MagicMock()
+
+        self.app.run_in_background(str.upper, "crew", callback=callback, parallel=True)
+
+        self.assertTrue(done.wait(5))
+        self.app.root.after.assert_called_once_with(0, callback, "CREW")
+
+    def test_parallel_task_does_not_wait_for_worker(self):
+        """A blocked worker task should not hold up a pool task."""
+        release = threading.Event()
+        done = threading.Event()
+        self.app.root.after.side_effect = lambda *args: done.set()
+        self.app.run_in_background(release.wait, 5)
+        self.app.run_in_background(len, "abc", callback=MagicMock(), parallel=True)
+        self.assertTrue(done.wait(5))
+        release.set()
+
+    def test_superseded_parallel_result_is_dropped(self):
+        """Only the newest keyed pool task should deliver its result."""
+        release = threading.Event()
+        done = threading.Event()
+        callback = MagicMock()
+        self.app.root.after.side_effect = lambda *args: done.set()
+
+        self.app.run_in_background(
+            lambda: release.wait(5) and "old", callback=callback, key="load", parallel=True
+        )
+        self.app.run_in_background(lambda: "new", callback=callback, key="load", parallel=True)
+        self.assertTrue(done.wait(5))
+        release.set()
+        self.app._pool.shutdown(wait=True)
+
+        self.app.root.after.assert_called_once_with(0, callback, "new")
+
+    def test_stop_ends_worker_and_rejects_new_tasks(self):
+        """Stopping should end the thread and drop later submissions."""
+        self.app.stop_background_worker(timeout=5)
+        self.assertFalse(self.worker.is_alive())
+        self.app.run_in_background(lambda: "late", callback=MagicMock())
+        self.assertEqual(len(self.app._tasks), 0)
+
+    def test_close_stops_worker_before_saving_state(self):
+        """Closing the window should stop the worker, save state, then destroy."""
+        alive_at_save = []
+        self.app.save_window_state = MagicMock(
+            side_effect=lambda: alive_at_save.append(self.worker.is_alive())
+        )
+        self.app._on_close()
+        self.assertEqual(alive_at_save, [False])
+        self.assertIsNone(self.app._db)
+
+    def test_close_closes_database_only_if_opened(self):
+        """An opened database should be closed; an unopened one stays unopened."""
+        self.app.save_window_state = MagicMock()
+        self.app._db = MagicMock()
+        self.app._on_close()
+        self.app._db.close.assert_called_once_with()
+        self.app.root.destroy.assert_called_once_with()
+
+
+class TestTaskOrdering(unittest.TestCase):
+    """Verify keyed tasks coalesce on the worker queue."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app._tasks = deque()
+        self.app._task_event = threading.Event()
+        self.app._task_seq = itertools.count()
+        self.app._latest_task = {}
+        self.app._worker_stop = False
+        self.ran = []
+
+    def run_queued(self):
+        """Start the worker on the queued tasks and wait for a final marker."""
+        done = threading.Event()
+        self.app.run_in_background(done.set)
+        threading.Thread(target=self.app._background_worker, daemon=True).start()
+        self.assertTrue(done.wait(5))
+
+    def test_newer_keyed_task_supersedes_queued_one(self):
+        """Only the latest task posted under a key should run."""
+        self.app.run_in_background(self.ran.append, "old", key="filter")
+        self.app.run_in_background(self.ran.append, "other")
+        self.app.run_in_background(self.ran.append, "new", key="filter")
+        self.run_queued()
+        self.assertEqual(self.ran, ["other", "new"])
+
+
+class TestSpeechQueue(unittest.TestCase):
+    """Verify speech plays on its own thread through the shared engine."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.root = MagicMock()
+        self.app.tts_engine = MagicMock()
+        self.app.tts_available = True
+        self.app._tts_props = {"voice": "english", "rate": 150, "volume": 0.8}
+        self.app._tts_pending = deque()
+        self.app._tts_event = threading.Event()
+        self.app._tts_thread = None
+
+    def test_utterance_spoken_off_the_calling_thread(self):
+        """_speak should return at once; the speech thread runs the engine."""
+        done = threading.Event()
+        threads = []
+
+        def run_and_wait():
+            threads.append(threading.current_thread())
+            done.set()
+
+        self.app.tts_engine.runAndWait.side_effect = run_and_wait
+        self.app._speak("first chunk", "second chunk")
+        self.assertTrue(done.wait(5))
+        self.assertEqual(
+            self.app.tts_engine.say.call_args_list,
+            [(("first chunk",),), (("second chunk",),)],
+        )
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_speech_thread_started_once(self):
+        """Later utterances should reuse the running speech thread."""
+        done = threading.Event()
+        self.app.tts_engine.runAndWait.side_effect = lambda: done.set()
+        self.app._speak("one")
+        thread = self.app._tts_thread
+        self.assertTrue(done.wait(5))
+        done.clear()
+        self.app._speak("two")
+        self.assertTrue(done.wait(5))
+        self.assertIs(self.app._tts_thread, thread)
+
+    def test_stop_drops_queued_utterances(self):
+        """Stopping should discard utterances that have not started."""
+        settings_change = (MagicMock(), None, False)
+        self.app._tts_pending.extend(
+            [(MagicMock(), None, True), settings_change, (MagicMock(), None, True)]
+        )
+        self.app._stop_reading()
+        self.assertEqual(list(self.app._tts_pending), [settings_change])
+        self.app.tts_engine.stop.assert_called_once_with()
+
+    def test_preview_waits_for_queued_speech(self):
+        """A settings preview behind queued speech should play on the speech thread."""
+        release = threading.Event()
+        finished = threading.Event()
+        threads = []
+        spoken = []
+
+        def run_and_wait():
+            threads.append(threading.current_thread())
+            release.wait(5)
+
+        engine = self.app.tts_engine
+        engine.runAndWait.side_effect = run_and_wait
+        engine.say.side_effect = spoken.append
+        self.app.root.after.side_effect = lambda ms, func, *args: func(*args)
+        self.app._speak("reading")
+        self.app._speak("queued")
+        self.assertTrue(self.app._tts_pending)
+        self.app._preview_tts_settings(200, 0.5, lambda error: finished.set())
+        self.assertNotIn(threading.current_thread(), threads)
+        release.set()
+        self.assertTrue(finished.wait(5))
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(spoken[:2], ["reading", "queued"])
+        self.assertEqual(
+            engine.setProperty.call_args_list[-2:], [call("rate", 150), call("volume", 0.8)]
+        )
+
+
+class TestLazySpeechEngine(unittest.TestCase):
+    """Verify the speech engine is only started when speech is first needed."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.tts_engine = None
+        self.app.tts_available = True
+        self.app._tts_props = {}
+
+    def test_engine_created_once_on_first_use(self):
+        """Repeated lookups should share the engine made on the first one."""
+        with patch("gui.pyttsx3") as pyttsx3:
+            engine = self.app._get_tts_engine()
+            self.assertIs(self.app._get_tts_engine(), engine)
+        pyttsx3.init.assert_called_once_with()
+        engine.setProperty.assert_any_call("rate", 150)
+        self.assertIsNotNone(self.app._tts_voices)
+
+    def test_settings_mirror_reads_engine_values(self):
+        """The mirror should hold what the driver applied, plus queued changes."""
+        self.app._tts_props = {"rate": 200}
+        applied = {"voice": "HKEY_voice_zira", "rate": 150, "volume": 0.8, "voices": []}
+        with patch("gui.pyttsx3") as pyttsx3:
+            pyttsx3.init.return_value.getProperty.side_effect = applied.get
+            self.app._get_tts_engine()
+        self.assertEqual(
+            self.app._tts_props, {"voice": "HKEY_voice_zira", "rate": 200, "volume": 0.8}
+        )
+
+    def test_failed_start_disables_speech(self):
+        """A driver that cannot start should turn TTS off rather than retry."""
+        with patch("gui.pyttsx3") as pyttsx3:
+            pyttsx3.init.side_effect = RuntimeError("no driver")
+            self.assertIsNone(self.app._get_tts_engine())
+            self.assertIsNone(self.app._get_tts_engine())
+        self.assertFalse(self.app.tts_available)
+        pyttsx3.init.assert_called_once_with()
+
+    def test_stop_before_first_use_does_not_start_engine(self):
+        """Stopping with nothing spoken yet should not load the driver."""
+        self.app._tts_pending = deque()
+        with patch("gui.pyttsx3") as pyttsx3:
+            self.app._stop_reading()
+        pyttsx3.init.assert_not_called()
+
+class TestBackgroundSave(unittest.TestCase):
+    """Verify saving writes on the pool and reports back on the Tk loop."""
+
+    def setUp(self):
+        self.app = CrewGUI.__new__(CrewGUI)
+        self.app.headers = ["Name", "Role"]
+        self.app._current_view_data = [("Alice", "Pilot")]
+        self.app.run_in_background = MagicMock()
+        self.app.update_status = MagicMock()
+
+    def test_save_dialog_hands_write_to_pool(self):
+        """The chosen file should be written in the background, not inline."""
+        with patch("gui.filedialog.asksaveasfilename", return_value="/tmp/out.csv"):
+            self.app._on_save_file()
+        args, kwargs = self.app.run_in_background.call_args
+        self.assertEqual(args[1:], ([["Alice", "Pilot"]], ["Name", "Role"], "/tmp/out.csv"))
+        self.assertEqual(kwargs["callback"], self.app._on_data_saved)
+        self.assertTrue(kwargs["parallel"])
+
+    def test_background_write_returns_error_for_tk_loop(self):
+        """A failed write should be returned, not raised on the pool thread."""
+        path, error = self.app._save_data_background([["a"]], ["h"], "/nonexistent_dir/x.csv")
+        self.assertIsInstance(error, OSError)
+        with patch("gui.messagebox.showerror") as showerror:
+            self.app._on_data_saved((path, error))
+        showerror.assert_called_once()
+
+
+class TestDefaultDataLoad(unittest.TestCase):
+    """Verify the startup data file is parsed off the Tk thread."""
+
+    def test_default_file_loaded_on_pool(self):
+        """load_default_data should hand the parse to the pool, not run it inline."""
+        app = CrewGUI.__new__(CrewGUI)
+        app.run_in_background = MagicMock()
+        app.update_status = MagicMock()
+        app._load_data_background = MagicMock()
+        app.load_default_data()
+        app._load_data_background.assert_not_called()
+        args, kwargs = app.run_in_background.call_args
+        self.assertEqual(args[0], app._load_data_background)
+        self.assertTrue(args[1].endswith("npcs.csv"))
+        self.assertEqual(kwargs["callback"], app._on_data_loaded)
+        self.assertTrue(kwargs["parallel"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,6 +34,24 @@ class TestStateManager(unittest.TestCase):
         except Exception as e:
             self.fail(f"save_window_state() raised {e}")
 
+    def test_min_window_size_applied(self):
+        calls = []
+        self.gui.root.minsize = lambda *a: calls.append(a)
+        self.manager.config = type('DummyConfig', (), {
+            'get': lambda self, key, default=None: {"min_window_size": "640x480"}.get(key, default)
+        })()
+        self.manager.load_window_state()
+        self.assertEqual(calls, [(640, 480)])
+
+    def test_malformed_min_window_size_ignored(self):
+        calls = []
+        self.gui.root.minsize = lambda *a: calls.append(a)
+        self.manager.config = type('DummyConfig', (), {
+            'get': lambda self, key, default=None: {"min_window_size": "640"}.get(key, default)
+        })()
+        self.manager.load_window_state()
+        self.assertEqual(calls, [])
+
     # Add more tests for column width and state summary as needed
 
 if __name__ == "__main__":
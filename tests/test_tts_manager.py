@@ -21,6 +21,11 @@ class TestTTSManager(unittest.TestCase):
         except Exception as e:
             self.fail(f"speak_text() raised {e}")
 
+    def test_preprocess_expands_abbreviations(self):
+        # Whole words only, any case; longer forms win over their prefixes
+        text = self.manager.preprocess_text_for_speech("  Open the csv  via HTTPS,\nnot sqlite ")
+        self.assertEqual(text, "Open the C S V via H T T P S, not sqlite")
+
     # Add more tests for pause, resume, stop, and settings as needed
 
 if __name__ == "__main__":
@@ -39,12 +39,12 @@ class TestWindowGeometryStartup(unittest.TestCase):
         app.root.winfo_screenheight.return_value = 1080
         app.column_visibility = {}
         app.config = MagicMock()
-        app.config.get.side_effect = lambda key, default=None: {
+        app.config.snapshot.return_value = {
             "window_size": "1020x1080",
             "min_window_size": "800x600",
             "column_widths": {},
             "column_visibility": {},
-        }.get(key, default)
+        }
 
         app.load_window_state()
 
@@ -3,14 +3,36 @@ import threading
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
 from typing import Optional, List, Callable
+import importlib.util
 import re
 import os
 
-try:
-    import pyttsx3
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+# Only checked for here, so importing this module stays cheap; pyttsx3 is
+# imported when the first engine is made
+TTS_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
+
+# Abbreviations spelled out for text-to-speech, matched as whole words
+_SPEECH_REPLACEMENTS = {
+    'CSV': 'C S V', 'JSON': 'Jason', 'XML': 'X M L', 'HTML': 'H T M L',
+    'URL': 'U R L', 'API': 'A P I', 'GUI': 'G U I', 'CLI': 'C L I',
+    'DB': 'database', 'SQL': 'S Q L', 'ID': 'I D', 'UUID': 'U U I D',
+    'HTTP': 'H T T P', 'HTTPS': 'H T T P S', 'FTP': 'F T P', 'SSH': 'S S H',
+    'TCP': 'T C P', 'UDP': 'U D P', 'IP': 'I P', 'DNS': 'D N S',
+    'CPU': 'C P U', 'GPU': 'G P U', 'RAM': 'ram', 'ROM': 'rom',
+    'USB': 'U S B', 'PDF': 'P D F', 'JPG': 'J P G', 'PNG': 'P N G',
+    'GIF': 'gif', 'MP3': 'M P 3', 'MP4': 'M P 4', 'WAV': 'wave',
+    'ZIP': 'zip', 'RAR': 'rar', 'TAR': 'tar', 'GZ': 'G Z',
+    'EXE': 'executable', 'DLL': 'D L L', 'SO': 'S O', 'LIB': 'library',
+}
+# One alternation (longest first) replaces them all in a single pass
+_SPEECH_ABBREV_RE = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(_SPEECH_REPLACEMENTS, key=len, reverse=True)))
+    + r")\b",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class TTSManager:
     """Manages all Text-to-Speech functionality for the application."""
@@ -27,6 +49,7 @@ class TTSManager:
     def _initialize_engine(self) -> bool:
         """Initialize the TTS engine with default settings."""
         try:
+            import pyttsx3
             self.engine = pyttsx3.init()
             self.engine.setProperty("rate", 150)
             self.engine.setProperty("volume", 0.8)
@@ -119,26 +142,12 @@ class TTSManager:
     def preprocess_text_for_speech(self, text: str) -> str:
         """Clean and prepare text for better TTS pronunciation."""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
+        text = _WHITESPACE_RE.sub(" ", text.strip())
+
         # Handle common abbreviations and technical terms
-        replacements = {
-            'CSV': 'C S V', 'JSON': 'Jason', 'XML': 'X M L', 'HTML': 'H T M L',
-            'URL': 'U R L', 'API': 'A P I', 'GUI': 'G U I', 'CLI': 'C L I',
-            'DB': 'database', 'SQL': 'S Q L', 'ID': 'I D', 'UUID': 'U U I D',
-            'HTTP': 'H T T P', 'HTTPS': 'H T T P S', 'FTP': 'F T P', 'SSH': 'S S H',
-            'TCP': 'T C P', 'UDP': 'U D P', 'IP': 'I P', 'DNS': 'D N S',
-            'CPU': 'C P U', 'GPU': 'G P U', 'RAM': 'ram', 'ROM': 'rom',
-            'USB': 'U S B', 'PDF': 'P D F', 'JPG': 'J P G', 'PNG': 'P N G',
-            'GIF': 'gif', 'MP3': 'M P 3', 'MP4': 'M P 4', 'WAV': 'wave',
-            'ZIP': 'zip', 'RAR': 'rar', 'TAR': 'tar', 'GZ': 'G Z',
-            'EXE': 'executable', 'DLL': 'D L L', 'SO': 'S O', 'LIB': 'library',
-        }
-        
-        for abbrev, replacement in replacements.items():
-            text = re.sub(r'\b' + re.escape(abbrev) + r'\b', replacement, text, flags=re.IGNORECASE)
-        
-        return text
+        return _SPEECH_ABBREV_RE.sub(
+            lambda m: _SPEECH_REPLACEMENTS[m.group().upper()], text
+        )
     
     def chunk_text(self, text: str, max_length: int = 400) -> List[str]:
         """Split text into smaller chunks for smoother playback."""